@@ -0,0 +1,202 @@
+# benchmark.py
+# Benchmark throughput & scaling penjadwal:
+# - heft_schedule      : task terjadwal per detik
+# - ga_scheduler.fitness / fitness_batch : evaluasi fitness per detik
+# - main.run_dag       : waktu end-to-end per DAG (HEFT + GA + evaluate)
+# Sweep n, kepadatan edge (out-degree maksimum), jumlah prosesor, dan CCR.
+# Hasil ditulis ke JSON; dengan --baseline hasil dibandingkan dengan run lama
+# dan regresi ditandai (exit code 1).
+import argparse
+import itertools
+import json
+import platform
+import random
+import sys
+import time
+
+import numpy as np
+
+from compiled_dag import compile_dag
+from dag_generator import generate_layered_dag
+from ga_scheduler import fitness, fitness_batch
+from heft import heft_schedule
+from main import GA_PARAMS, run_dag
+from manifest import code_version
+
+SWEEP = {
+    "n": [10, 100, 1000, 10000],
+    "density": [2, 4],
+    "processors": [4, 16, 64],
+    "ccr": [0.1, 1, 10],
+}
+
+QUICK_SWEEP = {
+    "n": [10, 100, 1000],
+    "density": [2],
+    "processors": [4, 64],
+    "ccr": [1],
+}
+
+# arah metrik: True = makin besar makin baik
+METRICS = {
+    "heft_tasks_per_sec": True,
+    "fitness_evals_per_sec": True,
+    "fitness_batch_evals_per_sec": True,
+    "end_to_end_sec": False,
+}
+
+SHAPE_ALPHA = 1.0
+BETA = 0.5
+
+
+def _measure(fn, min_time=0.2, rounds=3):
+    """
+    Laju panggilan fn per detik: fn dipanggil berulang sampai satu ronde
+    >= min_time / rounds, diambil ronde tercepat (mengurangi noise).
+    """
+    best = 0.0
+    for _ in range(rounds):
+        calls = 0
+        start = time.perf_counter()
+        elapsed = 0.0
+        while elapsed < min_time / rounds:
+            fn()
+            calls += 1
+            elapsed = time.perf_counter() - start
+        best = max(best, calls / elapsed)
+    return best
+
+
+def case_key(case):
+    return f"n{case['n']}_d{case['density']}_p{case['processors']}_ccr{case['ccr']:g}"
+
+
+def bench_case(case, min_time=0.2, e2e_max_n=1000, ga_params=None, seed=0):
+    """Ukur semua metrik untuk satu kombinasi (n, density, processors, ccr)."""
+    n, processors = case["n"], case["processors"]
+    rng = random.Random(seed)
+    tasks, edges, cost_matrix = generate_layered_dag(
+        n, case["ccr"], SHAPE_ALPHA, [1, case["density"]], BETA, processors, rng
+    )
+    dag = compile_dag(tasks, edges, cost_matrix)
+    result = dict(case, edges=len(edges))
+
+    # HEFT: task per detik (graf sudah dikompilasi, rank di-cache setelah panggilan pertama)
+    rate = _measure(lambda: heft_schedule(tasks, edges, processors, dag), min_time)
+    result["heft_tasks_per_sec"] = rate * n
+
+    # fitness satu individu & batch populasi
+    pop_size = (ga_params or GA_PARAMS)["pop_size"]
+    population = np.random.default_rng(seed).integers(0, processors, size=(pop_size, n))
+    individuals = population.tolist()
+    counter = itertools.count()
+
+    result["fitness_evals_per_sec"] = _measure(
+        lambda: fitness(individuals[next(counter) % pop_size], tasks, edges, processors, dag), min_time
+    )
+
+    rate = _measure(lambda: fitness_batch(population, tasks, edges, processors, dag), min_time)
+    result["fitness_batch_evals_per_sec"] = rate * pop_size
+
+    # end-to-end: compile + HEFT + GA + evaluate seperti satu DAG di main.main
+    if n <= e2e_max_n:
+        options = {"ga": dict(GA_PARAMS, **(ga_params or {}))}
+        start = time.perf_counter()
+        run_dag(tasks, edges, processors, seed=seed, options=options, cost_matrix=cost_matrix)
+        result["end_to_end_sec"] = time.perf_counter() - start
+
+    return result
+
+
+def run_benchmark(sweep=SWEEP, min_time=0.2, e2e_max_n=1000, ga_params=None, seed=0, verbose=True):
+    cases = [
+        dict(zip(sweep.keys(), values))
+        for values in itertools.product(*sweep.values())
+    ]
+    results = []
+    for k, case in enumerate(cases, 1):
+        res = bench_case(case, min_time, e2e_max_n, ga_params, seed)
+        results.append(res)
+        if verbose:
+            metrics = " ".join(f"{m}={res[m]:.4g}" for m in METRICS if m in res)
+            print(f"[{k}/{len(cases)}] {case_key(case)} {metrics}", flush=True)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "code_version": code_version(),
+            "min_time": min_time,
+            "ga_params": dict(GA_PARAMS, **(ga_params or {})),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, tolerance=0.10):
+    """
+    Bandingkan dua hasil benchmark per case & metrik.
+    return: list baris (key, metrik, baseline, sekarang, rasio, regresi?)
+    rasio > 1 = lebih baik; regresi kalau rasio < 1 - tolerance.
+    """
+    base = {case_key(r): r for r in baseline["results"]}
+    rows = []
+    for res in current["results"]:
+        old = base.get(case_key(res))
+        if old is None:
+            continue
+        for metric, higher_better in METRICS.items():
+            if metric not in res or metric not in old or not old[metric] or not res[metric]:
+                continue
+            ratio = res[metric] / old[metric] if higher_better else old[metric] / res[metric]
+            rows.append((case_key(res), metric, old[metric], res[metric], ratio, ratio < 1.0 - tolerance))
+    return rows
+
+
+def print_comparison(rows):
+    print(f"{'case':<28} {'metric':<28} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for key, metric, old, new, ratio, regressed in rows:
+        flag = "  REGRESI" if regressed else ""
+        print(f"{key:<28} {metric:<28} {old:>12.4g} {new:>12.4g} {ratio:>7.2f}{flag}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark throughput & scaling HEFT / GA.")
+    parser.add_argument("--out", default="benchmark.json", help="file JSON hasil benchmark")
+    parser.add_argument("--baseline", default=None, help="JSON benchmark lama untuk dibandingkan")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="batas penurunan sebelum dianggap regresi")
+    parser.add_argument("--quick", action="store_true", help="sweep kecil (cek cepat sebelum commit)")
+    parser.add_argument("--n", type=int, nargs="+", default=None, help="daftar jumlah task")
+    parser.add_argument("--density", type=int, nargs="+", default=None, help="daftar out-degree maksimum")
+    parser.add_argument("--processors", type=int, nargs="+", default=None, help="daftar jumlah prosesor")
+    parser.add_argument("--ccr", type=float, nargs="+", default=None, help="daftar CCR")
+    parser.add_argument("--min-time", type=float, default=0.2, help="durasi minimum tiap pengukuran (detik)")
+    parser.add_argument("--e2e-max-n", type=int, default=1000, help="end-to-end hanya untuk n <= nilai ini")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    sweep = dict(QUICK_SWEEP if args.quick else SWEEP)
+    for key in sweep:
+        if getattr(args, key) is not None:
+            sweep[key] = getattr(args, key)
+
+    report = run_benchmark(sweep, args.min_time, args.e2e_max_n, seed=args.seed)
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Hasil benchmark disimpan ke {args.out}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        rows = compare(report, baseline, args.tolerance)
+        print_comparison(rows)
+        regressions = sum(1 for row in rows if row[-1])
+        if regressions:
+            print(f"{regressions} metrik turun lebih dari {args.tolerance:.0%} dibanding baseline.")
+            sys.exit(1)
+        print("Tidak ada regresi.")
@@ -0,0 +1,315 @@
+# compiled_dag.py
+from collections import deque
+from functools import cached_property
+from typing import List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+import instrument
+
+
+class Ranks(NamedTuple):
+    """Hasil compute_ranks: rank_u & rank_d per task (array) + panjang critical path."""
+    rank_u: np.ndarray
+    rank_d: np.ndarray
+    cp_length: float
+
+
+class CompiledDAG:
+    """
+    Struktur DAG yang "dikompilasi" SEKALI per DAG lalu dipakai bersama
+    oleh heft, ga_scheduler, dan evaluate (tidak dibangun ulang per panggilan).
+
+    Isi (semua read-only):
+    - cost                         : array biaya komputasi tiap task (rata-rata
+                                     antar prosesor kalau cost_matrix ada)
+    - cost_matrix                  : (opsional) matriks biaya heterogen (n, p),
+                                     cost_matrix[t, p] = waktu task t di prosesor p
+    - pred_ptr, pred_idx, pred_comm : CSR predecessor + biaya komunikasi per edge
+    - succ_ptr, succ_idx, succ_comm : CSR successor + biaya komunikasi per edge
+    - topo                         : urutan topologis (cache)
+    - topo_pos                     : posisi tiap task di dalam topo
+    - last_succ_pos                : posisi topo successor terakhir tiap task (-1 = exit)
+    - levels                       : level tiap task (jalur terpanjang dari entry)
+    - ranks                        : rank_u/rank_d/critical path (cache, lihat compute_ranks)
+    - rank_u                       : upward rank dalam bentuk tuple (HEFT & prioritas GA)
+    - makespan_lower_bound(p)      : batas bawah makespan untuk p prosesor
+    - is_topological_order(order)  : cek urutan eksekusi valid
+    - with_topo(order)             : salinan dengan urutan topologis lain
+
+    Untuk loop Python yang panas disediakan juga versi tuple:
+    - cost_list : tuple biaya per task
+    - cost_rows : cost_rows[t][p] (None kalau homogen)
+    - preds     : preds[t] = ((pred, comm), ...)
+    - succs     : succs[t] = ((succ, comm), ...)
+    """
+
+    def __init__(self, cost, src, dst, comm, cost_matrix=None):
+        n = len(cost)
+        self.n = n
+        self.n_edges = len(src)
+
+        if cost_matrix is not None:
+            cost_matrix = np.array(cost_matrix, dtype=np.float64)
+            if cost_matrix.ndim != 2 or cost_matrix.shape[0] != n:
+                raise ValueError("cost_matrix harus berbentuk (n_tasks, processors).")
+            cost_matrix.setflags(write=False)
+            # HEFT: rank dihitung dari biaya rata-rata antar prosesor
+            cost = cost_matrix.mean(axis=1) if n else np.zeros(0)
+        self.cost_matrix = cost_matrix
+        self.processors = cost_matrix.shape[1] if cost_matrix is not None else None
+
+        cost = np.asarray(cost, dtype=np.float64)
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        comm = np.asarray(comm, dtype=np.float64)
+
+        # urutan stabil: di dalam satu task, urutan edge sama dengan input
+        succ_perm = np.argsort(src, kind="stable")
+        pred_perm = np.argsort(dst, kind="stable")
+
+        self.cost = cost
+        self.succ_ptr = _csr_ptr(src, n)
+        self.succ_idx = dst[succ_perm]
+        self.succ_comm = comm[succ_perm]
+        self.pred_ptr = _csr_ptr(dst, n)
+        self.pred_idx = src[pred_perm]
+        self.pred_comm = comm[pred_perm]
+
+        for arr in (self.cost, self.succ_ptr, self.succ_idx, self.succ_comm,
+                    self.pred_ptr, self.pred_idx, self.pred_comm):
+            arr.setflags(write=False)
+
+        self.cost_list = tuple(cost.tolist())
+        self.cost_rows = tuple(map(tuple, cost_matrix.tolist())) if cost_matrix is not None else None
+        self.preds = _csr_pairs(self.pred_ptr, self.pred_idx, self.pred_comm)
+        self.succs = _csr_pairs(self.succ_ptr, self.succ_idx, self.succ_comm)
+
+        self.topo = _topological_order(n, self.succs)
+        self._frozen = True
+
+    def __setattr__(self, name, value):
+        if getattr(self, "_frozen", False):
+            raise AttributeError("CompiledDAG bersifat immutable.")
+        super().__setattr__(name, value)
+
+    def check_processors(self, processors: int) -> None:
+        """Pastikan jumlah prosesor cocok dengan kolom cost_matrix (kalau ada)."""
+        if self.processors is not None and processors != self.processors:
+            raise ValueError(
+                f"cost_matrix punya {self.processors} kolom prosesor, tapi processors={processors}."
+            )
+
+    def assigned_costs(self, assignment) -> Tuple[float, ...]:
+        """Biaya tiap task pada prosesor yang ditugaskan (assignment: list task -> prosesor)."""
+        if self.cost_matrix is None:
+            return self.cost_list
+        return tuple(self.cost_matrix[np.arange(self.n), assignment].tolist())
+
+    def makespan_lower_bound(self, processors: int) -> float:
+        """
+        Batas bawah makespan jadwal apa pun di `processors` prosesor:
+        max(critical path tanpa komunikasi, total kerja / processors),
+        dengan biaya tiap task = biaya termurahnya antar prosesor.
+        """
+        if self.n == 0:
+            return 0.0
+        cost = self.cost if self.cost_matrix is None else self.cost_matrix.min(axis=1)
+        cp_length = compute_ranks(self, with_comm=False, cost=cost).cp_length
+        return max(cp_length, float(cost.sum()) / processors)
+
+    def is_topological_order(self, order) -> bool:
+        """True kalau `order` permutasi semua task dan setiap edge src muncul sebelum dst."""
+        order = np.asarray(order, dtype=np.int64)
+        if order.shape != (self.n,) or not np.array_equal(np.sort(order), np.arange(self.n)):
+            return False
+        pos = np.empty(self.n, dtype=np.int64)
+        pos[order] = np.arange(self.n)
+        dst = np.repeat(np.arange(self.n), np.diff(self.pred_ptr))
+        return bool(np.all(pos[self.pred_idx] < pos[dst]))
+
+    def with_topo(self, order) -> "CompiledDAG":
+        """
+        Salinan DAG ini dengan `order` (harus topologis) sebagai topo, mis. urutan
+        jadwal HEFT insertion (heft.schedule_order). Semua evaluator yang berjalan
+        di atas dag.topo (compute_task_times, versi batch, versi delta) lalu
+        mendekode kromosom dengan urutan itu. Array dan rank dipakai bersama.
+        """
+        if not self.is_topological_order(order):
+            raise ValueError("order bukan urutan topologis yang valid.")
+        clone = object.__new__(CompiledDAG)
+        state = {k: v for k, v in self.__dict__.items() if k not in ("topo_pos", "last_succ_pos")}
+        state["topo"] = tuple(int(t) for t in order)
+        clone.__dict__.update(state)
+        return clone
+
+    @cached_property
+    def topo_pos(self) -> Tuple[int, ...]:
+        pos = [0] * self.n
+        for k, t in enumerate(self.topo):
+            pos[t] = k
+        return tuple(pos)
+
+    @cached_property
+    def last_succ_pos(self) -> Tuple[int, ...]:
+        """Posisi topo successor paling akhir; setelah posisi ini, task t tidak dibaca lagi."""
+        topo_pos = self.topo_pos
+        return tuple(max((topo_pos[ch] for ch, _ in succ), default=-1) for succ in self.succs)
+
+    @cached_property
+    def levels(self) -> np.ndarray:
+        """
+        Level tiap task = panjang jalur terpanjang (dalam edge) dari task entry.
+        Satu kali jalan maju di atas topo (O(n + e), juga untuk chain panjang).
+        """
+        level = [0] * self.n
+        ptr = self.succ_ptr.tolist()
+        idx = self.succ_idx.tolist()
+        for t in self.topo:
+            nxt = level[t] + 1
+            for k in range(ptr[t], ptr[t + 1]):
+                j = idx[k]
+                if nxt > level[j]:
+                    level[j] = nxt
+
+        level = np.asarray(level, dtype=np.int64)
+        level.setflags(write=False)
+        return level
+
+    @cached_property
+    def ranks(self) -> Ranks:
+        """rank_u, rank_d, dan critical path DENGAN biaya komunikasi (HEFT)."""
+        return compute_ranks(self, with_comm=True)
+
+    @cached_property
+    def rank_u(self) -> Tuple[float, ...]:
+        """
+        Upward rank ala HEFT (dengan komunikasi):
+        rank_u(i) = w_i + max_{j ∈ succ(i)} ( c_ij + rank_u(j) )
+        """
+        return tuple(self.ranks.rank_u.tolist())
+
+
+@instrument.timed("ranks")
+def compute_ranks(dag: CompiledDAG, with_comm: bool = True, cost: Optional[np.ndarray] = None) -> Ranks:
+    """
+    Upward rank, downward rank, dan panjang critical path sekaligus, tanpa
+    rekursi (aman untuk chain ribuan task):
+
+    rank_u(i) = w_i + max_{j ∈ succ(i)} ( c_ij + rank_u(j) )
+    rank_d(i) = max_{j ∈ pred(i)} ( rank_d(j) + w_j + c_ji ),  rank_d(entry) = 0
+    CP        = max_i ( rank_u(i) + rank_d(i) )
+
+    Satu kali jalan mundur (rank_u) dan satu kali jalan maju (rank_d + CP)
+    di atas dag.topo memakai array CSR, jadi O(n + e) berapa pun kedalamannya.
+    cost: biaya per task (default dag.cost)
+    """
+    n = dag.n
+    if n == 0:
+        empty = np.zeros(0)
+        return Ranks(empty, empty, 0.0)
+
+    cost = (dag.cost if cost is None else np.asarray(cost, dtype=np.float64)).tolist()
+    topo = dag.topo
+    succ_ptr, succ_idx = dag.succ_ptr.tolist(), dag.succ_idx.tolist()
+    pred_ptr, pred_idx = dag.pred_ptr.tolist(), dag.pred_idx.tolist()
+    if with_comm:
+        succ_comm, pred_comm = dag.succ_comm.tolist(), dag.pred_comm.tolist()
+    else:
+        succ_comm = pred_comm = [0.0] * dag.n_edges
+
+    # --- upward rank: dari exit ke entry ---
+    rank_u = [0.0] * n
+    for t in reversed(topo):
+        best = 0.0
+        for k in range(succ_ptr[t], succ_ptr[t + 1]):
+            r = succ_comm[k] + rank_u[succ_idx[k]]
+            if r > best:
+                best = r
+        rank_u[t] = cost[t] + best
+
+    # --- downward rank + critical path: dari entry ke exit ---
+    rank_d = [0.0] * n
+    cp_length = 0.0
+    for t in topo:
+        best = 0.0
+        for k in range(pred_ptr[t], pred_ptr[t + 1]):
+            i = pred_idx[k]
+            r = rank_d[i] + cost[i] + pred_comm[k]
+            if r > best:
+                best = r
+        rank_d[t] = best
+        if best + rank_u[t] > cp_length:
+            cp_length = best + rank_u[t]
+
+    rank_u = np.asarray(rank_u)
+    rank_d = np.asarray(rank_d)
+    rank_u.setflags(write=False)
+    rank_d.setflags(write=False)
+    return Ranks(rank_u, rank_d, cp_length)
+
+
+def _csr_ptr(keys: np.ndarray, n: int) -> np.ndarray:
+    ptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=n), out=ptr[1:])
+    return ptr
+
+
+def _csr_pairs(ptr: np.ndarray, idx: np.ndarray, comm: np.ndarray):
+    idx_list = idx.tolist()
+    comm_list = comm.tolist()
+    bounds = ptr.tolist()
+    return tuple(
+        tuple(zip(idx_list[bounds[i]:bounds[i + 1]], comm_list[bounds[i]:bounds[i + 1]]))
+        for i in range(len(bounds) - 1)
+    )
+
+
+def _topological_order(n: int, succs) -> Tuple[int, ...]:
+    """Topological sort sederhana (Kahn, BFS)."""
+    indeg = [0] * n
+    for u in range(n):
+        for v, _ in succs[u]:
+            indeg[v] += 1
+
+    q = deque(i for i in range(n) if indeg[i] == 0)
+    order: List[int] = []
+
+    while q:
+        u = q.popleft()
+        order.append(u)
+        for v, _ in succs[u]:
+            indeg[v] -= 1
+            if indeg[v] == 0:
+                q.append(v)
+
+    if len(order) != n:
+        raise ValueError("Graf tugas bukan DAG (ada siklus / task nyangkut).")
+
+    return tuple(order)
+
+
+@instrument.timed("compile_dag")
+def compile_dag(tasks, edges, cost_matrix=None) -> CompiledDAG:
+    """
+    Bangun CompiledDAG dari format mentah (list of dict) yang dipakai main.py:
+    tasks: list of dict, minimal punya key "cost"
+    edges: list of dict, minimal punya "src", "dst", optional "comm"
+    cost_matrix: (opsional) biaya heterogen (n, p); kalau None semua prosesor
+                 memakai "cost" yang sama
+    """
+    cost = [float(t["cost"]) for t in tasks]
+
+    # kalau ada edge ganda (src, dst), komunikasi yang terakhir yang dipakai
+    comm_map = {}
+    src = []
+    dst = []
+    for e in edges:
+        s = int(e["src"])
+        d = int(e["dst"])
+        comm_map[(s, d)] = float(e.get("comm", 0.0) or 0.0)
+        src.append(s)
+        dst.append(d)
+
+    comm = [comm_map[(s, d)] for s, d in zip(src, dst)]
+    return CompiledDAG(cost, src, dst, comm, cost_matrix)
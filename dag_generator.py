@@ -1,9 +1,17 @@
 # dag_generator.py
 import csv 
+import math
 import random
 import os
+
+import numpy as np
+
 from config import CONFIG
 
+# costs.npy menyimpan biaya dalam satuan 1/100 (int32): ringkas dan tetap
+# persis sama dengan nilai 2 desimal yang ditulis di tasks.csv
+COST_SCALE = 100
+
 
 def generate_single_dag(n, out_degree_range, beta):
     tasks = []
@@ -19,10 +27,9 @@ def generate_single_dag(n, out_degree_range, beta):
 
     # generate edges (DAG forward only)
     for i in range(n):
-        out_deg = random.choice(out_degree_range)
-        possible_targets = list(range(i + 1, n))
-        random.shuffle(possible_targets)
-        for t in possible_targets[:out_deg]:
+        out_deg = min(random.choice(out_degree_range), n - i - 1)
+        # sample langsung dari range: tidak membangun list kandidat O(n)
+        for t in random.sample(range(i + 1, n), out_deg):
             edges.append({
                 "src": i,
                 "dst": t,
@@ -32,58 +39,188 @@ def generate_single_dag(n, out_degree_range, beta):
     return tasks, edges
 
 
-def save_dag(tasks, edges, folder, meta):
+def layer_sizes(n, shape_alpha, rng=random):
+    """
+    Bagi n task ke dalam level ala generator DAG acak HEFT:
+    tinggi ~ sqrt(n) / alpha, lebar rata-rata ~ sqrt(n) * alpha.
+    alpha kecil -> DAG tinggi & ramping, alpha besar -> DAG pendek & lebar.
+    """
+    # minimal 2 level supaya ada edge (dan CCR punya arti)
+    height = min(n, max(2, round(math.sqrt(n) / shape_alpha)))
+    mean_width = n / height
+
+    # lebar tiap level acak di sekitar rata-rata, minimal 1, total tetap n
+    weights = [rng.uniform(0.5, 1.5) * mean_width for _ in range(height)]
+    scale = (n - height) / sum(weights)
+    sizes = [1 + int(w * scale) for w in weights]
+    for k in range(n - sum(sizes)):
+        sizes[k % height] += 1
+    return sizes
+
+
+def generate_layered_dag(n, ccr, shape_alpha, out_degree_range, beta, processors=None, rng=random):
+    """
+    DAG berlapis yang benar-benar memakai ccr dan shape_alpha:
+    - shape_alpha menentukan tinggi/lebar (layer_sizes)
+    - edge hanya dari level i ke level > i; setiap task non-entry punya
+      minimal satu predecessor di level tepat di atasnya
+    - biaya komunikasi diskalakan supaya rata-rata comm / rata-rata komputasi = ccr
+
+    return: tasks, edges, cost_matrix (None kalau processors tidak diberikan)
+    """
+    tasks = []
+    edges = []
+
+    # generate task cost
+    for i in range(n):
+        base = rng.randint(10, 50)
+        low = base * (1 - beta / 2)
+        high = base * (1 + beta / 2)
+        tasks.append({"task": i, "cost": round(rng.uniform(low, high), 2)})
+
+    sizes = layer_sizes(n, shape_alpha, rng) if n else []
+    starts = [0]
+    for s in sizes:
+        starts.append(starts[-1] + s)
+
+    # generate edges (level atas -> level bawah), tanpa list kandidat
+    pairs = []
+    parent_above = [False] * n  # punya predecessor di level tepat di atasnya
+    for lv in range(len(sizes) - 1):
+        first_next, end_next = starts[lv + 1], starts[lv + 2]
+        for i in range(starts[lv], first_next):
+            out_deg = min(rng.choice(out_degree_range), n - first_next)
+            for t in rng.sample(range(first_next, n), out_deg):
+                pairs.append((i, t))
+                if t < end_next:
+                    parent_above[t] = True
+
+        # edge dari level yang lebih atas tidak cukup: tanpa parent di level lv,
+        # task di level lv + 1 "naik" level dan tinggi DAG tidak sesuai shape_alpha
+        for t in range(first_next, end_next):
+            if not parent_above[t]:
+                pairs.append((rng.randrange(starts[lv], first_next), t))
+                parent_above[t] = True
+
+    # biaya komunikasi: acak lalu diskalakan tepat ke target CCR
+    raw = [rng.uniform(0.0, 2.0) for _ in pairs]
+    if raw:
+        mean_comp = sum(t["cost"] for t in tasks) / n
+        scale = ccr * mean_comp / (sum(raw) / len(raw))
+        for (s, d), r in zip(pairs, raw):
+            edges.append({"src": s, "dst": d, "comm": round(r * scale, 2)})
+
+    cost_matrix = generate_cost_matrix(tasks, processors, beta, rng) if processors else None
+    return tasks, edges, cost_matrix
+
+
+def generate_cost_matrix(tasks, processors, beta, rng=random):
+    """
+    Matriks biaya heterogen (n, p) ala HEFT: untuk task dengan biaya rata-rata
+    w, biaya di tiap prosesor diambil uniform dari [w(1 - beta/2), w(1 + beta/2)].
+    beta = faktor heterogenitas prosesor (CONFIG["beta"]).
+    """
+    matrix = []
+    for t in tasks:
+        w = t["cost"]
+        low = w * (1 - beta / 2)
+        high = w * (1 + beta / 2)
+        matrix.append([round(rng.uniform(low, high), 2) for _ in range(processors)])
+    return matrix
+
+
+def save_cost_matrix(cost_matrix, folder):
+    scaled = np.rint(np.asarray(cost_matrix, dtype=np.float64) * COST_SCALE).astype(np.int32)
+    np.save(os.path.join(folder, "costs.npy"), scaled)
+
+
+def save_dag(tasks, edges, folder, meta, cost_matrix=None):
     os.makedirs(folder, exist_ok=True)
 
     with open(f"{folder}/tasks.csv", "w", newline="") as f:
-        writer = csv.writer(f)
+        writer = csv.writer(f, lineterminator="\n")
         writer.writerow(["task", "cost"])
         for t in tasks:
             writer.writerow([t["task"], t["cost"]])
 
     with open(f"{folder}/edges.csv", "w", newline="") as f:
-        writer = csv.writer(f)
+        writer = csv.writer(f, lineterminator="\n")
         writer.writerow(["src", "dst", "comm"])
         for e in edges:
             writer.writerow([e["src"], e["dst"], e["comm"]])
 
     # metadata
     with open(f"{folder}/meta.csv", "w", newline="") as f:
-        writer = csv.writer(f)
+        writer = csv.writer(f, lineterminator="\n")
         writer.writerow(["processors", "ccr", "shape_alpha"])
         writer.writerow([meta["processors"], meta["ccr"], meta["shape_alpha"]])
 
+    # biaya heterogen per prosesor (opsional)
+    if cost_matrix is not None:
+        save_cost_matrix(cost_matrix, folder)
 
-def generate_all_dags():
-    out_degree_range = CONFIG["out_degree_range"]
-    beta = CONFIG["beta"]
 
-    idx = 0
-    for n in CONFIG["number_of_nodes"]:
-        for ccr in CONFIG["ccr"]:
-            for proc in CONFIG["processors"]:
-                for shape in CONFIG["shape_alpha"]:
-
-                    folder = (
-                        f"data/dags/dag_{idx}_n{n}_ccr{ccr}_p{proc}_shape{shape}"
-                    )
-
-                    tasks, edges = generate_single_dag(
-                        n,
-                        out_degree_range,
-                        beta
-                    )
-
-                    save_dag(tasks, edges, folder, {
-                        "processors": proc,
-                        "ccr": ccr,
-                        "shape_alpha": shape
-                    })
+def dag_name(spec):
+    return f"dag_{spec['idx']}_n{spec['n']}_ccr{spec['ccr']}_p{spec['processors']}_shape{spec['shape_alpha']}"
+
 
+def iter_dag_specs(config=CONFIG):
+    """Spesifikasi ringan (tanpa isi DAG) untuk setiap kombinasi di config."""
+    idx = 0
+    for n in config["number_of_nodes"]:
+        for ccr in config["ccr"]:
+            for proc in config["processors"]:
+                for shape in config["shape_alpha"]:
+                    yield {"idx": idx, "n": n, "ccr": ccr, "processors": proc, "shape_alpha": shape}
                     idx += 1
 
+
+def build_dag(spec, seed=0, config=CONFIG):
+    """
+    Bangkitkan satu DAG dari spesifikasinya. RNG-nya sendiri per DAG
+    (diturunkan dari seed + idx), jadi hasilnya sama persis tidak peduli
+    urutan/proses mana yang membangkitkan.
+
+    return: tasks, edges, meta, cost_matrix
+    """
+    rng = random.Random(seed * 1_000_003 + spec["idx"])
+    tasks, edges, cost_matrix = generate_layered_dag(
+        spec["n"],
+        spec["ccr"],
+        spec["shape_alpha"],
+        config["out_degree_range"],
+        config["beta"],
+        spec["processors"],
+        rng,
+    )
+    meta = {"processors": spec["processors"], "ccr": spec["ccr"], "shape_alpha": spec["shape_alpha"]}
+    return tasks, edges, meta, cost_matrix
+
+
+def iter_dags(seed=0, config=CONFIG):
+    """
+    Stream DAG secara lazy: (nama, tasks, edges, meta, cost_matrix).
+    Hanya satu DAG yang ada di memori pada satu waktu.
+    """
+    for spec in iter_dag_specs(config):
+        yield (dag_name(spec),) + build_dag(spec, seed, config)
+
+
+def generate_all_dags(root="data/dags", seed=0):
+    idx = 0
+    for name, tasks, edges, meta, cost_matrix in iter_dags(seed):
+        save_dag(tasks, edges, os.path.join(root, name), meta, cost_matrix)
+        idx += 1
+
     print(f"Generated {idx} DAG variations.")
 
 
 if __name__ == "__main__":
-    generate_all_dags()
\ No newline at end of file
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Bangkitkan semua variasi DAG dari config.CONFIG.")
+    parser.add_argument("--root", default="data/dags", help="folder tujuan")
+    parser.add_argument("--seed", type=int, default=0, help="seed generator (hasil reproducible)")
+    args = parser.parse_args()
+
+    generate_all_dags(args.root, args.seed)
@@ -0,0 +1,266 @@
+# dataset.py
+# Format dataset "packed": semua DAG (tasks, edges, meta) dalam SATU file biner
+# yang bisa di-memory-map, pengganti ribuan file CSV kecil per folder.
+#
+# Layout file:
+#   MAGIC (8 byte) | panjang header (uint64, little endian) | header JSON | array...
+# Header berisi nama folder tiap DAG dan, untuk setiap array, dtype/shape/offset.
+# Setiap array disimpan rata 64 byte dan diakses lewat offset (CSR-style):
+#   task_ptr[k]..task_ptr[k+1]  -> task_cost milik DAG ke-k
+#   edge_ptr[k]..edge_ptr[k+1]  -> edge_src/edge_dst/edge_comm milik DAG ke-k
+#   cost_ptr[k]..cost_ptr[k+1]  -> cost_matrix (n*p, row-major) milik DAG ke-k,
+#                                  kosong kalau DAG itu homogen
+import hashlib
+import json
+import os
+import re
+import struct
+from functools import lru_cache
+
+import numpy as np
+
+from compiled_dag import CompiledDAG
+
+MAGIC = b"DAGPACK1"
+ALIGN = 64
+
+_ARRAY_DTYPES = {
+    "dag_id": np.int64,
+    "processors": np.int32,
+    "ccr": np.float64,
+    "shape_alpha": np.float64,
+    "task_ptr": np.int64,
+    "task_cost": np.float64,
+    "edge_ptr": np.int64,
+    "edge_src": np.int32,
+    "edge_dst": np.int32,
+    "edge_comm": np.float64,
+    "cost_ptr": np.int64,
+    "cost_values": np.float64,
+}
+
+
+def _folder_id(name, fallback):
+    # contoh nama folder: dag_0_n10_ccr0.1_p4_shape0.5
+    m = re.match(r"dag_(\d+)", name)
+    return int(m.group(1)) if m else fallback
+
+
+def write_packed(path, names, dags, cost_matrices=None):
+    """
+    Tulis dataset packed.
+    names: list nama DAG (nama folder)
+    dags : list (tasks, edges, meta) dalam format list-of-dict seperti main.py
+    cost_matrices: list matriks biaya heterogen (n, p) atau None per DAG
+    """
+    count = len(names)
+    task_counts = [len(tasks) for tasks, _, _ in dags]
+    edge_counts = [len(edges) for _, edges, _ in dags]
+
+    if cost_matrices is None:
+        cost_matrices = [None] * count
+    cost_blocks = [
+        np.zeros(0) if cm is None else np.asarray(cm, dtype=np.float64).ravel()
+        for cm in cost_matrices
+    ]
+
+    arrays = {
+        "dag_id": [_folder_id(name, k) for k, name in enumerate(names)],
+        "processors": [int(meta["processors"]) for _, _, meta in dags],
+        "ccr": [float(meta["ccr"]) for _, _, meta in dags],
+        "shape_alpha": [float(meta["shape_alpha"]) for _, _, meta in dags],
+        "task_ptr": np.concatenate([[0], np.cumsum(task_counts, dtype=np.int64)]),
+        "task_cost": [float(t["cost"]) for tasks, _, _ in dags for t in tasks],
+        "edge_ptr": np.concatenate([[0], np.cumsum(edge_counts, dtype=np.int64)]),
+        "edge_src": [int(e["src"]) for _, edges, _ in dags for e in edges],
+        "edge_dst": [int(e["dst"]) for _, edges, _ in dags for e in edges],
+        "edge_comm": [float(e.get("comm", 0.0) or 0.0) for _, edges, _ in dags for e in edges],
+        "cost_ptr": np.concatenate([[0], np.cumsum([b.size for b in cost_blocks], dtype=np.int64)]),
+        "cost_values": np.concatenate([np.zeros(0)] + cost_blocks),
+    }
+    arrays = {key: np.asarray(val, dtype=_ARRAY_DTYPES[key]) for key, val in arrays.items()}
+
+    if len(set(arrays["dag_id"].tolist())) != count:
+        raise ValueError("dag_id ganda di dalam dataset.")
+
+    # header dulu (offset relatif terhadap awal blok data), lalu blok data
+    layout = {}
+    offset = 0
+    for key, arr in arrays.items():
+        offset = -(-offset // ALIGN) * ALIGN
+        layout[key] = {"dtype": arr.dtype.str, "shape": list(arr.shape), "offset": offset}
+        offset += arr.nbytes
+
+    header = json.dumps({"version": 2, "count": count, "names": list(names), "arrays": layout}).encode("utf-8")
+    data_start = -(-(len(MAGIC) + 8 + len(header)) // ALIGN) * ALIGN
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(header)))
+        f.write(header)
+        for key, arr in arrays.items():
+            f.seek(data_start + layout[key]["offset"])
+            f.write(arr.tobytes())
+    os.replace(tmp_path, path)
+
+
+class PackedDataset:
+    """
+    Pembaca dataset packed (memory-mapped, tanpa parsing teks).
+
+    ds = PackedDataset("data/dags.dagpack")
+    tasks, edges, meta = ds.get(dag_id)
+    dag = ds.compiled(dag_id)      # langsung CompiledDAG dari array
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} bukan dataset packed.")
+            (header_len,) = struct.unpack("<Q", f.read(8))
+            header = json.loads(f.read(header_len).decode("utf-8"))
+
+        data_start = -(-(len(MAGIC) + 8 + header_len) // ALIGN) * ALIGN
+        self._mm = np.memmap(path, dtype=np.uint8, mode="r")
+
+        self.names = header["names"]
+        self._arrays = {}
+        for key, spec in header["arrays"].items():
+            dtype = np.dtype(spec["dtype"])
+            shape = tuple(spec["shape"])
+            start = data_start + spec["offset"]
+            nbytes = int(np.prod(shape)) * dtype.itemsize
+            self._arrays[key] = self._mm[start:start + nbytes].view(dtype).reshape(shape)
+
+        self._pos_by_id = {dag_id: k for k, dag_id in enumerate(self._arrays["dag_id"].tolist())}
+        self._pos_by_name = {name: k for k, name in enumerate(self.names)}
+
+    def __len__(self):
+        return len(self.names)
+
+    def ids(self):
+        return self._arrays["dag_id"].tolist()
+
+    def position(self, key):
+        """Posisi DAG berdasarkan id (int) atau nama folder (str)."""
+        if isinstance(key, str):
+            return self._pos_by_name[key]
+        return self._pos_by_id[int(key)]
+
+    def meta(self, key):
+        k = self.position(key)
+        a = self._arrays
+        return {
+            "processors": int(a["processors"][k]),
+            "ccr": float(a["ccr"][k]),
+            "shape_alpha": float(a["shape_alpha"][k]),
+            "n": int(a["task_ptr"][k + 1] - a["task_ptr"][k]),
+        }
+
+    def cost_matrix(self, key):
+        """Matriks biaya heterogen (n, p) sebagai view, atau None kalau homogen."""
+        a = self._arrays
+        if "cost_ptr" not in a:
+            return None  # file versi 1
+        k = self.position(key)
+        c0, c1 = int(a["cost_ptr"][k]), int(a["cost_ptr"][k + 1])
+        if c1 == c0:
+            return None
+        n = int(a["task_ptr"][k + 1] - a["task_ptr"][k])
+        return a["cost_values"][c0:c1].reshape(n, -1)
+
+    def arrays(self, key):
+        """Slice array (view, tanpa copy): cost, src, dst, comm."""
+        k = self.position(key)
+        a = self._arrays
+        t0, t1 = int(a["task_ptr"][k]), int(a["task_ptr"][k + 1])
+        e0, e1 = int(a["edge_ptr"][k]), int(a["edge_ptr"][k + 1])
+        return a["task_cost"][t0:t1], a["edge_src"][e0:e1], a["edge_dst"][e0:e1], a["edge_comm"][e0:e1]
+
+    def get(self, key):
+        """(tasks, edges, meta) dalam format list-of-dict seperti main.load_tasks_edges."""
+        cost, src, dst, comm = self.arrays(key)
+        tasks = [{"task": i, "cost": c} for i, c in enumerate(cost.tolist())]
+        edges = [
+            {"src": s, "dst": d, "comm": c}
+            for s, d, c in zip(src.tolist(), dst.tolist(), comm.tolist())
+        ]
+        return tasks, edges, self.meta(key)
+
+    def compiled(self, key) -> CompiledDAG:
+        cost, src, dst, comm = self.arrays(key)
+        return CompiledDAG(cost, src, dst, comm, self.cost_matrix(key))
+
+    def digest(self, key) -> str:
+        """Hash isi satu DAG (untuk manifest)."""
+        h = hashlib.sha256()
+        cost_matrix = self.cost_matrix(key)
+        for arr in self.arrays(key) + (() if cost_matrix is None else (cost_matrix,)):
+            h.update(np.ascontiguousarray(arr).tobytes())
+        h.update(json.dumps(self.meta(key), sort_keys=True).encode("utf-8"))
+        return h.hexdigest()
+
+
+@lru_cache(maxsize=4)
+def open_dataset(path) -> PackedDataset:
+    """PackedDataset yang di-cache per proses (dipakai ulang oleh worker)."""
+    return PackedDataset(path)
+
+
+def pack_folders(root="data/dags", out_path="data/dags.dagpack"):
+    """Konversi layout folder (tasks.csv/edges.csv/meta.csv) -> satu file packed."""
+    from main import list_dag_folders, load_cost_matrix, load_meta_row, load_tasks_edges
+
+    names = []
+    dags = []
+    cost_matrices = []
+    for folder, full_path in list_dag_folders(root):
+        tasks, edges = load_tasks_edges(full_path)
+        names.append(folder)
+        dags.append((tasks, edges, load_meta_row(full_path)))
+        cost_matrices.append(load_cost_matrix(full_path))
+
+    write_packed(out_path, names, dags, cost_matrices)
+    return len(names)
+
+
+def _as_written(value):
+    return int(value) if float(value).is_integer() else value
+
+
+def unpack_to_folders(path="data/dags.dagpack", root="data/dags"):
+    """
+    Konversi balik: file packed -> layout folder seperti dag_generator.save_dag.
+    CSV hasil pack folder dag_generator ditulis ulang byte demi byte (akhir baris LF).
+    """
+    from dag_generator import save_dag
+
+    ds = PackedDataset(path)
+    for name in ds.names:
+        tasks, edges, meta = ds.get(name)
+        # nilai bulat ditulis sebagai int, sama seperti output dag_generator
+        for e in edges:
+            e["comm"] = _as_written(e["comm"])
+        for key in ("ccr", "shape_alpha"):
+            meta[key] = _as_written(meta[key])
+        save_dag(tasks, edges, os.path.join(root, name), meta, ds.cost_matrix(name))
+    return len(ds)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Konversi dataset DAG folder <-> packed.")
+    parser.add_argument("command", choices=["pack", "unpack"])
+    parser.add_argument("--root", default="data/dags", help="folder berisi DAG")
+    parser.add_argument("--file", default="data/dags.dagpack", help="file dataset packed")
+    args = parser.parse_args()
+
+    if args.command == "pack":
+        count = pack_folders(args.root, args.file)
+        print(f"Packed {count} DAG ke {args.file}")
+    else:
+        count = unpack_to_folders(args.file, args.root)
+        print(f"Unpacked {count} DAG ke {args.root}")
@@ -1,10 +1,11 @@
 # evaluate.py
-import math
-from collections import deque
-from typing import Dict, List, Tuple, Union
+from typing import Dict, List, Optional, Sequence, Union
 
 import numpy as np
 
+import instrument
+from compiled_dag import CompiledDAG, compile_dag
+
 # Harga sewa instance per jam (silakan sesuaikan skenario skripsi)
 C_INST_PER_HOUR = 0.1
 
@@ -19,53 +20,14 @@ P_DYN_MAX = 100.0   # tambahan power saat utilisation = 1
 AssignmentType = Union[Dict[int, int], List[int]]
 
 
-def _build_graph(n: int, edges) -> Tuple[Dict[int, List[int]], Dict[int, List[int]], Dict[Tuple[int, int], float]]:
-    """Bangun struktur DAG: preds, succs, dan biaya komunikasi."""
-    preds = {i: [] for i in range(n)}
-    succs = {i: [] for i in range(n)}
-    comm: Dict[Tuple[int, int], float] = {}
-
-    for e in edges:
-        s = int(e["src"])
-        d = int(e["dst"])
-        c = float(e.get("comm", 0.0) or 0.0)
-
-        preds[d].append(s)
-        succs[s].append(d)
-        comm[(s, d)] = c
-
-    return preds, succs, comm
-
-
-def _topological_order(n: int, succs: Dict[int, List[int]]) -> List[int]:
-    """Topological sort sederhana."""
-    indeg = [0] * n
-    for u in range(n):
-        for v in succs[u]:
-            indeg[v] += 1
-
-    q = deque(i for i in range(n) if indeg[i] == 0)
-    order = []
-
-    while q:
-        u = q.popleft()
-        order.append(u)
-        for v in succs[u]:
-            indeg[v] -= 1
-            if indeg[v] == 0:
-                q.append(v)
-
-    if len(order) != n:
-        raise ValueError("Graf tugas bukan DAG (ada siklus / task nyangkut).")
-
-    return order
-
-
 def compute_task_times(
     proc_assignment: AssignmentType,
     tasks,
     edges,
     processors: int,
+    dag: Optional[CompiledDAG] = None,
+    order: Optional[Sequence[int]] = None,
+    release: Optional[Sequence[float]] = None,
 ):
     """
     Hitung AST (Actual Start Time) dan AFT (Actual Finish Time) setiap task
@@ -74,13 +36,19 @@ def compute_task_times(
     proc_assignment: dict/list, task -> prosesor
     tasks: list of dict, minimal punya key "cost"
     edges: list of dict, minimal punya "src", "dst", optional "comm"
+    dag: CompiledDAG (opsional) -> kalau diberikan, graf tidak dibangun ulang
+    order: urutan eksekusi (harus valid secara topologis); default urutan
+           topologis BFS dari dag.topo
+    release: waktu paling awal tiap task boleh mulai (mis. waktu kedatangan
+           workflow-nya, lihat multi_workflow.py); default 0
     """
     n = len(tasks)
     if n == 0:
         return [], []
 
-    preds, succs, comm = _build_graph(n, edges)
-    topo = _topological_order(n, succs)
+    if dag is None:
+        dag = compile_dag(tasks, edges)
+    dag.check_processors(processors)
 
     # Normalisasi assignment ke bentuk list
     if isinstance(proc_assignment, dict):
@@ -88,22 +56,26 @@ def compute_task_times(
     else:
         assignment = [int(p) for p in proc_assignment]
 
+    # biaya tiap task di prosesor tujuannya (heterogen kalau ada cost_matrix)
+    cost = dag.assigned_costs(assignment)
+    preds = dag.preds
+
     proc_avail = [0.0] * processors
     ast = [0.0] * n
     aft = [0.0] * n
 
-    for t in topo:
+    for t in (dag.topo if order is None else order):
         p = assignment[t]
-        ready_pred = 0.0
+        ready_pred = 0.0 if release is None else release[t]
 
         # constraint dependency + komunikasi
-        for pred in preds[t]:
-            pred_p = assignment[pred]
-            comm_time = comm.get((pred, t), 0.0) if pred_p != p else 0.0
-            ready_pred = max(ready_pred, aft[pred] + comm_time)
+        for pred, comm_time in preds[t]:
+            ready = aft[pred] + comm_time if assignment[pred] != p else aft[pred]
+            if ready > ready_pred:
+                ready_pred = ready
 
-        start = max(proc_avail[p], ready_pred)
-        finish = start + float(tasks[t]["cost"])
+        start = proc_avail[p] if proc_avail[p] > ready_pred else ready_pred
+        finish = start + cost[t]
 
         ast[t] = start
         aft[t] = finish
@@ -111,77 +83,330 @@ def compute_task_times(
 
     return ast, aft
 
-def evaluate_schedule(proc_assignment, tasks, edges, processors):
-    n = len(tasks)
-    if n == 0:
-        return {
-            "makespan": 0.0,
-            "energy": 0.0,
-            "cost": 0.0,
-            "reliability": 1.0,
-            "load_balance": 0.0,
-        }
 
-    # ---------------- WAKTU TUGAS (AST & AFT) ----------------
-    AST, AFT = compute_task_times(proc_assignment, tasks, edges, processors)
-    makespan = max(AFT) if AFT else 0.0
+def compute_task_times_delta(
+    proc_assignment: AssignmentType,
+    parent_assignment: AssignmentType,
+    parent_ast: Sequence[float],
+    parent_aft: Sequence[float],
+    processors: int,
+    dag: CompiledDAG,
+    changed: Optional[Sequence[int]] = None,
+):
+    """
+    Evaluasi inkremental: AST/AFT anak yang hanya berbeda beberapa gen dari
+    parent-nya (hasil mutate / crossover), memakai ulang AST/AFT parent.
+
+    - prefix urutan topologis sebelum gen pertama yang berubah disalin dari
+      parent (proc_avail direkonstruksi dari AFT parent, tanpa cek predecessor)
+    - simulasi diulang mulai dari posisi itu, dan BERHENTI lebih awal begitu
+      semua gen yang berubah sudah lewat, proc_avail anak sama dengan parent,
+      dan tidak ada task "berbeda" yang successor-nya belum diproses
+      -> sisa jadwal dijamin identik dengan parent
+
+    changed: task yang gennya berubah (opsional, dihitung kalau None)
+    Hasilnya sama persis dengan compute_task_times(proc_assignment, ...).
+    """
+    n = dag.n
+    dag.check_processors(processors)
 
-    # ---------------- BEBAN PER PROSESOR (DALAM WAKTU) ------- 
-    loads = [0.0] * processors
-    for tid, p in proc_assignment.items():
-        duration = AFT[tid] - AST[tid]   # waktu aktif task di prosesor
-        loads[p] += duration
+    assignment = _as_list(proc_assignment, n)
+    parent = _as_list(parent_assignment, n)
+    if changed is None:
+        changed = [t for t, a, b in zip(range(n), assignment, parent) if a != b]
 
-    # Utilisation 0..1
-    if makespan > 0:
-        util = [load / makespan for load in loads]
-    else:
-        util = [0.0] * processors
-
-    # ---------------- ENERGY (BERBASIS UTILISATION) ---------- 
-    P_IDLE = 50.0      # bebas, skala relatif
-    P_DYN_MAX = 100.0  # bebas, skala relatif
-
-    energy = 0.0
-    for u in util:
-        power = P_IDLE + P_DYN_MAX * (u ** 2)
-        energy += power * makespan
-
-    # ---------------- COST (HOURLY-BASED PER PROSESOR) ------- 
-    total_cost = 0.0
-    for p in range(processors):
-        task_ids = [tid for tid, pr in proc_assignment.items() if pr == p]
-        if not task_ids:
+    ast = list(parent_ast)
+    aft = list(parent_aft)
+    if not changed:
+        return ast, aft
+
+    topo = dag.topo
+    topo_pos = dag.topo_pos
+    last_succ_pos = dag.last_succ_pos
+    preds = dag.preds
+    cost = dag.assigned_costs(assignment)
+
+    first = min(topo_pos[t] for t in changed)
+    last_change = max(topo_pos[t] for t in changed)
+
+    # prefix identik: proc_avail = AFT task terakhir di tiap prosesor
+    proc_avail = [0.0] * processors
+    for pos in range(first):
+        t = topo[pos]
+        proc_avail[parent[t]] = parent_aft[t]
+    parent_avail = proc_avail[:]
+
+    horizon = -1    # posisi successor terjauh dari task yang berbeda dari parent
+
+    for pos in range(first, n):
+        t = topo[pos]
+        p = assignment[t]
+
+        if pos > horizon and pos > last_change and proc_avail[p] == parent_avail[p]:
+            # semua input task ini identik dengan parent: AST/AFT sudah benar
+            proc_avail[p] = parent_avail[p] = parent_aft[t]
+            if proc_avail == parent_avail:
+                break  # re-konvergen: sisa AST/AFT sama dengan parent
             continue
 
-        start = min(AST[tid] for tid in task_ids)
-        end = max(AFT[tid] for tid in task_ids)
-        duration_hours = max(0.0, (end - start) / 3600.0)
+        ready_pred = 0.0
+        for pred, comm_time in preds[t]:
+            ready = aft[pred] + comm_time if assignment[pred] != p else aft[pred]
+            if ready > ready_pred:
+                ready_pred = ready
 
-        total_cost += duration_hours * C_INST_PER_HOUR
+        start = proc_avail[p] if proc_avail[p] > ready_pred else ready_pred
+        finish = start + cost[t]
+        ast[t] = start
+        aft[t] = finish
+        proc_avail[p] = finish
+        parent_avail[parent[t]] = parent_aft[t]
 
-    cost_cloud = total_cost
+        if finish != parent_aft[t] or p != parent[t]:
+            if last_succ_pos[t] > horizon:
+                horizon = last_succ_pos[t]
+        elif pos >= horizon and pos >= last_change and proc_avail == parent_avail:
+            break  # re-konvergen: sisa AST/AFT sama dengan parent
 
-    # ---------------- RELIABILITY (FUNCTION OF UTIL) --------- 
-    log_Rg = 0.0
-    for u in util:
-        lam_p = LAMBDA_0 * (1.0 + 4.0 * u)
-        log_Rg += -lam_p * makespan
+    return ast, aft
+
+
+def _as_list(proc_assignment: AssignmentType, n: int) -> List[int]:
+    if isinstance(proc_assignment, dict):
+        return [int(proc_assignment[i]) for i in range(n)]
+    if isinstance(proc_assignment, list):
+        return proc_assignment  # kromosom GA: sudah list int, tidak perlu disalin
+    return [int(p) for p in proc_assignment]
 
-    reliability = math.exp(log_Rg)
 
-    # ---------------- LOAD BALANCING (VARIANSI BEBAN) -------- 
+def compute_task_times_batch(
+    population,
+    tasks,
+    edges,
+    processors: int,
+    dag: Optional[CompiledDAG] = None,
+):
+    """
+    Versi batch dari compute_task_times: seluruh populasi GA dievaluasi
+    sekaligus. Urutan topologis cukup dijalani SEKALI, dan setiap langkah
+    memakai operasi array di sepanjang sumbu populasi (termasuk proc_avail
+    per individu dan penalti komunikasi antar prosesor).
+
+    population: array int (pop_size, n), population[k, t] = prosesor task t
+    return: (AST, AFT) berbentuk (pop_size, n)
+    """
+    pop = np.asarray(population, dtype=np.int64)
+    if pop.ndim != 2:
+        raise ValueError("population harus berbentuk (pop_size, n).")
+
+    pop_size, n = pop.shape
+    if n == 0:
+        empty = np.zeros((pop_size, 0))
+        return empty, empty
+
+    if dag is None:
+        dag = compile_dag(tasks, edges)
+    dag.check_processors(processors)
+
+    # simpan per task (baris) supaya akses aft[pred] bersebelahan di memori
+    assign = np.ascontiguousarray(pop.T)
+    ast = np.zeros((n, pop_size))
+    aft = np.zeros((n, pop_size))
+    proc_avail = np.zeros((pop_size, processors))
+    rows = np.arange(pop_size)
+
+    cost = dag.cost_list
+    cost_matrix = dag.cost_matrix
+    pred_ptr = dag.pred_ptr.tolist()
+    pred_idx = dag.pred_idx
+    pred_comm = dag.pred_comm
+
+    for t in dag.topo:
+        p = assign[t]
+        lo, hi = pred_ptr[t], pred_ptr[t + 1]
+
+        # constraint dependency + komunikasi (semua predecessor sekaligus)
+        if hi > lo:
+            idx = pred_idx[lo:hi]
+            remote = assign[idx] != p
+            ready_pred = (aft[idx] + pred_comm[lo:hi, None] * remote).max(axis=0)
+            start = np.maximum(proc_avail[rows, p], ready_pred)
+        else:
+            start = proc_avail[rows, p]
+
+        if cost_matrix is None:
+            finish = start + cost[t]
+        else:
+            finish = start + cost_matrix[t, p]
+
+        ast[t] = start
+        aft[t] = finish
+        proc_avail[rows, p] = finish
+
+    return ast.T, aft.T
+
+
+def schedule_metrics(assignment, ast, aft, processors: int) -> Dict[str, np.ndarray]:
+    """
+    Metrik jadwal dari array, untuk satu atau banyak jadwal sekaligus.
+
+    assignment, ast, aft: array (n,) atau (pop_size, n)
+    return: dict metrik -> array (pop_size,) (atau skalar numpy untuk input 1D)
+
+    Semua metrik per prosesor dihitung dengan reduksi terkelompok
+    (bincount / minimum.at / maximum.at) atas indeks (jadwal, prosesor),
+    jadi biayanya O(n + p) per jadwal, bukan O(n·p).
+    """
+    assignment = np.asarray(assignment, dtype=np.int64)
+    single = assignment.ndim == 1
+    assignment = np.atleast_2d(assignment)
+    ast = np.atleast_2d(np.asarray(ast, dtype=np.float64))
+    aft = np.atleast_2d(np.asarray(aft, dtype=np.float64))
+    pop_size, n = assignment.shape
+
+    if n == 0:
+        metrics = {
+            "makespan": np.zeros(pop_size),
+            "energy": np.zeros(pop_size),
+            "cost": np.zeros(pop_size),
+            "reliability": np.ones(pop_size),
+            "load_balance": np.zeros(pop_size),
+        }
+        return {key: val[0] for key, val in metrics.items()} if single else metrics
+
+    makespan = aft.max(axis=1)
+
+    # indeks grup (jadwal k, prosesor p) -> k * processors + p
+    group = (assignment + np.arange(pop_size)[:, None] * processors).ravel()
+    size = pop_size * processors
+
+    # ---------------- BEBAN PER PROSESOR (DALAM WAKTU) -------
+    loads = np.bincount(group, weights=(aft - ast).ravel(), minlength=size).reshape(pop_size, processors)
+
+    # Utilisation 0..1
+    span = makespan[:, None]
+    util = np.divide(loads, span, out=np.zeros_like(loads), where=span > 0)
+
+    # ---------------- ENERGY (BERBASIS UTILISATION) ----------
+    energy = ((P_IDLE + P_DYN_MAX * util ** 2) * span).sum(axis=1)
+
+    # ---------------- COST (HOURLY-BASED PER PROSESOR) -------
+    # jendela aktif prosesor = [AST paling awal, AFT paling akhir] task-nya
+    first = np.full(size, np.inf)
+    last = np.full(size, -np.inf)
+    np.minimum.at(first, group, ast.ravel())
+    np.maximum.at(last, group, aft.ravel())
+    used = np.bincount(group, minlength=size) > 0
+    hours = np.where(used, np.maximum(0.0, last - first) / 3600.0, 0.0)
+    cost = (hours * C_INST_PER_HOUR).reshape(pop_size, processors).sum(axis=1)
+
+    # ---------------- RELIABILITY (FUNCTION OF UTIL) ---------
+    lam = LAMBDA_0 * (1.0 + 4.0 * util)
+    reliability = np.exp(-(lam * span).sum(axis=1))
+
+    # ---------------- LOAD BALANCING (VARIANSI BEBAN) --------
     if processors > 1:
-        mean_load = float(np.mean(loads))
-        variance = sum((l - mean_load) ** 2 for l in loads) / (processors - 1)
-        load_balance = math.sqrt(variance)
+        load_balance = loads.std(axis=1, ddof=1)
     else:
-        load_balance = 0.0
+        load_balance = np.zeros(pop_size)
 
-    return {
+    metrics = {
         "makespan": makespan,
         "energy": energy,
-        "cost": cost_cloud,
+        "cost": cost,
         "reliability": reliability,
         "load_balance": load_balance,
-    }
\ No newline at end of file
+    }
+    return {key: val[0] for key, val in metrics.items()} if single else metrics
+
+
+def workflow_metrics(aft, workflow, arrival, baseline=None) -> Dict[str, np.ndarray]:
+    """
+    Metrik per workflow untuk jadwal gabungan banyak DAG (multi_workflow.py).
+
+    aft     : (n,) waktu selesai tiap task gabungan
+    workflow: (n,) indeks workflow tiap task
+    arrival : (W,) waktu kedatangan tiap workflow
+    baseline: (W,) makespan workflow kalau dijadwalkan sendirian di pool
+              kosong; None = slowdown tidak dihitung (diisi 1)
+
+    makespan workflow = AFT task terakhirnya - waktu kedatangan
+    slowdown          = makespan workflow / baseline (1 = tidak terganggu)
+    unfairness        = jumlah |slowdown - rata-rata slowdown|
+    """
+    arrival = np.asarray(arrival, dtype=np.float64)
+    finish = arrival.copy()
+    np.maximum.at(finish, np.asarray(workflow, dtype=np.int64), np.asarray(aft, dtype=np.float64))
+    makespan = finish - arrival
+
+    if baseline is None:
+        slowdown = np.ones_like(makespan)
+    else:
+        baseline = np.asarray(baseline, dtype=np.float64)
+        slowdown = np.divide(makespan, baseline, out=np.ones_like(makespan), where=baseline > 0)
+
+    return {
+        "workflow_makespan": makespan,
+        "slowdown": slowdown,
+        "avg_slowdown": slowdown.mean() if slowdown.size else 1.0,
+        "max_slowdown": slowdown.max() if slowdown.size else 1.0,
+        "unfairness": np.abs(slowdown - slowdown.mean()).sum() if slowdown.size else 0.0,
+    }
+
+
+@instrument.timed("evaluate")
+def evaluate_schedule(
+    proc_assignment: AssignmentType,
+    tasks,
+    edges,
+    processors,
+    dag: Optional[CompiledDAG] = None,
+    order: Optional[Sequence[int]] = None,
+    workflows: Optional[dict] = None,
+):
+    """
+    Metrik satu jadwal: makespan, energy, cost, reliability, load_balance.
+    proc_assignment: dict/list, task -> prosesor
+    order: urutan eksekusi (lihat compute_task_times)
+    workflows: jadwal gabungan banyak workflow (lihat multi_workflow.WorkflowSet.info),
+               {"index": workflow tiap task, "arrival": (W,), "baseline": (W,)}.
+               Task tidak mulai sebelum workflow-nya datang, dan hasilnya ditambah
+               "workflows" (list {"makespan", "slowdown"} per workflow),
+               "avg_slowdown", "max_slowdown", dan "unfairness".
+    """
+    n = len(tasks)
+    release = None
+    if workflows is not None:
+        release = np.asarray(workflows["arrival"], dtype=np.float64)[np.asarray(workflows["index"])].tolist()
+    AST, AFT = compute_task_times(proc_assignment, tasks, edges, processors, dag, order, release)
+    metrics = schedule_metrics(_as_list(proc_assignment, n), AST, AFT, processors)
+    result = {key: float(val) for key, val in metrics.items()}
+
+    if workflows is not None:
+        per = workflow_metrics(AFT, workflows["index"], workflows["arrival"], workflows.get("baseline"))
+        result["workflows"] = [
+            {"makespan": float(m), "slowdown": float(s)}
+            for m, s in zip(per["workflow_makespan"], per["slowdown"])
+        ]
+        for key in ("avg_slowdown", "max_slowdown", "unfairness"):
+            result[key] = float(per[key])
+    return result
+
+
+@instrument.timed("evaluate_batch")
+def evaluate_schedule_batch(
+    population,
+    tasks,
+    edges,
+    processors: int,
+    dag: Optional[CompiledDAG] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Versi batch evaluate_schedule untuk seluruh populasi GA sekaligus
+    (compute_task_times_batch + schedule_metrics).
+    population: array int (pop_size, n)
+    return: dict metrik -> array (pop_size,)
+    """
+    pop = np.asarray(population, dtype=np.int64)
+    ast, aft = compute_task_times_batch(pop, tasks, edges, processors, dag)
+    return schedule_metrics(pop.reshape(ast.shape), ast, aft, processors)
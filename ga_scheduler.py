@@ -1,33 +1,26 @@
 import random
-from typing import List, Tuple
-from evaluate import compute_task_times
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 
-def compute_priorities(tasks, edges) -> List[float]:
+import instrument
+from compiled_dag import CompiledDAG, compile_dag, compute_ranks
+from evaluate import compute_task_times, compute_task_times_batch, compute_task_times_delta
+from list_schedulers import critical_path_tasks
+
+
+def compute_priorities(tasks, edges, dag: Optional[CompiledDAG] = None) -> List[float]:
     """
     Step 2: Tentukan prioritas tugas.
-    Di sini dipakai 'upward rank' ala HEFT:
-    rank_u(i) = cost(i) + max(rank_u(child)) untuk semua successor.
+    Di sini dipakai 'upward rank' HEFT yang sama (dengan komunikasi):
+    rank_u(i) = cost(i) + max(comm(i, child) + rank_u(child)) untuk semua successor.
+    Rank di-cache di CompiledDAG, jadi cukup dihitung sekali per DAG.
     """
-    n = len(tasks)
-    succs = {i: [] for i in range(n)}
-    for e in edges:
-        succs[e["src"]].append(e["dst"])
-
-    cost = [t["cost"] for t in tasks]
-    memo = {}
-
-    def rank_u(tid: int) -> float:
-        if tid in memo:
-            return memo[tid]
-        if not succs[tid]:
-            memo[tid] = cost[tid]
-        else:
-            memo[tid] = cost[tid] + max(rank_u(ch) for ch in succs[tid])
-        return memo[tid]
-
-    priorities = [rank_u(i) for i in range(n)]
-    return priorities
+    if dag is None:
+        dag = compile_dag(tasks, edges)
+    return list(dag.rank_u)
 
 
 def init_population(pop_size: int, n: int, processors: int, priorities, tasks) -> List[List[int]]:
@@ -59,23 +52,198 @@ def init_population(pop_size: int, n: int, processors: int, priorities, tasks) -
     return population
 
 
-def fitness(individual: List[int], tasks, edges, processors: int) -> float:
+def inject_seeds(
+    population: List[List[int]],
+    seeds: Sequence[Sequence[int]],
+    processors: int,
+    fraction: float = 0.5,
+    perturb_rate: float = 0.1,
+) -> List[List[int]]:
+    """
+    Step 3–4 (opsional): sisipkan solusi yang sudah diketahui (mis. assignment
+    HEFT) ke populasi awal. Setiap seed masuk utuh satu kali, lalu sisanya
+    sampai `fraction` populasi diisi varian seed yang dimutasi dengan
+    probabilitas perturb_rate per gen. Individu lain tetap dari init_population.
+    """
+    seeds = [[int(p) for p in s] for s in seeds]
+    if not seeds:
+        return population
+
+    count = min(len(population), max(len(seeds), int(round(fraction * len(population)))))
+    for k in range(count):
+        individual = seeds[k % len(seeds)][:]
+        if k >= len(seeds):
+            mutate(individual, processors, perturb_rate)
+        population[k] = individual
+    return population
+
+
+def bound_seed(dag: CompiledDAG, processors: int) -> List[int]:
+    """
+    Step 3–4 (opsional): kromosom yang mengejar kedua suku
+    dag.makespan_lower_bound. Critical path tanpa komunikasi (biaya termurah
+    tiap task) ditaruh di satu prosesor, jadi jalurnya tidak kena delay
+    komunikasi; task lain dibagi ke prosesor dengan beban terkecil, urut
+    rank_u menurun (mendekati total kerja / processors).
+    """
+    cost = dag.cost if dag.cost_matrix is None else dag.cost_matrix.min(axis=1)
+    ranks = compute_ranks(dag, with_comm=False, cost=cost)
+    path = critical_path_tasks(dag, (ranks.rank_u + ranks.rank_d).tolist())
+
+    if dag.cost_matrix is None:
+        rows = np.repeat(dag.cost[:, None], processors, axis=1)
+    else:
+        rows = dag.cost_matrix
+    cp_proc = int(np.argmin(rows[path].sum(axis=0)))
+
+    individual = [0] * dag.n
+    loads = [0.0] * processors
+    on_path = set(path)
+    for t in path:
+        individual[t] = cp_proc
+        loads[cp_proc] += rows[t, cp_proc]
+    for t in sorted(range(dag.n), key=lambda x: ranks.rank_u[x], reverse=True):
+        if t not in on_path:
+            p = min(range(processors), key=lambda x: loads[x] + rows[t, x])
+            individual[t] = p
+            loads[p] += rows[t, p]
+    return individual
+
+
+@instrument.timed("ga.fitness")
+def fitness(individual: List[int], tasks, edges, processors: int, dag: Optional[CompiledDAG] = None) -> float:
     """
     Step 5: Fungsi fitness.
     Pakai MAKESPAN berbasis DAG (compute_task_times dari evaluate.py).
     """
-    proc_assignment = {i: individual[i] for i in range(len(individual))}
-    _, aft = compute_task_times(proc_assignment, tasks, edges, processors)
+    _, aft = compute_task_times(individual, tasks, edges, processors, dag)
     makespan = max(aft) if aft else 0.0
     return makespan
 
 
-def tournament_select(population: List[List[int]], tasks, edges, processors: int, k: int = 3) -> List[int]:
+@instrument.timed("ga.fitness_batch")
+def fitness_batch(population, tasks, edges, processors: int, dag: Optional[CompiledDAG] = None) -> np.ndarray:
+    """
+    Step 5 (versi populasi): makespan seluruh populasi dalam satu pass
+    tervektorisasi (compute_task_times_batch dari evaluate.py).
+    """
+    _, aft = compute_task_times_batch(population, tasks, edges, processors, dag)
+    if aft.shape[1] == 0:
+        return np.zeros(aft.shape[0])
+    return aft.max(axis=1)
+
+
+class FitnessCache:
+    """
+    Cache fitness (makespan) berukuran terbatas dengan eviction LRU.
+    Kunci = isi byte kromosom, jadi elit, kontestan turnamen, dan anak
+    duplikat hasil crossover/mutasi cukup dievaluasi sekali.
+
+    Satu cache hanya berlaku untuk satu DAG + jumlah prosesor yang sama.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evaluations = 0  # jumlah kromosom yang benar-benar dievaluasi
+        self._data: "OrderedDict[bytes, float]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @staticmethod
+    def key(individual: Sequence[int]) -> bytes:
+        return np.asarray(individual, dtype=np.int64).tobytes()
+
+    def __contains__(self, key: bytes) -> bool:
+        return key in self._data
+
+    def within_budget(self, population, budget: int, known=None):
+        """
+        Bagian populasi yang bisa dinilai dengan paling banyak `budget` evaluasi
+        baru: individu yang sudah dinilai (kuncinya ada di `known`, default
+        cache ini), plus kromosom baru (unik) pertama sampai anggaran habis.
+        Urutan populasi dipertahankan.
+        """
+        known = self._data if known is None else known
+        kept, fresh = [], set()
+        for ind in population:
+            key = self.key(ind)
+            if key in known or key in fresh:
+                kept.append(ind)
+            elif len(fresh) < budget:
+                fresh.add(key)
+                kept.append(ind)
+        return kept
+
+    def get(self, key: bytes) -> Optional[float]:
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._data.move_to_end(key)
+        return value
+
+    def put(self, key: bytes, value: float) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def fitness(self, individual: List[int], tasks, edges, processors: int, dag: Optional[CompiledDAG] = None) -> float:
+        """fitness() dengan lookup cache."""
+        key = self.key(individual)
+        value = self.get(key)
+        if value is None:
+            value = fitness(individual, tasks, edges, processors, dag)
+            self.evaluations += 1
+            self.put(key, value)
+        return value
+
+    def fitness_batch(self, population, tasks, edges, processors: int, dag: Optional[CompiledDAG] = None) -> List[float]:
+        """
+        fitness_batch() dengan lookup cache: hanya kromosom yang belum
+        pernah dilihat (dan unik) yang masuk ke evaluator tervektorisasi.
+        """
+        keys = [self.key(ind) for ind in population]
+        values: List[Optional[float]] = [self.get(k) for k in keys]
+
+        pending = {}
+        for k, v, ind in zip(keys, values, population):
+            if v is None and k not in pending:
+                pending[k] = ind
+
+        if pending:
+            makespans = fitness_batch(list(pending.values()), tasks, edges, processors, dag).tolist()
+            self.evaluations += len(pending)
+            fresh = dict(zip(pending.keys(), makespans))
+            for k, v in fresh.items():
+                self.put(k, v)
+            values = [fresh[k] if v is None else v for k, v in zip(keys, values)]
+
+        return values
+
+
+def tournament_select(
+    population: List[List[int]],
+    tasks,
+    edges,
+    processors: int,
+    k: int = 3,
+    dag: Optional[CompiledDAG] = None,
+    cache: Optional[FitnessCache] = None,
+) -> List[int]:
     """
     Step 6: Seleksi (tournament selection).
+    Kalau cache diberikan, fitness kontestan diambil dari cache.
     """
     contenders = random.sample(population, k)
-    best = min(contenders, key=lambda ind: fitness(ind, tasks, edges, processors))
+    if cache is not None:
+        best = min(contenders, key=lambda ind: cache.fitness(ind, tasks, edges, processors, dag))
+    else:
+        best = min(contenders, key=lambda ind: fitness(ind, tasks, edges, processors, dag))
     return best
 
 
@@ -104,7 +272,117 @@ def mutate(individual: List[int], processors: int, mut_rate: float) -> List[int]
     return individual
 
 
-def ga_schedule(tasks, edges, processors: int = 4, pop_size: int = 30, gens: int = 40, mut_rate: float = 0.1):
+def fitness_delta(
+    child: List[int],
+    parents: Sequence[List[int]],
+    times: Dict[bytes, Tuple[List[float], List[float]]],
+    processors: int,
+    dag: CompiledDAG,
+) -> Tuple[List[float], List[float]]:
+    """
+    Step 5 (versi inkremental): AST/AFT anak dari AST/AFT salah satu parent
+    (compute_task_times_delta). Dipilih parent yang gen berbedanya paling
+    belakang di urutan topologis, jadi prefix yang dipakai ulang paling panjang
+    (untuk one-point crossover, prefix dari parent yang sama langsung terpakai).
+
+    times: kunci kromosom (FitnessCache.key) -> (AST, AFT) parent
+    """
+    n = len(child)
+    topo_pos = dag.topo_pos
+    best = None
+    for parent in parents:
+        changed = [t for t, a, b in zip(range(n), child, parent) if a != b]
+        first = min((topo_pos[t] for t in changed), default=n)
+        if best is None or first > best[0]:
+            best = (first, parent, changed)
+
+    _, parent, changed = best
+    ast, aft = times[FitnessCache.key(parent)]
+    return compute_task_times_delta(child, parent, ast, aft, processors, dag, changed)
+
+
+class StopCriteria:
+    """
+    Kriteria berhenti lebih awal GA (lihat parameter stagnation/time_limit/
+    max_evals/lower_bound di ga_schedule). update() dicek di akhir tiap
+    generasi; evals_left() dan out_of_time() dipakai di dalam generasi supaya
+    max_evals tidak pernah terlampaui dan time_limit tidak menunggu satu
+    generasi penuh.
+    """
+
+    def __init__(self, cache, dag, processors, stagnation=None, time_limit=None, max_evals=None, lower_bound=None):
+        self.start = time.perf_counter()
+        self.cache = cache
+        self.evals_start = cache.evaluations
+        self.stagnation = stagnation
+        self.time_limit = time_limit
+        if max_evals is not None and max_evals < 1:
+            raise ValueError("max_evals harus >= 1.")
+        self.max_evals = max_evals
+        self.lower_bound = dag.makespan_lower_bound(processors) if lower_bound is True else lower_bound
+        self.best = float("inf")
+        self.stale = 0
+        self.reason = "gens"
+
+    def evals_left(self) -> Optional[int]:
+        """Sisa anggaran evaluasi fitness (None = tanpa batas)."""
+        if self.max_evals is None:
+            return None
+        return max(0, self.max_evals - (self.cache.evaluations - self.evals_start))
+
+    def out_of_time(self) -> bool:
+        if self.time_limit is not None and time.perf_counter() - self.start >= self.time_limit:
+            self.reason = "time_limit"
+            return True
+        return False
+
+    def update(self, best_fitness: float) -> bool:
+        """Catat best_fitness generasi ini; True kalau GA sebaiknya berhenti."""
+        if best_fitness < self.best:
+            self.best = best_fitness
+            self.stale = 0
+        else:
+            self.stale += 1
+
+        if self.lower_bound is not None and best_fitness <= self.lower_bound + 1e-9:
+            self.reason = "lower_bound"
+        elif self.stagnation and self.stale >= self.stagnation:
+            self.reason = "stagnation"
+        elif self.time_limit is not None and time.perf_counter() - self.start >= self.time_limit:
+            self.reason = "time_limit"
+        elif self.max_evals is not None and self.cache.evaluations - self.evals_start >= self.max_evals:
+            self.reason = "max_evals"
+        return self.reason != "gens"
+
+    def summary(self, generations: int) -> dict:
+        return {
+            "generations": generations,
+            "evaluations": self.cache.evaluations - self.evals_start,
+            "stop_reason": self.reason,
+        }
+
+
+@instrument.timed("ga")
+def ga_schedule(
+    tasks,
+    edges,
+    processors: int = 4,
+    pop_size: int = 30,
+    gens: int = 40,
+    mut_rate: float = 0.1,
+    dag: Optional[CompiledDAG] = None,
+    cache: Optional[FitnessCache] = None,
+    incremental: bool = False,
+    stagnation: Optional[int] = None,
+    time_limit: Optional[float] = None,
+    max_evals: Optional[int] = None,
+    lower_bound: Union[None, bool, float] = None,
+    stats: Optional[dict] = None,
+    seeds: Optional[Sequence[Sequence[int]]] = None,
+    seed_fraction: float = 0.5,
+    seed_perturb: float = 0.1,
+    order: Optional[Sequence[int]] = None,
+):
     """
     Mengimplementasikan 10 tahap GA:
 
@@ -118,25 +396,88 @@ def ga_schedule(tasks, edges, processors: int = 4, pop_size: int = 30, gens: int
     8) mutasi          -> mutate()
     9) iterasi         -> loop 'gens' generasi
     10) output         -> individu terbaik & makespan-nya
+
+    dag: CompiledDAG (opsional). Kalau tidak diberikan, dibangun sekali di sini
+    lalu dipakai ulang di setiap evaluasi fitness.
+    cache: FitnessCache (opsional). Kalau tidak diberikan, dibuat cache baru;
+    berikan sendiri kalau ingin membaca counter hits/misses setelahnya.
+    incremental: simpan AST/AFT tiap individu dan evaluasi anak hasil
+    crossover/mutasi secara inkremental dari parent-nya (fitness_delta),
+    bukan simulasi ulang dari awal. Hasil GA identik, lebih hemat untuk DAG besar.
+
+    Kriteria berhenti lebih awal (None = nonaktif):
+    stagnation : berhenti kalau best_fitness tidak membaik selama K generasi
+    time_limit : batas waktu (detik) sejak fungsi dipanggil, dicek juga di
+                 tengah pembentukan generasi baru
+    max_evals  : batas keras jumlah evaluasi fitness (cache.evaluations);
+                 generasi terakhir dipotong supaya tidak terlampaui
+    lower_bound: makespan yang tidak mungkin dilampaui (True = pakai
+                 dag.makespan_lower_bound); populasi awal disisipi bound_seed
+                 dan GA berhenti begitu mencapainya
+    stats      : dict (opsional) yang diisi generations, evaluations, stop_reason
+
+    seeds: kromosom awal (mis. assignment HEFT sebagai list) yang disisipkan
+    ke populasi awal beserta varian termutasinya (lihat inject_seeds).
+    Karena ada elitism, hasil GA tidak pernah lebih buruk dari seed terbaik.
+    order: urutan dekode semua kromosom (harus topologis, default dag.topo),
+    mis. heft.schedule_order jadwal HEFT insertion: dengan urutan itu seed HEFT
+    didekode ke jadwal yang tidak lebih lambat dari HEFT. Evaluasi hasilnya
+    dengan order yang sama (evaluate_schedule(..., order)).
     """
     n = len(tasks)
     if n == 0:
         return [], 0.0
 
+    if dag is None:
+        dag = compile_dag(tasks, edges)
+    if order is not None:
+        dag = dag.with_topo(order)
+    if cache is None:
+        cache = FitnessCache()
+    stopper = StopCriteria(cache, dag, processors, stagnation, time_limit, max_evals, lower_bound)
+    generation = 0
+
     # Step 2: prioritas tugas
-    priorities = compute_priorities(tasks, edges)
+    priorities = compute_priorities(tasks, edges, dag)
 
     # Step 3–4: inisialisasi populasi
     population = init_population(pop_size, n, processors, priorities, tasks)
+    if lower_bound is not None and lower_bound is not False:
+        seeds = list(seeds or []) + [bound_seed(dag, processors)]
+    if seeds:
+        inject_seeds(population, seeds, processors, seed_fraction, seed_perturb)
 
     # Tracking solusi terbaik global
     best_individual = None
     best_fitness = float("inf")
 
+    # mode inkremental: kunci kromosom -> (AST, AFT) untuk populasi saat ini
+    times: Dict[bytes, Tuple[List[float], List[float]]] = {}
+
     # Step 9: iterasi GA
-    for _ in range(gens):
+    for generation in range(1, gens + 1):
+        # anggaran evaluasi: generasi yang tidak muat dipotong, bukan dilampaui
+        budget = stopper.evals_left()
+        if budget is not None:
+            population = cache.within_budget(population, budget, times if incremental else None)
+            if not population:
+                stopper.reason = "max_evals"
+                break
+
         # Hitung fitness semua individu
-        scored = [(ind, fitness(ind, tasks, edges, processors)) for ind in population]
+        if incremental:
+            makespans = []
+            for ind in population:
+                key = cache.key(ind)
+                if key not in times:
+                    times[key] = compute_task_times(ind, tasks, edges, processors, dag)
+                    cache.evaluations += 1
+                makespans.append(max(times[key][1]))
+                cache.put(key, makespans[-1])
+        else:
+            # cache + satu pass tervektorisasi
+            makespans = cache.fitness_batch(population, tasks, edges, processors, dag)
+        scored = list(zip(population, makespans))
         scored.sort(key=lambda x: x[1])
 
         # Update solusi terbaik
@@ -144,13 +485,23 @@ def ga_schedule(tasks, edges, processors: int = 4, pop_size: int = 30, gens: int
             best_fitness = scored[0][1]
             best_individual = scored[0][0][:]
 
+        # Kriteria berhenti lebih awal
+        if stopper.update(best_fitness):
+            break
+
         # Elitism: bawa 1 individu terbaik ke generasi berikutnya
         new_population: List[List[int]] = [scored[0][0][:]]
+        new_times = {}
+        if incremental:
+            elite_key = cache.key(scored[0][0])
+            new_times[elite_key] = times[elite_key]
 
         # Bangun populasi baru via seleksi, crossover, mutasi
         while len(new_population) < pop_size:
-            p1 = tournament_select(population, tasks, edges, processors)
-            p2 = tournament_select(population, tasks, edges, processors)
+            if stopper.out_of_time():
+                break
+            p1 = tournament_select(population, tasks, edges, processors, dag=dag, cache=cache)
+            p2 = tournament_select(population, tasks, edges, processors, dag=dag, cache=cache)
 
             c1, c2 = crossover(p1, p2)
             mutate(c1, processors, mut_rate)
@@ -160,7 +511,231 @@ def ga_schedule(tasks, edges, processors: int = 4, pop_size: int = 30, gens: int
             if len(new_population) < pop_size:
                 new_population.append(c2)
 
+            if incremental:
+                for child in new_population[-2:]:
+                    key = cache.key(child)
+                    if key not in new_times and stopper.evals_left() != 0:
+                        new_times[key] = fitness_delta(child, (p1, p2), times, processors, dag)
+                        cache.evaluations += 1
+
+        if stopper.reason == "time_limit":
+            break
         population = new_population
+        times = new_times
+
+    summary = stopper.summary(generation)
+    instrument.count("ga.generations", summary["generations"])
+    instrument.count("ga.evaluations", summary["evaluations"])
+    instrument.count("ga.cache_hits", cache.hits)
+    if stats is not None:
+        stats.update(summary)
 
     # Step 10: output -> kromosom terbaik & makespan-nya
-    return best_individual, best_fitness
\ No newline at end of file
+    return best_individual, best_fitness
+
+# ---------------------------------------------------------------------------
+# Encoding berurutan: kromosom = (assignment task -> prosesor, urutan task).
+# Urutan selalu topologis valid, dan didekode oleh compute_task_times(order=...)
+# sehingga GA juga bisa mencari urutan eksekusi per prosesor, bukan hanya
+# urutan BFS tetap dari dag.topo.
+# ---------------------------------------------------------------------------
+
+
+def init_order_population(
+    pop_size: int,
+    n: int,
+    processors: int,
+    priorities,
+    tasks,
+    dag: CompiledDAG,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Step 3–4 (versi berurutan): populasi sebagai array (pop_size, n).
+    assignment dari init_population; urutan awal = prioritas menurun
+    (seri dipecah dengan posisi topologis, jadi tetap valid).
+    """
+    assign = np.array(init_population(pop_size, n, processors, priorities, tasks), dtype=np.int64).reshape(pop_size, n)
+    topo_pos = dag.topo_pos
+    base = sorted(range(n), key=lambda t: (-priorities[t], topo_pos[t]))
+    if not dag.is_topological_order(base):
+        base = list(dag.topo)
+    order = np.tile(np.asarray(base, dtype=np.int64), (pop_size, 1))
+    return assign, order
+
+
+def order_crossover(
+    assign1: np.ndarray,
+    order1: np.ndarray,
+    assign2: np.ndarray,
+    order2: np.ndarray,
+    out_assign: np.ndarray,
+    out_order: np.ndarray,
+    cut_assign: int,
+    cut_order: int,
+    taken: np.ndarray,
+) -> None:
+    """
+    Step 7 (versi berurutan), ditulis langsung ke array keluaran:
+    - assignment: one-point crossover biasa di titik cut_assign
+    - urutan    : prefix order1[:cut_order], sisanya task yang belum terambil
+                  dalam urutan kemunculannya di order2. Kalau kedua parent
+                  topologis valid, anak juga valid.
+    taken: array bool (n,) untuk kerja sementara
+    """
+    out_assign[:cut_assign] = assign1[:cut_assign]
+    out_assign[cut_assign:] = assign2[cut_assign:]
+
+    taken[:] = False
+    taken[order1[:cut_order]] = True
+    out_order[:cut_order] = order1[:cut_order]
+    out_order[cut_order:] = order2[~taken[order2]]
+
+
+def swap_mutate(order: np.ndarray, dag: CompiledDAG, swaps: int, rng: np.random.Generator) -> None:
+    """
+    Step 8 (versi berurutan): coba `swaps` kali menukar dua task di urutan.
+    Task u di posisi i ditukar dengan task v di posisi j (i < j) hanya kalau
+    semua successor u ada setelah j dan semua predecessor v ada sebelum i,
+    jadi urutan tetap topologis valid.
+    """
+    n = order.shape[0]
+    if n < 2 or swaps <= 0:
+        return
+    pos = np.empty(n, dtype=np.int64)
+    pos[order] = np.arange(n)
+    succs = dag.succs
+    preds = dag.preds
+
+    for i in rng.integers(0, n - 1, size=swaps).tolist():
+        u = int(order[i])
+        hi = min((int(pos[s]) for s, _ in succs[u]), default=n) - 1
+        if hi <= i:
+            continue
+        j = int(rng.integers(i + 1, hi + 1))
+        v = int(order[j])
+        if any(pos[p] >= i for p, _ in preds[v]):
+            continue
+        order[i], order[j] = v, u
+        pos[u], pos[v] = j, i
+
+
+@instrument.timed("ga")
+def ga_schedule_ordered(
+    tasks,
+    edges,
+    processors: int = 4,
+    pop_size: int = 30,
+    gens: int = 40,
+    mut_rate: float = 0.1,
+    swap_rate: Optional[float] = None,
+    dag: Optional[CompiledDAG] = None,
+    cache: Optional[FitnessCache] = None,
+    seeds: Optional[Sequence[Tuple[Sequence[int], Sequence[int]]]] = None,
+    stagnation: Optional[int] = None,
+    time_limit: Optional[float] = None,
+    max_evals: Optional[int] = None,
+    lower_bound: Union[None, bool, float] = None,
+    stats: Optional[dict] = None,
+):
+    """
+    GA dengan kromosom berurutan (assignment + urutan eksekusi).
+    Tahapannya sama dengan ga_schedule (elitism 1, turnamen k=3), tetapi
+    populasi disimpan di dua pasang array (pop_size, n) yang dipakai
+    bergantian antar generasi; operator menulis langsung ke baris array.
+
+    swap_rate: peluang percobaan swap per posisi urutan (default = mut_rate)
+    seeds    : pasangan (assignment, urutan) awal, mis. jadwal HEFT dengan
+               urutan heft.schedule_order; masuk utuh ke populasi awal
+    Kriteria berhenti sama dengan ga_schedule (lihat StopCriteria); max_evals
+    dan time_limit dicek per individu yang dinilai.
+    Return: (assignment terbaik, urutan terbaik, makespan terbaik)
+    """
+    n = len(tasks)
+    if n == 0:
+        return [], [], 0.0
+
+    if dag is None:
+        dag = compile_dag(tasks, edges)
+    if cache is None:
+        cache = FitnessCache()
+    if swap_rate is None:
+        swap_rate = mut_rate
+    stopper = StopCriteria(cache, dag, processors, stagnation, time_limit, max_evals, lower_bound)
+    rng = np.random.default_rng(random.getrandbits(64))
+
+    # Step 2–4
+    priorities = compute_priorities(tasks, edges, dag)
+    assign, order = init_order_population(pop_size, n, processors, priorities, tasks, dag)
+    if lower_bound is not None and lower_bound is not False:
+        seeds = list(seeds or []) + [(bound_seed(dag, processors), dag.topo)]
+    for k, (seed_assign, seed_order) in enumerate((seeds or [])[:pop_size]):
+        if not dag.is_topological_order(seed_order):
+            raise ValueError("Urutan seed tidak topologis valid.")
+        assign[k] = seed_assign
+        order[k] = seed_order
+
+    next_assign = np.empty_like(assign)
+    next_order = np.empty_like(order)
+    taken = np.empty(n, dtype=bool)
+    fit = np.empty(pop_size)
+
+    best_assign = None
+    best_order = None
+    best_fitness = float("inf")
+    generation = 0
+
+    for generation in range(1, gens + 1):
+        # Step 5: decode (assignment, urutan) -> makespan, lewat cache
+        for k in range(pop_size):
+            key = assign[k].tobytes() + order[k].tobytes()
+            value = cache.get(key)
+            if value is None:
+                if stopper.evals_left() == 0 or (best_assign is not None and stopper.out_of_time()):
+                    fit[k:] = np.inf  # anggaran/waktu habis: sisa generasi tidak dinilai
+                    break
+                _, aft = compute_task_times(assign[k].tolist(), tasks, edges, processors, dag, order[k].tolist())
+                value = max(aft)
+                cache.evaluations += 1
+                cache.put(key, value)
+            fit[k] = value
+
+        elite = int(np.argmin(fit))
+        if fit[elite] < best_fitness:
+            best_fitness = float(fit[elite])
+            best_assign = assign[elite].tolist()
+            best_order = order[elite].tolist()
+        if stopper.update(best_fitness):
+            break
+
+        next_assign[0] = assign[elite]
+        next_order[0] = order[elite]
+
+        # Step 6–8: turnamen, crossover, mutasi -> langsung ke baris next_*
+        for k in range(1, pop_size):
+            p1, p2 = (
+                int(c[np.argmin(fit[c])])
+                for c in (rng.choice(pop_size, size=min(3, pop_size), replace=False) for _ in range(2))
+            )
+            order_crossover(
+                assign[p1], order[p1], assign[p2], order[p2],
+                next_assign[k], next_order[k],
+                int(rng.integers(1, n)) if n > 1 else n,
+                int(rng.integers(1, n)) if n > 1 else n,
+                taken,
+            )
+            mask = rng.random(n) < mut_rate
+            next_assign[k, mask] = rng.integers(0, processors, size=int(mask.sum()))
+            swap_mutate(next_order[k], dag, int(rng.binomial(n, swap_rate)), rng)
+
+        assign, next_assign = next_assign, assign
+        order, next_order = next_order, order
+
+    summary = stopper.summary(generation)
+    instrument.count("ga.generations", summary["generations"])
+    instrument.count("ga.evaluations", summary["evaluations"])
+    instrument.count("ga.cache_hits", cache.hits)
+    if stats is not None:
+        stats.update(summary)
+
+    # Step 10
+    return best_assign, best_order, best_fitness
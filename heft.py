@@ -1,6 +1,10 @@
 # heft.py
 
-from typing import Dict, List, Tuple
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+import instrument
+from compiled_dag import CompiledDAG, compile_dag
 
 
 def compute_ranku(
@@ -16,66 +20,211 @@ def compute_ranku(
 
     - w_i  : waktu komputasi task i
     - c_ij : waktu komunikasi dari i ke j
+
+    Versi iteratif (stack eksplisit), jadi chain panjang tidak kena batas
+    rekursi Python. Untuk semua task sekaligus, pakai CompiledDAG.rank_u
+    (compiled_dag.compute_ranks) yang berbasis array.
     """
-    if task in memo:
-        return memo[task]
-
-    if not succs[task]:
-        # task tanpa successor
-        memo[task] = cost_table[task]
-    else:
-        memo[task] = cost_table[task] + max(
-            comm.get((task, child), 0.0)
-            + compute_ranku(child, succs, cost_table, comm, memo)
-            for child in succs[task]
-        )
+    stack = [task]
+    while stack:
+        t = stack[-1]
+        if t in memo:
+            stack.pop()
+            continue
+
+        pending = [child for child in succs[t] if child not in memo]
+        if pending:
+            stack.extend(pending)
+            continue
+
+        stack.pop()
+        if not succs[t]:
+            # task tanpa successor
+            memo[t] = cost_table[t]
+        else:
+            memo[t] = cost_table[t] + max(
+                comm.get((t, child), 0.0) + memo[child]
+                for child in succs[t]
+            )
 
     return memo[task]
 
 
-def heft_schedule(tasks, edges, processors: int = 4):
+class ProcessorTimeline:
+    """
+    Slot waktu yang sudah terpakai di satu prosesor, disimpan terurut
+    (starts/finishes tidak overlap) dalam dua list datar. Bisect hanya
+    melompati slot yang selesai sebelum 'ready'; celah setelahnya dicek satu
+    per satu dan insert menggeser list, jadi keduanya O(k) untuk k slot.
+    Cukup untuk antrean pendek (simulator.TaskQueue); HEFT insertion-based
+    memakai BlockTimeline.
     """
-    Implementasi HEFT sesuai pernyataan kamu:
 
-    1) Menentukan prioritas setiap tugas berdasarkan urutan eksekusi
-       dan ketergantungan antar tugas (upward rank).
-    2) Menetapkan tugas ke prosesor yang memberikan waktu penyelesaian
-       (finish time) paling cepat, dengan memperhitungkan:
-       - waktu komputasi
-       - waktu komunikasi antar prosesor
+    __slots__ = ("starts", "finishes")
+
+    def __init__(self):
+        self.starts: List[float] = []
+        self.finishes: List[float] = []
+
+    @property
+    def avail(self) -> float:
+        """Waktu prosesor bebas kalau task hanya ditambahkan di akhir."""
+        return self.finishes[-1] if self.finishes else 0.0
+
+    def earliest_start(self, ready: float, duration: float) -> Tuple[float, int]:
+        """
+        Waktu mulai paling awal >= ready yang muat 'duration' di sebuah celah,
+        plus posisi sisipnya. Bisect langsung melompati semua slot yang sudah
+        selesai sebelum 'ready'; celah setelahnya dicek berurutan.
+        """
+        starts, finishes = self.starts, self.finishes
+        i = bisect_right(finishes, ready)
+        prev_end = ready
+
+        while i < len(starts):
+            if prev_end + duration <= starts[i]:
+                return prev_end, i
+            if finishes[i] > prev_end:
+                prev_end = finishes[i]
+            i += 1
+
+        return prev_end, i
+
+    def insert(self, pos: int, start: float, finish: float) -> None:
+        self.starts.insert(pos, start)
+        self.finishes.insert(pos, finish)
+
+
+class BlockTimeline:
+    """
+    Timeline satu prosesor untuk ribuan slot: slot terurut dipecah jadi blok
+    (maks 2 * BLOCK slot), tiap blok menyimpan celah idle terbesarnya.
+    Pencarian celah melompati blok yang celahnya terlalu kecil tanpa membuka
+    slotnya, dan sisip hanya menggeser satu blok, jadi biaya per task sekitar
+    O(log(k / BLOCK) + k / BLOCK + BLOCK), bukan O(k) seperti ProcessorTimeline.
+    Belum logaritmik: blok yang celahnya cukup tetap dicek satu per satu.
+    Antarmukanya sama: avail, earliest_start(ready, duration), insert(pos, ...).
+    """
+
+    BLOCK = 64
+    __slots__ = ("starts", "finishes", "max_gap", "ends")
+
+    def __init__(self):
+        self.starts: List[List[float]] = []    # per blok
+        self.finishes: List[List[float]] = []  # per blok
+        self.max_gap: List[float] = []         # celah terbesar DI DALAM blok
+        self.ends: List[float] = []            # finish terakhir tiap blok (untuk bisect)
+
+    @property
+    def avail(self) -> float:
+        return self.ends[-1] if self.ends else 0.0
+
+    def __len__(self):
+        return sum(len(s) for s in self.starts)
+
+    def earliest_start(self, ready: float, duration: float):
+        """(waktu mulai paling awal >= ready yang muat duration, posisi sisip (blok, indeks))."""
+        if not self.ends:
+            return ready, (0, 0)
+
+        b = bisect_right(self.ends, ready)
+        if b == len(self.ends):
+            return ready, (b - 1, len(self.starts[b - 1]))
+
+        # blok pertama: mulai dari slot pertama yang selesai setelah ready
+        starts, finishes = self.starts[b], self.finishes[b]
+        prev_end = ready
+        for i in range(bisect_right(finishes, ready), len(starts)):
+            if prev_end + duration <= starts[i]:
+                return prev_end, (b, i)
+            prev_end = finishes[i]
+
+        # blok berikutnya: celah antar blok dicek langsung, isi blok hanya
+        # dibuka kalau celah terbesarnya cukup
+        for bb in range(b + 1, len(self.ends)):
+            starts, finishes = self.starts[bb], self.finishes[bb]
+            if prev_end + duration <= starts[0]:
+                return prev_end, (bb, 0)
+            if self.max_gap[bb] >= duration:
+                for i in range(1, len(starts)):
+                    if finishes[i - 1] + duration <= starts[i]:
+                        return finishes[i - 1], (bb, i)
+            prev_end = finishes[-1]
+
+        last = len(self.ends) - 1
+        return prev_end, (last, len(self.starts[last]))
+
+    def insert(self, pos, start: float, finish: float) -> None:
+        b, i = pos
+        if not self.ends:
+            self.starts.append([start])
+            self.finishes.append([finish])
+            self.max_gap.append(0.0)
+            self.ends.append(finish)
+            return
+
+        starts, finishes = self.starts[b], self.finishes[b]
+        starts.insert(i, start)
+        finishes.insert(i, finish)
+        if len(starts) > 2 * self.BLOCK:
+            half = len(starts) // 2
+            self.starts[b:b + 1] = [starts[:half], starts[half:]]
+            self.finishes[b:b + 1] = [finishes[:half], finishes[half:]]
+            self.max_gap[b:b + 1] = [0.0, 0.0]
+            self.ends[b:b + 1] = [finishes[half - 1], finishes[-1]]
+            self._refresh(b)
+            self._refresh(b + 1)
+        else:
+            self.ends[b] = finishes[-1]
+            self._refresh(b)
+
+    def _refresh(self, b):
+        starts, finishes = self.starts[b], self.finishes[b]
+        self.max_gap[b] = max((starts[i] - finishes[i - 1] for i in range(1, len(starts))), default=0.0)
+
+
+@instrument.timed("heft")
+def heft_schedule_times(
+    tasks,
+    edges,
+    processors: int = 4,
+    dag: Optional[CompiledDAG] = None,
+    insertion: bool = False,
+):
+    """
+    Inti HEFT: kembalikan (assignment, AST, AFT) dalam bentuk dict per task.
+
+    insertion=False : task hanya ditambahkan di akhir antrean prosesor
+                      (perilaku asli heft_schedule).
+    insertion=True  : kebijakan insertion-based dari paper HEFT asli; task boleh
+                      mengisi celah idle (mis. akibat delay komunikasi) selama
+                      muat di antara dua task yang sudah terjadwal.
     """
     n = len(tasks)
     if n == 0:
-        return {}, 0.0
+        return {}, {}, {}
+
+    # --- struktur DAG: predecessor, successor, dan biaya komunikasi ---
+    if dag is None:
+        dag = compile_dag(tasks, edges)
+    dag.check_processors(processors)
+    instrument.count("heft.processors_probed", n * processors)
 
-    # --- tabel biaya komputasi (anggap sama untuk semua prosesor) ---
-    cost_table = [t["cost"] for t in tasks]
-
-    # --- bangun struktur DAG: predecessor, successor, dan biaya komunikasi ---
-    preds = {i: [] for i in range(n)}
-    succs = {i: [] for i in range(n)}
-    comm: Dict[Tuple[int, int], float] = {}
-
-    for e in edges:
-        s = e["src"]
-        d = e["dst"]
-        c = float(e.get("comm", 0.0) or 0.0)
-        preds[d].append(s)
-        succs[s].append(d)
-        comm[(s, d)] = c
-
-    # --- Tahap 1: hitung prioritas (upward rank) untuk setiap task ---
-    memo_rank = {}
-    rank_u = {
-        i: compute_ranku(i, succs, cost_table, comm, memo_rank)
-        for i in range(n)
-    }
+    # --- tabel biaya komputasi: cost_rows[t][p] kalau heterogen, kalau tidak
+    #     sama untuk semua prosesor ---
+    cost_table = dag.cost_list
+    cost_rows = dag.cost_rows
+    preds = dag.preds
+
+    # --- Tahap 1: prioritas (upward rank, biaya rata-rata) untuk setiap task ---
+    rank_u = dag.rank_u
 
     # urutkan task berdasarkan rank_u menurun
     order = sorted(range(n), key=lambda t: rank_u[t], reverse=True)
 
     # --- Tahap 2: penjadwalan ke prosesor dengan EFT minimum ---
     proc_avail = [0.0] * processors  # kapan tiap prosesor ready
+    timelines = [BlockTimeline() for _ in range(processors)] if insertion else None
     AST = {i: 0.0 for i in range(n)}  # Actual Start Time tiap task
     AFT = {i: 0.0 for i in range(n)}  # Actual Finish Time tiap task
     assignment: Dict[int, int] = {}   # task -> prosesor
@@ -84,29 +233,76 @@ def heft_schedule(tasks, edges, processors: int = 4):
         best_proc = 0
         best_finish = float("inf")
         best_start = 0.0
+        best_pos = 0
+        w = cost_rows[t] if cost_rows is not None else (cost_table[t],) * processors
 
         # coba tempatkan task t di setiap prosesor
         for p in range(processors):
             # waktu siap dari sisi dependency
             ready_pred = 0.0
-            for pred in preds[t]:
+            for pred, comm_time in preds[t]:
                 pred_proc = assignment[pred]
-                comm_time = comm.get((pred, t), 0.0) if pred_proc != p else 0.0
-                ready_pred = max(ready_pred, AFT[pred] + comm_time)
+                ready = AFT[pred] + comm_time if pred_proc != p else AFT[pred]
+                if ready > ready_pred:
+                    ready_pred = ready
 
-            est = max(proc_avail[p], ready_pred)           # earliest start time
-            eft = est + cost_table[t]                      # earliest finish time
+            if insertion:
+                est, pos = timelines[p].earliest_start(ready_pred, w[p])
+            else:
+                est, pos = max(proc_avail[p], ready_pred), 0  # earliest start time
+            eft = est + w[p]                                    # earliest finish time
 
             if eft < best_finish:
                 best_finish = eft
                 best_start = est
                 best_proc = p
+                best_pos = pos
 
         # fix: assign task t ke prosesor terbaik
         assignment[t] = best_proc
         AST[t] = best_start
         AFT[t] = best_finish
-        proc_avail[best_proc] = best_finish
+        if insertion:
+            timelines[best_proc].insert(best_pos, best_start, best_finish)
+        else:
+            proc_avail[best_proc] = best_finish
+
+    return assignment, AST, AFT
+
+
+def heft_schedule(
+    tasks,
+    edges,
+    processors: int = 4,
+    dag: Optional[CompiledDAG] = None,
+    insertion: bool = False,
+):
+    """
+    Implementasi HEFT sesuai pernyataan kamu:
+
+    1) Menentukan prioritas setiap tugas berdasarkan urutan eksekusi
+       dan ketergantungan antar tugas (upward rank).
+    2) Menetapkan tugas ke prosesor yang memberikan waktu penyelesaian
+       (finish time) paling cepat, dengan memperhitungkan:
+       - waktu komputasi
+       - waktu komunikasi antar prosesor
 
+    dag: CompiledDAG (opsional) -> struktur DAG + rank yang sudah di-cache
+    insertion: pakai kebijakan insertion-based (lihat heft_schedule_times)
+    """
+    if len(tasks) == 0:
+        return {}, 0.0
+
+    assignment, _, AFT = heft_schedule_times(tasks, edges, processors, dag, insertion)
     makespan = max(AFT.values()) if AFT else 0.0
-    return assignment, makespan
\ No newline at end of file
+    return assignment, makespan
+
+
+def schedule_order(AST, dag: CompiledDAG) -> List[int]:
+    """
+    Urutan eksekusi global dari sebuah jadwal (urut waktu mulai, seri dipecah
+    dengan posisi topologis). Dipakai evaluate supaya jadwal insertion-based
+    dievaluasi dengan urutan per prosesor yang sama, bukan urutan BFS.
+    """
+    topo_pos = dag.topo_pos
+    return sorted(range(dag.n), key=lambda t: (AST[t], topo_pos[t]))
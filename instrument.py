@@ -0,0 +1,138 @@
+# instrument.py
+# Instrumentasi opt-in: timer (context manager / decorator) dan counter per
+# fase pipeline (load CSV, compile, rank, HEFT, GA, evaluate, ...).
+# Default NONAKTIF; saat nonaktif timer() mengembalikan context kosong yang
+# sama terus dan count() langsung return, jadi biayanya praktis nol.
+#
+#   instrument.enable()
+#   with instrument.timer("heft"):
+#       ...
+#   instrument.count("ga.evaluations", 30)
+#   stats = instrument.snapshot()
+import csv
+import functools
+import os
+import time
+from contextlib import nullcontext
+
+_NULL = nullcontext()
+
+
+class _State:
+    enabled = False
+    timers = {}    # nama -> [jumlah panggilan, total detik]
+    counters = {}  # nama -> nilai
+
+
+def enable(flag: bool = True) -> None:
+    _State.enabled = bool(flag)
+
+
+def enabled() -> bool:
+    return _State.enabled
+
+
+def reset() -> None:
+    _State.timers = {}
+    _State.counters = {}
+
+
+class _Timer:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        entry = _State.timers.get(self.name)
+        if entry is None:
+            _State.timers[self.name] = [1, elapsed]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed
+        return False
+
+
+def timer(name: str):
+    """Context manager pengukur waktu; timer bersarang ikut terhitung di timer induknya."""
+    if not _State.enabled:
+        return _NULL
+    return _Timer(name)
+
+
+def timed(name: str):
+    """Decorator: seluruh pemanggilan fungsi diukur dengan timer(name)."""
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _State.enabled:
+                return fn(*args, **kwargs)
+            with _Timer(name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def count(name: str, value=1) -> None:
+    if not _State.enabled:
+        return
+    _State.counters[name] = _State.counters.get(name, 0) + value
+
+
+def snapshot() -> dict:
+    """Salinan statistik saat ini: {"timers": {nama: [calls, detik]}, "counters": {nama: nilai}}."""
+    return {
+        "timers": {name: list(entry) for name, entry in _State.timers.items()},
+        "counters": dict(_State.counters),
+    }
+
+
+def merge(total: dict, stats: dict) -> dict:
+    """Tambahkan stats (hasil snapshot) ke total (agregasi per sweep)."""
+    timers = total.setdefault("timers", {})
+    counters = total.setdefault("counters", {})
+    for name, (calls, seconds) in stats.get("timers", {}).items():
+        entry = timers.setdefault(name, [0, 0.0])
+        entry[0] += calls
+        entry[1] += seconds
+    for name, value in stats.get("counters", {}).items():
+        counters[name] = counters.get(name, 0) + value
+    return total
+
+
+def write_csv(stats: dict, out_path: str) -> None:
+    """Tulis stats ke CSV: kind,name,calls,value (value = detik untuk timer)."""
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["kind", "name", "calls", "value"])
+        for name, (calls, seconds) in sorted(stats.get("timers", {}).items()):
+            writer.writerow(["timer", name, calls, seconds])
+        for name, value in sorted(stats.get("counters", {}).items()):
+            writer.writerow(["counter", name, "", value])
+    os.replace(tmp_path, out_path)
+
+
+def summary(stats: dict, dags: int = 0) -> str:
+    """Ringkasan teks: timer diurutkan dari total waktu terbesar, lalu counter."""
+    lines = []
+    timers = sorted(stats.get("timers", {}).items(), key=lambda kv: kv[1][1], reverse=True)
+    if timers:
+        lines.append(f"{'timer':<24} {'calls':>8} {'total s':>10} {'per DAG ms':>11}")
+        for name, (calls, seconds) in timers:
+            per_dag = seconds / dags * 1000 if dags else float("nan")
+            lines.append(f"{name:<24} {calls:>8} {seconds:>10.3f} {per_dag:>11.2f}")
+    counters = sorted(stats.get("counters", {}).items())
+    if counters:
+        lines.append(f"{'counter':<24} {'total':>8}")
+        for name, value in counters:
+            lines.append(f"{name:<24} {value:>8}")
+    return "\n".join(lines)
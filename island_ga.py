@@ -0,0 +1,275 @@
+# island_ga.py
+# GA model pulau (island model): beberapa sub-populasi berevolusi paralel di
+# proses terpisah, dan tiap `migration_interval` generasi individu elit
+# dikirim ke pulau tetangga lewat shared memory.
+import multiprocessing as mp
+import random
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+import instrument
+from compiled_dag import CompiledDAG, compile_dag
+from ga_scheduler import (
+    FitnessCache,
+    compute_priorities,
+    crossover,
+    init_population,
+    inject_seeds,
+    mutate,
+    tournament_select,
+)
+
+TOPOLOGIES = ("ring", "full")
+
+
+def migration_sources(island: int, islands: int, topology: str = "ring") -> List[int]:
+    """Pulau asal migran untuk sebuah pulau (ring: tetangga kiri, full: semua pulau lain)."""
+    if topology == "ring":
+        return [(island - 1) % islands] if islands > 1 else []
+    if topology == "full":
+        return [j for j in range(islands) if j != island]
+    raise ValueError(f"topology harus salah satu dari {TOPOLOGIES}, bukan {topology!r}.")
+
+
+class Island:
+    """
+    Satu sub-populasi GA dengan state RNG sendiri, jadi hasilnya sama persis
+    baik dijalankan di proses sendiri maupun bergiliran di satu proses.
+    Langkah per generasi sama dengan ga_schedule (elitism 1, turnamen,
+    one-point crossover, mutasi random reset).
+    """
+
+    def __init__(self, seed, tasks, edges, processors, pop_size, mut_rate, dag, priorities, seeds=None):
+        self.tasks = tasks
+        self.edges = edges
+        self.processors = processors
+        self.pop_size = pop_size
+        self.mut_rate = mut_rate
+        self.dag = dag
+        self.cache = FitnessCache()
+        self.best_individual = None
+        self.best_fitness = float("inf")
+        self.trace: List[float] = []
+
+        saved = random.getstate()
+        random.seed(seed)
+        self.population = init_population(pop_size, len(tasks), processors, priorities, tasks)
+        if seeds:
+            inject_seeds(self.population, seeds, processors)
+        self.rng_state = random.getstate()
+        random.setstate(saved)
+
+    def _fitness(self, population):
+        return self.cache.fitness_batch(population, self.tasks, self.edges, self.processors, self.dag)
+
+    def evolve(self, gens: int) -> None:
+        """Jalankan `gens` generasi; trace mencatat makespan terbaik tiap generasi."""
+        saved = random.getstate()
+        random.setstate(self.rng_state)
+
+        for _ in range(gens):
+            scored = sorted(zip(self.population, self._fitness(self.population)), key=lambda x: x[1])
+            if scored[0][1] < self.best_fitness:
+                self.best_fitness = scored[0][1]
+                self.best_individual = scored[0][0][:]
+            self.trace.append(self.best_fitness)
+
+            new_population = [scored[0][0][:]]
+            while len(new_population) < self.pop_size:
+                p1 = tournament_select(self.population, self.tasks, self.edges, self.processors,
+                                       dag=self.dag, cache=self.cache)
+                p2 = tournament_select(self.population, self.tasks, self.edges, self.processors,
+                                       dag=self.dag, cache=self.cache)
+                c1, c2 = crossover(p1, p2)
+                mutate(c1, self.processors, self.mut_rate)
+                mutate(c2, self.processors, self.mut_rate)
+                new_population.append(c1)
+                if len(new_population) < self.pop_size:
+                    new_population.append(c2)
+            self.population = new_population
+
+        self.rng_state = random.getstate()
+        random.setstate(saved)
+
+    def elites(self, k: int) -> List[Tuple[List[int], float]]:
+        """k individu terbaik populasi saat ini beserta makespan-nya."""
+        scored = sorted(zip(self.population, self._fitness(self.population)), key=lambda x: x[1])
+        return [(ind[:], fit) for ind, fit in scored[:k]]
+
+    def receive(self, migrants: List[Tuple[List[int], float]]) -> None:
+        """Migran menggantikan individu terburuk (fitness migran langsung masuk cache)."""
+        if not migrants:
+            return
+        order = np.argsort(self._fitness(self.population), kind="stable")
+        worst = order[::-1][:min(len(migrants), self.pop_size - 1)]
+        for slot, (ind, fit) in zip(worst.tolist(), migrants):
+            self.population[slot] = list(ind)
+            self.cache.put(self.cache.key(ind), fit)
+
+
+def _epochs(gens: int, interval: int) -> List[int]:
+    # jumlah generasi per epoch; migrasi terjadi di antara epoch
+    interval = max(1, interval) if interval else gens
+    return [min(interval, gens - g) for g in range(0, gens, max(1, interval))]
+
+
+def _post(buffers, slot, island_idx, island, migrants):
+    genes, fits = buffers
+    for k, (ind, fit) in enumerate(island.elites(migrants)):
+        genes[slot, island_idx, k] = ind
+        fits[slot, island_idx, k] = fit
+
+
+def _collect(buffers, slot, sources):
+    genes, fits = buffers
+    return [
+        (genes[slot, j, k].tolist(), float(fits[slot, j, k]))
+        for j in sources
+        for k in range(genes.shape[2])
+    ]
+
+
+# state per proses worker (diisi oleh _init_worker)
+_WORKER = {}
+
+
+def _init_worker(barrier, shm_name, shape):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _WORKER["shm"] = shm
+    _WORKER["barrier"] = barrier
+    _WORKER["buffers"] = _buffer_views(shm.buf, shape)
+
+
+def _buffer_views(buf, shape):
+    # dua slot (double buffering) x pulau x migran: gen (int32) + makespan (float64)
+    genes = np.ndarray(shape, dtype=np.int32, buffer=buf)
+    offset = genes.nbytes
+    fits = np.ndarray(shape[:3], dtype=np.float64, buffer=buf, offset=offset)
+    return genes, fits
+
+
+def _buffer_size(shape):
+    return int(np.prod(shape)) * 4 + int(np.prod(shape[:3])) * 8
+
+
+def _run_island(job):
+    # satu pulau per proses; semua pulau bertemu di barrier setiap migrasi
+    index, seed, problem, settings = job
+    tasks, edges, processors, dag = problem
+    sources = migration_sources(index, settings["islands"], settings["topology"])
+    buffers = _WORKER["buffers"]
+
+    island = Island(seed, tasks, edges, processors, settings["pop_size"], settings["mut_rate"],
+                    dag, compute_priorities(tasks, edges, dag), settings["seeds"])
+    epochs = _epochs(settings["gens"], settings["migration_interval"])
+    for epoch, gens in enumerate(epochs):
+        island.evolve(gens)
+        if epoch + 1 < len(epochs):
+            slot = epoch % 2
+            _post(buffers, slot, index, island, settings["migrants"])
+            _WORKER["barrier"].wait()
+            island.receive(_collect(buffers, slot, sources))
+
+    return island.best_individual, island.best_fitness, island.trace
+
+
+@instrument.timed("island_ga")
+def island_ga_schedule(
+    tasks,
+    edges,
+    processors: int = 4,
+    islands: int = 4,
+    pop_size: int = 30,
+    gens: int = 40,
+    mut_rate: float = 0.1,
+    migration_interval: int = 5,
+    migrants: int = 1,
+    topology: str = "ring",
+    parallel: Optional[bool] = None,
+    seed: Optional[int] = None,
+    dag: Optional[CompiledDAG] = None,
+    seeds=None,
+    order=None,
+):
+    """
+    GA model pulau.
+
+    islands           : jumlah sub-populasi (masing-masing pop_size individu)
+    migration_interval: migrasi setiap sekian generasi (0 = tanpa migrasi)
+    migrants          : jumlah elit yang dikirim tiap pulau per migrasi
+    topology          : "ring" (ke pulau berikutnya) atau "full" (ke semua pulau)
+    parallel          : True = satu proses per pulau (migrasi lewat shared
+                        memory); False = bergiliran di proses ini; None = otomatis
+                        (serial kalau dipanggil dari worker daemon, mis. Pool di main.py)
+    seed              : seed dasar; pulau ke-i memakai seed * 1_000_003 + i.
+                        Kalau None, diambil dari modul random (ikut random.seed).
+    seeds             : kromosom awal (mis. assignment HEFT) yang disisipkan ke
+                        populasi awal setiap pulau (lihat ga_scheduler.inject_seeds)
+    order             : urutan dekode semua kromosom (lihat ga_scheduler.ga_schedule)
+
+    Hasil identik untuk parallel=True/False dengan seed yang sama.
+    Return: (best_individual, best_fitness, traces), traces[i] = makespan
+    terbaik pulau ke-i per generasi (kurva konvergensi).
+    """
+    migration_sources(0, islands, topology)  # validasi topology
+    n = len(tasks)
+    if n == 0:
+        return [], 0.0, [[] for _ in range(islands)]
+
+    if dag is None:
+        dag = compile_dag(tasks, edges)
+    if order is not None:
+        dag = dag.with_topo(order)
+    if seed is None:
+        seed = random.getrandbits(32)
+    if parallel is None:
+        parallel = islands > 1 and not mp.current_process().daemon
+
+    migrants = max(0, min(migrants, pop_size - 1))
+    settings = {
+        "islands": islands,
+        "pop_size": pop_size,
+        "gens": gens,
+        "mut_rate": mut_rate,
+        "migration_interval": migration_interval if migrants else 0,
+        "migrants": migrants,
+        "topology": topology,
+        "seeds": seeds,
+    }
+    island_seeds = [seed * 1_000_003 + i for i in range(islands)]
+    shape = (2, islands, max(1, migrants), n)
+
+    if parallel:
+        shm = shared_memory.SharedMemory(create=True, size=_buffer_size(shape))
+        try:
+            barrier = mp.Barrier(islands)
+            problem = (tasks, edges, processors, dag)
+            jobs = [(i, island_seeds[i], problem, settings) for i in range(islands)]
+            with mp.Pool(islands, initializer=_init_worker, initargs=(barrier, shm.name, shape)) as pool:
+                results = pool.map(_run_island, jobs, chunksize=1)
+        finally:
+            shm.close()
+            shm.unlink()
+    else:
+        buffers = _buffer_views(bytearray(_buffer_size(shape)), shape)
+        priorities = compute_priorities(tasks, edges, dag)
+        pool_islands = [
+            Island(s, tasks, edges, processors, pop_size, mut_rate, dag, priorities, settings["seeds"])
+            for s in island_seeds
+        ]
+        epochs = _epochs(gens, settings["migration_interval"])
+        for epoch, epoch_gens in enumerate(epochs):
+            for island in pool_islands:
+                island.evolve(epoch_gens)
+            if epoch + 1 < len(epochs):
+                slot = epoch % 2
+                for i, island in enumerate(pool_islands):
+                    _post(buffers, slot, i, island, migrants)
+                for i, island in enumerate(pool_islands):
+                    island.receive(_collect(buffers, slot, migration_sources(i, islands, topology)))
+        results = [(isl.best_individual, isl.best_fitness, isl.trace) for isl in pool_islands]
+
+    best_individual, best_fitness, _ = min(results, key=lambda r: r[1])
+    return best_individual, best_fitness, [trace for _, _, trace in results]
@@ -0,0 +1,273 @@
+# list_schedulers.py
+# Keluarga list scheduler di atas satu engine bersama:
+# - CPOP    : critical-path-on-a-processor (Topcuoglu dkk.)
+# - PEFT    : predict earliest finish time dengan optimistic cost table (OCT)
+# - HEFT-LA : HEFT dengan lookahead satu langkah ke successor
+# Semua memakai kebijakan non-insertion (task ditambahkan di akhir antrean
+# prosesor), sama seperti heft_schedule_times default.
+import heapq
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+import instrument
+from compiled_dag import CompiledDAG, compile_dag
+
+
+class ListScheduleEngine:
+    """
+    State jadwal parsial dalam bentuk array:
+    - proc_avail (p,) : kapan tiap prosesor selesai dengan task terakhirnya
+    - aft, ast (n,)   : waktu selesai / mulai task yang sudah dijadwalkan
+    - assign (n,)     : prosesor tiap task (-1 = belum dijadwalkan)
+    - w (n, p)        : biaya task di tiap prosesor (cost_matrix atau cost homogen)
+
+    eft(t) menghitung EST/EFT task t di SEMUA prosesor sekaligus dengan
+    operasi array (O(jumlah predecessor · p)), jadi PEFT dan lookahead tetap
+    murah walaupun p besar. Predecessor yang belum dijadwalkan diabaikan.
+    """
+
+    def __init__(self, dag: CompiledDAG, processors: int):
+        dag.check_processors(processors)
+        n = dag.n
+        self.dag = dag
+        self.processors = processors
+        self.proc_avail = np.zeros(processors)
+        self.ast = np.zeros(n)
+        self.aft = np.zeros(n)
+        self.assign = np.full(n, -1, dtype=np.int64)
+        if dag.cost_matrix is not None:
+            self.w = dag.cost_matrix
+        else:
+            self.w = np.broadcast_to(dag.cost[:, None], (n, processors))
+        self._procs = np.arange(processors)
+        self._ptr = dag.pred_ptr.tolist()
+
+    def ready_time(self, t: int) -> np.ndarray:
+        """Waktu data semua predecessor (yang sudah dijadwalkan) tersedia di tiap prosesor."""
+        lo, hi = self._ptr[t], self._ptr[t + 1]
+        if hi == lo:
+            return np.zeros(self.processors)
+
+        idx = self.dag.pred_idx[lo:hi]
+        where = self.assign[idx]
+        done = where >= 0
+        if not done.all():
+            idx, where = idx[done], where[done]
+            comm = self.dag.pred_comm[lo:hi][done]
+            if idx.size == 0:
+                return np.zeros(self.processors)
+        else:
+            comm = self.dag.pred_comm[lo:hi]
+
+        local = self.aft[idx]
+        # (k, p): di prosesor yang sama tanpa komunikasi, selain itu + comm
+        ready = np.where(where[:, None] == self._procs[None, :], local[:, None], (local + comm)[:, None])
+        return ready.max(axis=0)
+
+    def eft(self, t: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(EST, EFT) task t di setiap prosesor."""
+        start = np.maximum(self.proc_avail, self.ready_time(t))
+        return start, start + self.w[t]
+
+    def place(self, t: int, p: int, start: float, finish: float) -> None:
+        self.assign[t] = p
+        self.ast[t] = start
+        self.aft[t] = finish
+        self.proc_avail[p] = finish
+
+    def result(self):
+        """(assignment, AST, AFT) dalam bentuk dict seperti heft_schedule_times."""
+        assign = self.assign.tolist()
+        ast = self.ast.tolist()
+        aft = self.aft.tolist()
+        n = self.dag.n
+        return (
+            {t: assign[t] for t in range(n)},
+            {t: ast[t] for t in range(n)},
+            {t: aft[t] for t in range(n)},
+        )
+
+
+def _ready_list_schedule(dag: CompiledDAG, priority, choose) -> None:
+    """
+    Loop list scheduling berbasis ready list: task yang semua predecessor-nya
+    sudah dijadwalkan diambil berdasarkan priority tertinggi (seri dipecah
+    dengan posisi topologis), lalu choose(t) menjadwalkannya.
+    """
+    n = dag.n
+    topo_pos = dag.topo_pos
+    indeg = np.diff(dag.pred_ptr).tolist()
+    heap = [(-priority[t], topo_pos[t], t) for t in range(n) if indeg[t] == 0]
+    heapq.heapify(heap)
+
+    while heap:
+        _, _, t = heapq.heappop(heap)
+        choose(t)
+        for child, _ in dag.succs[t]:
+            indeg[child] -= 1
+            if indeg[child] == 0:
+                heapq.heappush(heap, (-priority[child], topo_pos[child], child))
+
+
+def _prepare(tasks, edges, processors, dag):
+    if dag is None:
+        dag = compile_dag(tasks, edges)
+    return dag, ListScheduleEngine(dag, processors)
+
+
+def critical_path_tasks(dag: CompiledDAG, priority) -> List[int]:
+    """
+    Task di critical path (CPOP): mulai dari entry dengan prioritas
+    rank_u + rank_d tertinggi, lalu selalu ke successor dengan prioritas tertinggi.
+    """
+    if dag.n == 0:
+        return []
+    entries = [t for t in range(dag.n) if not dag.preds[t]]
+    t = max(entries, key=lambda x: (priority[x], -x))
+    path = [t]
+    while dag.succs[t]:
+        t = max((child for child, _ in dag.succs[t]), key=lambda x: (priority[x], -x))
+        path.append(t)
+    return path
+
+
+@instrument.timed("cpop")
+def cpop_schedule_times(tasks, edges, processors: int = 4, dag: Optional[CompiledDAG] = None):
+    """
+    CPOP:
+    1) prioritas = rank_u + rank_d (biaya rata-rata + komunikasi)
+    2) task critical path dijadwalkan semua ke SATU prosesor, yaitu yang
+       total biaya task critical path-nya paling kecil
+    3) task lain ke prosesor dengan EFT minimum
+    Return: (assignment, AST, AFT) seperti heft_schedule_times
+    """
+    if len(tasks) == 0:
+        return {}, {}, {}
+    dag, engine = _prepare(tasks, edges, processors, dag)
+
+    ranks = dag.ranks
+    priority = (ranks.rank_u + ranks.rank_d).tolist()
+    cp = critical_path_tasks(dag, priority)
+    on_cp = np.zeros(dag.n, dtype=bool)
+    on_cp[cp] = True
+    cp_proc = int(np.argmin(engine.w[cp].sum(axis=0)))
+
+    def choose(t):
+        start, finish = engine.eft(t)
+        p = cp_proc if on_cp[t] else int(np.argmin(finish))
+        engine.place(t, p, float(start[p]), float(finish[p]))
+
+    _ready_list_schedule(dag, priority, choose)
+    return engine.result()
+
+
+def optimistic_cost_table(dag: CompiledDAG, processors: int) -> np.ndarray:
+    """
+    OCT PEFT (n, p):
+    OCT(t, pk) = max_{s ∈ succ(t)} min_{pw} ( OCT(s, pw) + w(s, pw) + c̄(t, s)·[pw ≠ pk] )
+    OCT(exit, ·) = 0
+
+    min di dalam cukup O(p) per edge: min( M_s[pk], min_pw M_s[pw] + c̄ )
+    dengan M_s = OCT(s, ·) + w(s, ·), jadi seluruh tabel O(e·p), bukan O(n·p²).
+    Dihitung per level (dari level terdalam), satu operasi array per level.
+    """
+    n = dag.n
+    oct_table = np.zeros((n, processors))
+    if n == 0:
+        return oct_table
+
+    w = dag.cost_matrix if dag.cost_matrix is not None else np.broadcast_to(dag.cost[:, None], (n, processors))
+    level = dag.levels
+    src = np.repeat(np.arange(n), np.diff(dag.succ_ptr))
+    dst = dag.succ_idx
+    comm = dag.succ_comm
+    by_level = np.argsort(level[src], kind="stable")
+    ptr = np.searchsorted(level[src][by_level], np.arange(int(level.max()) + 2))
+
+    for lv in range(int(level.max()) - 1, -1, -1):
+        e = by_level[ptr[lv]:ptr[lv + 1]]
+        if not e.size:
+            continue
+        m = oct_table[dst[e]] + w[dst[e]]                      # (e, p)
+        best = np.minimum(m, m.min(axis=1, keepdims=True) + comm[e, None])
+        np.maximum.at(oct_table, src[e], best)
+
+    return oct_table
+
+
+@instrument.timed("peft")
+def peft_schedule_times(tasks, edges, processors: int = 4, dag: Optional[CompiledDAG] = None):
+    """
+    PEFT:
+    1) prioritas rank_oct(t) = rata-rata OCT(t, ·)
+    2) task ke prosesor dengan O_EFT(t, p) = EFT(t, p) + OCT(t, p) minimum,
+       yaitu EFT yang sudah "melihat" biaya optimis sisa jalur ke exit
+    Return: (assignment, AST, AFT) seperti heft_schedule_times
+    """
+    if len(tasks) == 0:
+        return {}, {}, {}
+    dag, engine = _prepare(tasks, edges, processors, dag)
+
+    oct_table = optimistic_cost_table(dag, processors)
+    priority = oct_table.mean(axis=1).tolist()
+
+    def choose(t):
+        start, finish = engine.eft(t)
+        p = int(np.argmin(finish + oct_table[t]))
+        engine.place(t, p, float(start[p]), float(finish[p]))
+
+    _ready_list_schedule(dag, priority, choose)
+    return engine.result()
+
+
+@instrument.timed("heft_lookahead")
+def lookahead_schedule_times(tasks, edges, processors: int = 4, dag: Optional[CompiledDAG] = None):
+    """
+    HEFT dengan lookahead satu langkah:
+    urutan task sama dengan HEFT (rank_u menurun), tetapi untuk setiap
+    prosesor kandidat p, task t dianggap ditempatkan di p lalu dihitung
+    EFT minimum tiap successor-nya; dipilih p dengan max EFT successor
+    terkecil (seri -> EFT t sendiri). Task tanpa successor = HEFT biasa.
+    Semua kandidat dihitung sekaligus sebagai matriks (p, p) per successor.
+    Return: (assignment, AST, AFT) seperti heft_schedule_times
+    """
+    n = len(tasks)
+    if n == 0:
+        return {}, {}, {}
+    dag, engine = _prepare(tasks, edges, processors, dag)
+
+    rank_u = dag.rank_u
+    order = sorted(range(n), key=lambda t: rank_u[t], reverse=True)
+    succs = dag.succs
+    same = np.eye(processors, dtype=bool)
+
+    for t in order:
+        start, finish = engine.eft(t)
+        if not succs[t]:
+            p = int(np.argmin(finish))
+            engine.place(t, p, float(start[p]), float(finish[p]))
+            continue
+
+        # semua kandidat prosesor sekaligus: baris p = t ditempatkan di p,
+        # kolom q = prosesor anak; hanya AFT t dan proc_avail[p] yang berubah
+        avail = np.where(same, finish[:, None], engine.proc_avail[None, :])
+        worst_child = np.full(processors, -np.inf)
+        for child, comm in succs[t]:
+            arrive = np.where(same, finish[:, None], finish[:, None] + comm)
+            child_eft = np.maximum(np.maximum(engine.ready_time(child)[None, :], arrive), avail) + engine.w[child]
+            worst_child = np.maximum(worst_child, child_eft.min(axis=1))
+
+        # max EFT anak terkecil, seri -> EFT t sendiri, lalu indeks prosesor
+        p = int(np.lexsort((finish, worst_child))[0])
+        engine.place(t, p, float(start[p]), float(finish[p]))
+
+    return engine.result()
+
+
+# nama algoritma (kolom "algorithm" di results.csv) -> fungsi penjadwal
+SCHEDULERS = {
+    "CPOP": cpop_schedule_times,
+    "PEFT": peft_schedule_times,
+    "HEFT-LA": lookahead_schedule_times,
+}
@@ -1,11 +1,27 @@
 # main.py
+import argparse
 import csv
 import os
-from heft import heft_schedule
-from ga_scheduler import ga_schedule
+import random
+import time
+import zlib
+from multiprocessing import Pool
+import numpy as np
+import instrument
+from heft import heft_schedule_times, schedule_order
+from ga_scheduler import ga_schedule, ga_schedule_ordered
+from island_ga import island_ga_schedule
+from list_schedulers import SCHEDULERS
+from nsga2 import OBJECTIVES, nsga2_schedule
 from evaluate import evaluate_schedule
+from compiled_dag import compile_dag
+from manifest import Manifest, code_version, folder_key, generated_digest, params_digest
+from results_store import open_store
+from dataset import open_dataset
+from dag_generator import COST_SCALE, build_dag, dag_name, iter_dag_specs
 
 
+@instrument.timed("load_csv")
 def load_tasks_edges(folder):
     tasks = []
     edges = []
@@ -32,6 +48,18 @@ def load_tasks_edges(folder):
     return tasks, edges
 
 
+@instrument.timed("load_csv")
+def load_cost_matrix(folder):
+    """
+    Matriks biaya heterogen (n, p) dari costs.npy, atau None kalau folder
+    hanya punya satu biaya per task (semua prosesor sama).
+    """
+    path = os.path.join(folder, "costs.npy")
+    if not os.path.exists(path):
+        return None
+    return np.load(path) / COST_SCALE
+
+
 def load_meta(folder):
     meta_path = os.path.join(folder, "meta.csv")
     processors = 1
@@ -46,34 +74,84 @@ def load_meta(folder):
     return processors
 
 
+def load_meta_row(folder):
+    """Isi lengkap meta.csv: processors, ccr, shape_alpha."""
+    meta = {"processors": load_meta(folder), "ccr": 0.0, "shape_alpha": 0.0}
+
+    meta_path = os.path.join(folder, "meta.csv")
+    if os.path.exists(meta_path):
+        with open(meta_path) as f:
+            row = next(csv.DictReader(f), None) or {}
+        for key in ("ccr", "shape_alpha"):
+            if row.get(key):
+                meta[key] = float(row[key])
+
+    return meta
+
+
+FRONTS_NAME = "fronts.csv"
+
+
 def save_results(results, out_path):
     """
     results: dict
         {
             "HEFT": {metrik...},
-            "GA": {metrik...}
+            "GA": {metrik...},
+            "NSGA2": [{metrik...}, ...]   # Pareto front (opsional)
         }
+    Algoritma dengan satu jadwal ditulis ke results.csv; Pareto front ditulis
+    ke fronts.csv di folder yang sama (satu baris per titik front).
     """
+    fronts = {algo: points for algo, points in results.items() if isinstance(points, list)}
+    results = {algo: metrics for algo, metrics in results.items() if not isinstance(metrics, list)}
+    save_fronts(fronts, os.path.join(os.path.dirname(out_path), FRONTS_NAME))
     if not results:
         return
 
     sample_metrics = next(iter(results.values()))
     fieldnames = ["algorithm"] + list(sample_metrics.keys())
 
-    with open(out_path, "w", newline="") as f:
+    # tulis ke file sementara lalu rename: results.csv tidak pernah setengah jadi
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "w", newline="") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
         for algo, metrics in results.items():
             row = {"algorithm": algo}
             row.update(metrics)
             writer.writerow(row)
+    os.replace(tmp_path, out_path)
 
 
-def main(root="data/dags"):
-    if not os.path.isdir(root):
-        print(f"Folder {root} tidak ditemukan.")
+def save_fronts(fronts, out_path):
+    """
+    fronts: {"NSGA2": [{metrik...}, ...]}; kalau kosong, fronts.csv lama dihapus
+    supaya tidak tertinggal dari run sebelumnya.
+    """
+    if not any(fronts.values()):
+        if os.path.exists(out_path):
+            os.remove(out_path)
         return
 
+    sample_metrics = next(points[0] for points in fronts.values() if points)
+    fieldnames = ["algorithm", "point"] + list(sample_metrics.keys())
+
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for algo, points in fronts.items():
+            for k, metrics in enumerate(points):
+                row = {"algorithm": algo, "point": k}
+                row.update(metrics)
+                writer.writerow(row)
+    os.replace(tmp_path, out_path)
+
+
+def list_dag_folders(root):
+    """Daftar (nama_folder, path) DAG yang file pentingnya lengkap, urut nama."""
+    folders = []
     for folder in sorted(os.listdir(root)):
         full_path = os.path.join(root, folder)
         if not os.path.isdir(full_path):
@@ -87,22 +165,411 @@ def main(root="data/dags"):
         if not (os.path.exists(tasks_path) and os.path.exists(edges_path) and os.path.exists(meta_path)):
             continue
 
+        folders.append((folder, full_path))
+
+    return folders
+
+
+def dag_seed(folder, seed=0):
+    """
+    Seed deterministik per DAG, diturunkan dari nama folder (bukan dari urutan
+    eksekusi), jadi hasil paralel sama persis dengan hasil serial.
+    """
+    return (zlib.crc32(folder.encode("utf-8")) + seed) & 0xFFFFFFFF
+
+
+# parameter default sweep (ikut di-hash di manifest)
+GA_PARAMS = {"pop_size": 30, "gens": 40, "mut_rate": 0.1}
+HEFT_PARAMS = {"insertion": False}
+# GA model pulau (island_ga.py); None = GA satu populasi biasa
+ISLAND_PARAMS = None
+# NSGA-II multi-objektif (nsga2.py); None = tidak dijalankan
+NSGA2_PARAMS = None
+# kriteria berhenti lebih awal ga_schedule (stagnation, time_limit, max_evals, lower_bound)
+STOP_PARAMS = {}
+# list scheduler tambahan (list_schedulers.SCHEDULERS); () = tidak dijalankan
+HEURISTICS = ()
+
+
+def check_options(island_params, stop_params, encoding):
+    """Tolak kombinasi opsi GA yang tidak didukung (ValueError), sebelum sweep dimulai."""
+    if island_params and encoding == "order":
+        raise ValueError("GA model pulau belum mendukung encoding 'order'.")
+    if island_params and stop_params:
+        # pulau bertemu di barrier tiap migrasi, jadi tidak bisa berhenti sendiri-sendiri
+        raise ValueError("GA model pulau belum mendukung kriteria berhenti (stop_params).")
+
+
+def run_dag(tasks, edges, processors, seed=None, options=None, dag=None, cost_matrix=None):
+    """
+    Jalankan HEFT + GA untuk satu DAG, kembalikan metrik per algoritma.
+    options: {"ga": parameter ga_schedule, "heft": parameter HEFT,
+              "island": parameter island_ga_schedule atau None,
+              "stop": kriteria berhenti ga_schedule (lihat STOP_PARAMS),
+              "heft_seed": True = populasi awal GA disisipi assignment HEFT,
+              "encoding": "assignment" (default) atau "order" (ga_schedule_ordered),
+              "nsga2": parameter nsga2_schedule atau None,
+              "heuristics": nama list scheduler tambahan, default tidak ada}
+    cost_matrix: biaya heterogen (n, p), dipakai kalau dag belum dibangun
+    """
+    options = options or {}
+    ga_params = options.get("ga", GA_PARAMS)
+    heft_params = options.get("heft", HEFT_PARAMS)
+    island_params = options.get("island", ISLAND_PARAMS)
+    stop_params = options.get("stop", STOP_PARAMS)
+    encoding = options.get("encoding", "assignment")
+    nsga2_params = options.get("nsga2", NSGA2_PARAMS)
+    heuristics = options.get("heuristics", HEURISTICS)
+    check_options(island_params, stop_params, encoding)
+    seeds = None
+
+    if seed is not None:
+        random.seed(seed)
+
+    # graf dibangun sekali, dipakai bersama oleh HEFT, GA, dan evaluate
+    if dag is None:
+        dag = compile_dag(tasks, edges, cost_matrix)
+
+    heft_assign, heft_ast, _ = heft_schedule_times(tasks, edges, processors, dag, **heft_params)
+    # jadwal insertion-based dievaluasi dengan urutan per prosesor milik HEFT
+    heft_order = schedule_order(heft_ast, dag) if heft_params.get("insertion") else None
+    ga_order = None
+    if options.get("heft_seed"):
+        # GA mulai dari jadwal HEFT (rank HEFT sudah ter-cache di dag); jadwal
+        # insertion hanya terulang kalau kromosom didekode dengan urutan HEFT
+        seeds = [[heft_assign[i] for i in range(len(tasks))]]
+        ga_order = heft_order
+
+    if encoding == "order":
+        if seeds:
+            seeds = [(seeds[0], schedule_order(heft_ast, dag))]
+        ga_ind, ga_order, _ = ga_schedule_ordered(
+            tasks, edges, processors, dag=dag, seeds=seeds, **ga_params, **stop_params
+        )
+    elif island_params:
+        ga_ind, _, _ = island_ga_schedule(tasks, edges, processors, dag=dag, seeds=seeds, order=ga_order,
+                                       **ga_params, **island_params)
+    else:
+        ga_ind, _ = ga_schedule(tasks, edges, processors, dag=dag, seeds=seeds, order=ga_order,
+                                **ga_params, **stop_params)
+    ga_assign = {i: ga_ind[i] for i in range(len(tasks))}
+
+    results = {
+        "HEFT": evaluate_schedule(heft_assign, tasks, edges, processors, dag, heft_order),
+        "GA": evaluate_schedule(ga_assign, tasks, edges, processors, dag, ga_order),
+    }
+
+    # CPOP / PEFT / HEFT-LA tidak menjadwalkan menurut urutan topologis,
+    # jadi dievaluasi dengan urutan per prosesor miliknya sendiri
+    for name in heuristics:
+        assign, ast, _ = SCHEDULERS[name](tasks, edges, processors, dag)
+        results[name] = evaluate_schedule(assign, tasks, edges, processors, dag, schedule_order(ast, dag))
+
+    if nsga2_params:
+        heft_seed = [[heft_assign[i] for i in range(len(tasks))]] if options.get("heft_seed") else None
+        front = nsga2_schedule(tasks, edges, processors, dag=dag, seeds=heft_seed, **nsga2_params)
+        results["NSGA2"] = [{k: v for k, v in point.items() if k != "assignment"} for point in front]
+
+    return results
+
+
+def load_source(folder, full_path, source=None):
+    """
+    Baca satu DAG dari sumbernya (folder CSV, dataset packed, atau generator).
+    return: tasks, edges, meta {processors, ccr, shape_alpha, n}, kwargs run_dag (dag / cost_matrix)
+    """
+    if source is None:
         tasks, edges = load_tasks_edges(full_path)
-        processors = load_meta(full_path)
+        meta = load_meta_row(full_path)
+        extra = {"cost_matrix": load_cost_matrix(full_path)}
+    elif "dataset" in source:
+        ds = open_dataset(source["dataset"])
+        tasks, edges, meta = ds.get(folder)
+        extra = {"dag": ds.compiled(folder)}
+    else:
+        tasks, edges, meta, cost_matrix = build_dag(source["spec"], source["gen_seed"])
+        extra = {"cost_matrix": cost_matrix}
+    return tasks, edges, dict(meta, n=len(tasks)), extra
 
-        heft_assign, _ = heft_schedule(tasks, edges, processors)
-        ga_ind, _ = ga_schedule(tasks, edges, processors)
-        ga_assign = {i: ga_ind[i] for i in range(len(tasks))}
 
-        results = {
-            "HEFT": evaluate_schedule(heft_assign, tasks, edges, processors),
-            "GA": evaluate_schedule(ga_assign, tasks, edges, processors),
-        }
+def run_folder(full_path, seed=None, options=None):
+    """Jalankan HEFT + GA untuk satu folder DAG (format CSV)."""
+    tasks, edges, meta, extra = load_source(os.path.basename(full_path), full_path)
+    return run_dag(tasks, edges, meta["processors"], seed, options, **extra)
+
+
+def run_packed(dataset, name, seed=None, options=None):
+    """Jalankan HEFT + GA untuk satu DAG dari dataset packed (lihat dataset.py)."""
+    tasks, edges, meta, extra = load_source(name, None, {"dataset": dataset})
+    return run_dag(tasks, edges, meta["processors"], seed, options, **extra)
+
+
+def run_generated(spec, gen_seed=0, seed=None, options=None):
+    """Bangkitkan DAG dari spesifikasinya (dag_generator) lalu langsung dijalankan."""
+    tasks, edges, meta, extra = load_source(dag_name(spec), None, {"spec": spec, "gen_seed": gen_seed})
+    return run_dag(tasks, edges, meta["processors"], seed, options, **extra)
+
+
+TIMINGS_NAME = "timings.csv"
+
+
+def _run_job(job):
+    # fungsi top-level supaya bisa di-pickle oleh multiprocessing
+    folder, full_path, seed, options, source, profile = job
+
+    # instrumentasi per DAG: state direset di awal job, snapshot dikirim balik
+    instrument.enable(profile)
+    instrument.reset()
+    with instrument.timer("total"):
+        tasks, edges, meta, extra = load_source(folder, full_path, source)
+        results = run_dag(tasks, edges, meta["processors"], seed, options, **extra)
+
+    stats = instrument.snapshot() if profile else None
+    return folder, full_path, results, stats, meta
+
+
+def main(
+    root="data/dags",
+    workers=1,
+    chunksize=4,
+    seed=0,
+    ga_params=None,
+    force=False,
+    dataset=None,
+    heft_params=None,
+    generate=None,
+    island_params=None,
+    stop_params=None,
+    heft_seed=False,
+    encoding="assignment",
+    nsga2_params=None,
+    profile=False,
+    heuristics=None,
+    store=None,
+):
+    """
+    workers  : jumlah proses (1 = serial, 0 = semua core)
+    chunksize: jumlah folder per kiriman ke worker
+    seed     : seed dasar; tiap DAG memakai dag_seed(folder, seed)
+    ga_params: parameter ga_schedule (default GA_PARAMS)
+    heft_params: parameter HEFT, mis. {"insertion": True} (default HEFT_PARAMS)
+    force    : hitung ulang semua folder walaupun manifest bilang up to date
+    dataset  : file dataset packed (dataset.py); kalau diberikan, DAG dibaca
+               dari file itu dan results.csv tetap ditulis ke <root>/<nama>/
+    generate : seed generator; kalau diberikan, DAG dibangkitkan langsung di
+               worker dari config.CONFIG (tanpa file DAG di disk)
+    island_params: parameter GA model pulau, mis. {"islands": 4,
+               "migration_interval": 5, "topology": "ring"}; None = GA biasa.
+               Dengan workers > 1 pulau dijalankan bergiliran di tiap worker.
+    stop_params: kriteria berhenti lebih awal GA, mis. {"stagnation": 10,
+               "lower_bound": True} (hanya untuk GA satu populasi)
+    heft_seed: sisipkan assignment HEFT (+ varian termutasi) ke populasi awal GA
+    encoding : "assignment" (kromosom = task -> prosesor) atau "order"
+               (kromosom juga membawa urutan eksekusi, ga_schedule_ordered)
+    nsga2_params: parameter NSGA-II, mis. {"pop_size": 40, "gens": 40,
+               "objectives": ["makespan", "energy", "cost"]}; Pareto front
+               disimpan ke fronts.csv per folder. None = NSGA-II tidak dijalankan
+    profile  : ukur waktu per fase (load, compile, rank, HEFT, GA, evaluate, ...)
+               dan counter (evaluasi fitness, cache hit, generasi, prosesor
+               yang dicoba HEFT); ditulis ke timings.csv di samping results.csv
+               dan diringkas di akhir sweep
+    heuristics: list scheduler tambahan yang dijalankan (subset dari
+               list_schedulers.SCHEDULERS); None/[] = tidak ada
+    store    : file SQLite results store (results_store.py); kalau diberikan,
+               hasil (termasuk Pareto front) ditulis ke database itu per batch
+               transaksi, bukan ke results.csv/fronts.csv, dan DAG yang run_key-nya
+               sudah ada di database dilewati
+    """
+    check_options(island_params or ISLAND_PARAMS, dict(STOP_PARAMS, **(stop_params or {})), encoding)
+    if dataset is not None:
+        ds = open_dataset(dataset)
+        os.makedirs(root, exist_ok=True)
+        folders = [(name, os.path.join(root, name)) for name in ds.names]
+        sources = [{"dataset": dataset} for _ in folders]
+    elif generate is not None:
+        specs = list(iter_dag_specs())
+        os.makedirs(root, exist_ok=True)
+        folders = [(dag_name(spec), os.path.join(root, dag_name(spec))) for spec in specs]
+        sources = [{"spec": spec, "gen_seed": generate} for spec in specs]
+    elif os.path.isdir(root):
+        folders = list_dag_folders(root)
+        sources = [None] * len(folders)
+    else:
+        print(f"Folder {root} tidak ditemukan.")
+        return
+
+    options = {
+        "ga": dict(GA_PARAMS, **(ga_params or {})),
+        "heft": dict(HEFT_PARAMS, **(heft_params or {})),
+        "island": island_params or ISLAND_PARAMS,
+        "stop": dict(STOP_PARAMS, **(stop_params or {})),
+        "heft_seed": heft_seed,
+        "encoding": encoding,
+        "nsga2": nsga2_params or NSGA2_PARAMS,
+        "heuristics": list(heuristics or HEURISTICS),
+    }
+    params = dict(options, seed=seed)
+
+    manifest = Manifest(root)
+    results_db = open_store(store) if store is not None else None
+    stored = results_db.run_keys() if results_db is not None else None
+    keys = {}
+    jobs = []
+    skipped = 0
+    for (folder, full_path), source in zip(folders, sources):
+        if source is None:
+            inputs = None
+        elif "dataset" in source:
+            inputs = ds.digest(folder)
+        else:
+            inputs = generated_digest(source["spec"], source["gen_seed"])
+        key = folder_key(full_path, params, inputs)
+        if results_db is not None:
+            current = params_digest(key) in stored
+        else:
+            current = manifest.is_current(folder, key, full_path)
+        if not force and current:
+            skipped += 1
+            continue
+        keys[folder] = key
+        jobs.append((folder, full_path, dag_seed(folder, seed), options, source, profile))
+    total = len(jobs)
+
+    if skipped:
+        print(f"Skip {skipped} folder (sudah up to date), {total} folder dihitung ulang.")
+
+    if workers == 0:
+        workers = os.cpu_count() or 1
+
+    sweep_stats = {}
+    profiled = 0
+    start = time.perf_counter()
+    pool = Pool(workers) if workers > 1 and total > 1 else None
+    try:
+        if pool is not None:
+            # hasil dialirkan balik ke parent begitu satu DAG selesai
+            outputs = pool.imap_unordered(_run_job, jobs, chunksize=max(1, chunksize))
+        else:
+            outputs = map(_run_job, jobs)
+
+        version = code_version()
+        params_key = params_digest(params)
+        for done, (folder, full_path, results, stats, meta) in enumerate(outputs, 1):
+            save_start = time.perf_counter()
+            if results_db is not None:
+                out_file = results_db.path
+                results_db.add(folder, meta, results, dag_seed(folder, seed), version,
+                               params, params_key, params_digest(keys[folder]))
+            else:
+                out_file = os.path.join(full_path, "results.csv")
+                os.makedirs(full_path, exist_ok=True)
+                save_results(results, out_file)
+            if stats is not None:
+                os.makedirs(full_path, exist_ok=True)
+                stats["timers"]["save_results"] = [1, time.perf_counter() - save_start]
+                instrument.write_csv(stats, os.path.join(full_path, TIMINGS_NAME))
+                instrument.merge(sweep_stats, stats)
+                profiled += 1
+            elif os.path.exists(os.path.join(full_path, TIMINGS_NAME)):
+                os.remove(os.path.join(full_path, TIMINGS_NAME))  # profil run lama
+            manifest.record(folder, keys[folder])
+            elapsed = time.perf_counter() - start
+            print(f"[{done}/{total} {elapsed:.1f}s] Saved result: {out_file}")
+    except KeyboardInterrupt:
+        if pool is not None:
+            pool.terminate()
+        print("Dihentikan. Jalankan ulang untuk melanjutkan folder yang belum selesai.")
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        manifest.close()
+        if results_db is not None:
+            results_db.close()
+        instrument.enable(False)
+
+    if profiled:
+        print(f"Profil {profiled} DAG ({time.perf_counter() - start:.1f}s wall):")
+        print(instrument.summary(sweep_stats, profiled))
+
 
-        out_file = os.path.join(full_path, "results.csv")
-        save_results(results, out_file)
-        print(f"Saved result: {out_file}")
+def parse_args():
+    parser = argparse.ArgumentParser(description="Eksperimen HEFT vs GA untuk semua folder DAG.")
+    parser.add_argument("--root", default="data/dags", help="folder berisi DAG (default: data/dags)")
+    parser.add_argument("--workers", type=int, default=1, help="jumlah proses paralel (0 = semua core)")
+    parser.add_argument("--chunksize", type=int, default=4, help="jumlah folder per kiriman ke worker")
+    parser.add_argument("--seed", type=int, default=0, help="seed dasar untuk seeding per DAG")
+    parser.add_argument("--pop-size", type=int, default=GA_PARAMS["pop_size"], help="ukuran populasi GA")
+    parser.add_argument("--gens", type=int, default=GA_PARAMS["gens"], help="jumlah generasi GA")
+    parser.add_argument("--mut-rate", type=float, default=GA_PARAMS["mut_rate"], help="probabilitas mutasi per gen")
+    parser.add_argument("--heft-insertion", action="store_true", help="HEFT insertion-based (isi celah idle)")
+    parser.add_argument("--force", action="store_true", help="abaikan manifest, hitung ulang semua folder")
+    parser.add_argument("--dataset", default=None, help="baca DAG dari file dataset packed (lihat dataset.py)")
+    parser.add_argument("--generate", type=int, default=None, metavar="SEED",
+                        help="bangkitkan DAG langsung di worker dengan seed generator ini")
+    parser.add_argument("--islands", type=int, default=0, help="GA model pulau dengan N sub-populasi (0 = GA biasa)")
+    parser.add_argument("--migration-interval", type=int, default=5, help="migrasi elit setiap sekian generasi")
+    parser.add_argument("--migrants", type=int, default=1, help="jumlah elit yang dikirim per pulau per migrasi")
+    parser.add_argument("--topology", choices=["ring", "full"], default="ring", help="topologi migrasi antar pulau")
+    parser.add_argument("--stagnation", type=int, default=None, help="GA berhenti kalau tidak membaik selama K generasi")
+    parser.add_argument("--time-limit", type=float, default=None, help="batas waktu GA per DAG (detik)")
+    parser.add_argument("--max-evals", type=int, default=None, help="batas jumlah evaluasi fitness GA per DAG")
+    parser.add_argument("--stop-at-bound", action="store_true",
+                        help="GA berhenti begitu mencapai batas bawah makespan (critical path / total kerja)")
+    parser.add_argument("--heft-seed", action="store_true", help="populasi awal GA disisipi jadwal HEFT")
+    parser.add_argument("--ga-encoding", choices=["assignment", "order"], default="assignment",
+                        help="kromosom GA: assignment saja, atau assignment + urutan eksekusi")
+    parser.add_argument("--profile", action="store_true",
+                        help="ukur waktu per fase + counter, tulis timings.csv per DAG dan ringkasan")
+    parser.add_argument("--nsga2", action="store_true", help="jalankan juga NSGA-II dan simpan Pareto front")
+    parser.add_argument("--nsga2-pop", type=int, default=40, help="ukuran populasi NSGA-II")
+    parser.add_argument("--nsga2-gens", type=int, default=40, help="jumlah generasi NSGA-II")
+    parser.add_argument("--objectives", default=",".join(OBJECTIVES),
+                        help="objektif NSGA-II, dipisah koma (default: semua metrik)")
+    parser.add_argument("--heuristics", nargs="*", choices=list(SCHEDULERS), default=list(HEURISTICS),
+                        help="jalankan juga list scheduler ini (mis. CPOP PEFT HEFT-LA)")
+    parser.add_argument("--store", default=None,
+                        help="tulis hasil ke results store SQLite ini (results_store.py), bukan results.csv")
+    return parser.parse_args()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    args = parse_args()
+    main(
+        args.root,
+        workers=args.workers,
+        chunksize=args.chunksize,
+        seed=args.seed,
+        ga_params={"pop_size": args.pop_size, "gens": args.gens, "mut_rate": args.mut_rate},
+        force=args.force,
+        dataset=args.dataset,
+        heft_params={"insertion": args.heft_insertion},
+        generate=args.generate,
+        island_params={
+            "islands": args.islands,
+            "migration_interval": args.migration_interval,
+            "migrants": args.migrants,
+            "topology": args.topology,
+        } if args.islands > 0 else None,
+        stop_params={
+            key: value
+            for key, value in (
+                ("stagnation", args.stagnation),
+                ("time_limit", args.time_limit),
+                ("max_evals", args.max_evals),
+                ("lower_bound", True if args.stop_at_bound else None),
+            )
+            if value is not None
+        },
+        heft_seed=args.heft_seed,
+        encoding=args.ga_encoding,
+        nsga2_params={
+            "pop_size": args.nsga2_pop,
+            "gens": args.nsga2_gens,
+            "mut_rate": args.mut_rate,
+            "objectives": args.objectives.split(","),
+        } if args.nsga2 else None,
+        profile=args.profile,
+        heuristics=args.heuristics,
+        store=args.store,
+    )
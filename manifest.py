@@ -0,0 +1,134 @@
+# manifest.py
+# Manifest sweep eksperimen: mencatat hash input + parameter + versi kode
+# per folder DAG, supaya run ulang hanya menghitung folder yang berubah.
+import hashlib
+import json
+import os
+from functools import lru_cache
+
+MANIFEST_NAME = "manifest.jsonl"
+
+# file input DAG yang ikut di-hash
+INPUT_FILES = ("tasks.csv", "edges.csv", "meta.csv", "costs.npy")
+
+# modul yang menentukan isi results.csv (ubah salah satunya -> semua stale):
+# semua modul lokal yang di-import main.py, kecuali pencatat hasil
+# (manifest.py, results_store.py) yang tidak mengubah angka
+CODE_FILES = (
+    "compiled_dag.py",
+    "config.py",
+    "dag_generator.py",
+    "dataset.py",
+    "evaluate.py",
+    "ga_scheduler.py",
+    "heft.py",
+    "instrument.py",
+    "island_ga.py",
+    "list_schedulers.py",
+    "main.py",
+    "nsga2.py",
+)
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def _digest_files(paths) -> str:
+    h = hashlib.sha256()
+    for path in paths:
+        h.update(os.path.basename(path).encode("utf-8"))
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                h.update(f.read())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def code_version() -> str:
+    """Hash isi source modul penjadwal (dihitung sekali per proses)."""
+    return _digest_files(os.path.join(_HERE, name) for name in CODE_FILES)[:16]
+
+
+def input_digest(folder) -> str:
+    return _digest_files(os.path.join(folder, name) for name in INPUT_FILES)
+
+
+def generated_digest(spec, gen_seed) -> str:
+    """Hash input DAG yang dibangkitkan on-the-fly: spesifikasi + seed + kode generator."""
+    generator = _digest_files([os.path.join(_HERE, "dag_generator.py"), os.path.join(_HERE, "config.py")])
+    return params_digest({"spec": spec, "gen_seed": gen_seed, "generator": generator})
+
+
+def params_digest(params) -> str:
+    blob = json.dumps(params, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()[:16]
+
+
+def folder_key(folder, params, inputs=None):
+    """
+    Kunci up-to-date sebuah folder: hash input, parameter, versi kode.
+    inputs: hash input yang sudah dihitung (mis. dari dataset packed);
+            kalau None, dihitung dari file CSV di folder.
+    """
+    return {
+        "inputs": inputs if inputs is not None else input_digest(folder),
+        "params": params_digest(params),
+        "code": code_version(),
+    }
+
+
+class Manifest:
+    """
+    Manifest append-only (JSON lines) di <root>/manifest.jsonl.
+
+    Setiap folder yang selesai langsung ditambahkan satu baris dan di-flush,
+    jadi kalau sweep crash / Ctrl-C, folder yang sudah tercatat tidak perlu
+    dihitung ulang. Baris terakhir yang terpotong diabaikan saat load.
+    """
+
+    def __init__(self, root):
+        self.path = os.path.join(root, MANIFEST_NAME)
+        self.entries = self._load()
+        self._fh = None
+
+    def _load(self):
+        entries = {}
+        if not os.path.exists(self.path):
+            return entries
+
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # baris terpotong (crash saat menulis)
+                entries[rec["folder"]] = rec["key"]
+        return entries
+
+    def is_current(self, folder, key, full_path) -> bool:
+        if self.entries.get(folder) != key:
+            return False
+        return os.path.exists(os.path.join(full_path, "results.csv"))
+
+    def record(self, folder, key):
+        if self._fh is None:
+            self._compact()
+            self._fh = open(self.path, "a")
+
+        self.entries[folder] = key
+        self._fh.write(json.dumps({"folder": folder, "key": key}, sort_keys=True) + "\n")
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+
+    def _compact(self):
+        # tulis ulang satu baris per folder (atomik), buang riwayat lama
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            for folder in sorted(self.entries):
+                f.write(json.dumps({"folder": folder, "key": self.entries[folder]}, sort_keys=True) + "\n")
+        os.replace(tmp, self.path)
+
+    def close(self):
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
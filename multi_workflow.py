@@ -0,0 +1,287 @@
+# multi_workflow.py
+# Penjadwalan banyak workflow (DAG) sekaligus di satu pool prosesor bersama.
+# Tiap workflow punya waktu kedatangan sendiri; semua task digabung ke satu
+# timeline per prosesor (insertion-based, task boleh mengisi celah idle) dan
+# urutan antar workflow ditentukan kebijakan fairness:
+# - fcfs        : workflow dijadwalkan utuh satu per satu sesuai kedatangan
+# - round_robin : bergiliran satu task per workflow (urut rank_u di dalam workflow)
+# - slowdown    : di antara workflow yang task berikutnya sudah siap, lanjutkan
+#                 yang perkiraan slowdown-nya terbesar (slowdown-fair,
+#                 Zhao & Sakellariou)
+import argparse
+import random
+
+import numpy as np
+
+import instrument
+from compiled_dag import compile_dag
+from config import CONFIG
+from dag_generator import generate_layered_dag
+from evaluate import evaluate_schedule
+from heft import BlockTimeline, heft_schedule_times, schedule_order
+
+POLICIES = ("fcfs", "round_robin", "slowdown")
+
+
+class WorkflowSet:
+    """
+    Beberapa workflow digabung jadi satu masalah penjadwalan: task workflow
+    ke-w diberi indeks global offsets[w] + indeks lokal, edge ikut digeser.
+    workflows: list of dict {"tasks", "edges", "arrival" (default 0),
+               "cost_matrix" (opsional, (n, p)), "name" (opsional)}
+    """
+
+    def __init__(self, workflows, processors: int):
+        self.processors = processors
+        self.names = []
+        self.arrival = []
+        self.dags = []
+        self.offsets = [0]
+        tasks, edges, matrices, index = [], [], [], []
+
+        for w, wf in enumerate(workflows):
+            offset = self.offsets[-1]
+            cost_matrix = wf.get("cost_matrix")
+            dag = compile_dag(wf["tasks"], wf["edges"], cost_matrix)
+            dag.check_processors(processors)
+            self.dags.append(dag)
+            self.names.append(wf.get("name", f"wf{w}"))
+            self.arrival.append(float(wf.get("arrival", 0.0)))
+
+            tasks.extend({"task": offset + i, "cost": t["cost"]} for i, t in enumerate(wf["tasks"]))
+            edges.extend(
+                {"src": offset + int(e["src"]), "dst": offset + int(e["dst"]), "comm": e.get("comm", 0.0)}
+                for e in wf["edges"]
+            )
+            if cost_matrix is None:
+                cost_matrix = np.repeat(dag.cost[:, None], processors, axis=1)
+            matrices.append(np.asarray(cost_matrix, dtype=np.float64))
+            index.extend([w] * dag.n)
+            self.offsets.append(offset + dag.n)
+
+        self.tasks = tasks
+        self.edges = edges
+        self.index = np.asarray(index, dtype=np.int64)
+        cost_matrix = np.concatenate(matrices) if matrices else np.zeros((0, processors))
+        self.dag = compile_dag(tasks, edges, cost_matrix)
+        self._baseline = None
+
+    def __len__(self):
+        return len(self.dags)
+
+    def baseline(self):
+        """
+        Makespan tiap workflow kalau dijadwalkan sendirian di pool kosong
+        (HEFT insertion-based, kebijakan yang sama dengan penjadwal gabungan).
+        Sekalian AFT tiap task di jadwal sendirian itu (untuk kebijakan slowdown).
+        """
+        if self._baseline is None:
+            makespans = []
+            own_aft = np.zeros(len(self.tasks))
+            for w, dag in enumerate(self.dags):
+                lo = self.offsets[w]
+                local_tasks = self.tasks[lo:self.offsets[w + 1]]
+                _, _, aft = heft_schedule_times(local_tasks, None, self.processors, dag, insertion=True)
+                values = [aft[i] for i in range(dag.n)]
+                own_aft[lo:lo + dag.n] = values
+                makespans.append(max(values, default=0.0))
+            self._baseline = (makespans, own_aft)
+        return self._baseline
+
+    def info(self) -> dict:
+        """Deskripsi workflow untuk evaluate_schedule(..., workflows=...)."""
+        return {"index": self.index, "arrival": self.arrival, "baseline": self.baseline()[0]}
+
+
+def _local_orders(wset: WorkflowSet):
+    # urutan task tiap workflow: rank_u menurun (seri -> posisi topologis),
+    # selalu valid secara topologis
+    orders = []
+    for w, dag in enumerate(wset.dags):
+        rank_u, topo_pos = dag.rank_u, dag.topo_pos
+        local = sorted(range(dag.n), key=lambda t: (-rank_u[t], topo_pos[t]))
+        orders.append([wset.offsets[w] + t for t in local])
+    return orders
+
+
+def _policy_order(wset: WorkflowSet, policy: str):
+    """
+    Generator task global sesuai kebijakan. Untuk "slowdown", generator
+    menerima AFT task yang baru dijadwalkan lewat send() supaya perkiraan
+    slowdown workflow-nya bisa diperbarui.
+    """
+    orders = _local_orders(wset)
+    by_arrival = sorted(range(len(wset)), key=lambda w: (wset.arrival[w], w))
+
+    if policy == "fcfs":
+        for w in by_arrival:
+            for t in orders[w]:
+                yield t
+        return
+
+    if policy == "round_robin":
+        cursor = [0] * len(wset)
+        active = [w for w in by_arrival if orders[w]]
+        while active:
+            still = []
+            for w in active:
+                yield orders[w][cursor[w]]
+                cursor[w] += 1
+                if cursor[w] < len(orders[w]):
+                    still.append(w)
+            active = still
+        return
+
+    if policy == "slowdown":
+        # T = waktu siap paling awal task berikutnya di antara workflow aktif.
+        # Kandidat = workflow yang task berikutnya siap sebelum T + durasinya;
+        # dari kandidat dipilih yang perkiraan slowdown-nya terbesar:
+        #   (max(siap, T) + durasi - kedatangan) / AFT task itu di jadwal sendirian
+        # Workflow yang tertahan lama ikut "menua" karena T terus maju.
+        _, own_aft = wset.baseline()
+        preds = wset.dag.preds
+        duration = wset.dag.cost_matrix.mean(axis=1)
+        arrival = np.asarray(wset.arrival, dtype=np.float64)
+        cursor = [0] * len(wset)
+        finish = {}
+        active = np.array([bool(order) for order in orders])
+        first = [order[0] if order else 0 for order in orders]
+        ready = arrival.copy()
+        own_next = own_aft[first]
+        dur_next = duration[first]
+
+        while active.any():
+            T = np.where(active, ready, np.inf).min()
+            candidate = active & (ready <= T + dur_next)
+            estimate = (np.maximum(ready, T) + dur_next - arrival) / np.maximum(own_next, 1e-12)
+            w = int(np.argmax(np.where(candidate, estimate, -np.inf)))
+
+            t = orders[w][cursor[w]]
+            finish[t] = yield t
+            cursor[w] += 1
+            if cursor[w] == len(orders[w]):
+                active[w] = False
+                continue
+            t = orders[w][cursor[w]]
+            ready[w] = max([arrival[w]] + [finish[pred] for pred, _ in preds[t]])
+            own_next[w] = own_aft[t]
+            dur_next[w] = duration[t]
+        return
+
+    raise ValueError(f"policy harus salah satu dari {POLICIES}, bukan {policy!r}.")
+
+
+@instrument.timed("multi_workflow")
+def multi_workflow_schedule(wset: WorkflowSet, policy: str = "slowdown"):
+    """
+    Jadwalkan semua workflow di wset ke satu pool prosesor bersama.
+    Setiap task ditaruh di prosesor dengan EFT minimum (insertion-based,
+    tidak mulai sebelum workflow-nya datang), urutan task dari kebijakan.
+
+    Return: (assignment, AST, AFT) dict per task global, seperti heft_schedule_times
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"policy harus salah satu dari {POLICIES}, bukan {policy!r}.")
+    dag = wset.dag
+    processors = wset.processors
+    n = dag.n
+    if n == 0:
+        return {}, {}, {}
+
+    cost_rows = dag.cost_rows
+    preds = dag.preds
+    release = [wset.arrival[w] for w in wset.index.tolist()]
+    timelines = [BlockTimeline() for _ in range(processors)]
+    assignment = [0] * n
+    AST = [0.0] * n
+    AFT = [0.0] * n
+    instrument.count("multi_workflow.processors_probed", n * processors)
+
+    order = _policy_order(wset, policy)
+    t = next(order)
+    while True:
+        w = cost_rows[t]
+        best = None
+        for p in range(processors):
+            ready = release[t]
+            for pred, comm_time in preds[t]:
+                r = AFT[pred] + comm_time if assignment[pred] != p else AFT[pred]
+                if r > ready:
+                    ready = r
+            est, pos = timelines[p].earliest_start(ready, w[p])
+            eft = est + w[p]
+            if best is None or eft < best[0]:
+                best = (eft, est, p, pos)
+
+        eft, est, p, pos = best
+        timelines[p].insert(pos, est, eft)
+        assignment[t] = p
+        AST[t] = est
+        AFT[t] = eft
+        try:
+            t = order.send(eft)
+        except StopIteration:
+            break
+
+    return (
+        {t: assignment[t] for t in range(n)},
+        {t: AST[t] for t in range(n)},
+        {t: AFT[t] for t in range(n)},
+    )
+
+
+def evaluate_workflows(wset: WorkflowSet, assignment, AST):
+    """evaluate_schedule untuk jadwal gabungan: metrik global + per workflow."""
+    return evaluate_schedule(
+        assignment, wset.tasks, wset.edges, wset.processors, wset.dag,
+        schedule_order(AST, wset.dag), workflows=wset.info(),
+    )
+
+
+def random_workflows(count, n, processors, ccr=1.0, shape_alpha=1.0, rate=0.01, rng=random):
+    """
+    Workflow acak (dag_generator) dengan kedatangan Poisson: jeda antar
+    kedatangan ~ Exp(rate), n task per workflow diambil acak dari [n/2, n].
+    """
+    workflows = []
+    arrival = 0.0
+    for w in range(count):
+        size = rng.randint(max(1, n // 2), n)
+        tasks, edges, cost_matrix = generate_layered_dag(
+            size, ccr, shape_alpha, CONFIG["out_degree_range"], CONFIG["beta"], processors, rng
+        )
+        workflows.append({"name": f"wf{w}", "tasks": tasks, "edges": edges,
+                          "cost_matrix": cost_matrix, "arrival": arrival})
+        arrival += rng.expovariate(rate)
+    return workflows
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Penjadwalan banyak workflow di pool prosesor bersama.")
+    parser.add_argument("--workflows", type=int, default=100, help="jumlah workflow")
+    parser.add_argument("--n", type=int, default=50, help="jumlah task maksimum per workflow")
+    parser.add_argument("--processors", type=int, default=16)
+    parser.add_argument("--ccr", type=float, default=1.0)
+    parser.add_argument("--rate", type=float, default=0.01, help="laju kedatangan workflow (per satuan waktu)")
+    parser.add_argument("--policy", choices=POLICIES, nargs="+", default=list(POLICIES))
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    import time
+
+    args = parse_args()
+    workflows = random_workflows(args.workflows, args.n, args.processors, args.ccr, rate=args.rate,
+                                 rng=random.Random(args.seed))
+    wset = WorkflowSet(workflows, args.processors)
+    wset.baseline()
+
+    print(f"{'policy':<12} {'makespan':>10} {'avg slowdown':>13} {'max slowdown':>13} {'unfairness':>11} {'detik':>7}")
+    for policy in args.policy:
+        start = time.perf_counter()
+        assignment, AST, _ = multi_workflow_schedule(wset, policy)
+        elapsed = time.perf_counter() - start
+        m = evaluate_workflows(wset, assignment, AST)
+        print(f"{policy:<12} {m['makespan']:>10.1f} {m['avg_slowdown']:>13.3f} "
+              f"{m['max_slowdown']:>13.3f} {m['unfairness']:>11.2f} {elapsed:>7.2f}")
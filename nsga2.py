@@ -0,0 +1,174 @@
+# nsga2.py
+# Penjadwal multi-objektif ala NSGA-II di atas metrik evaluate.py
+# (makespan, energy, cost, reliability, load_balance). Kromosom sama dengan
+# ga_scheduler: list/array task -> prosesor. Hasilnya Pareto front per DAG.
+import random
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+import instrument
+from compiled_dag import CompiledDAG, compile_dag
+from evaluate import evaluate_schedule_batch
+from ga_scheduler import compute_priorities, init_population, inject_seeds
+
+OBJECTIVES = ("makespan", "energy", "cost", "reliability", "load_balance")
+
+# objektif yang dimaksimalkan (sisanya diminimalkan)
+MAXIMIZE = ("reliability",)
+
+
+def objective_matrix(metrics: Dict[str, np.ndarray], objectives: Sequence[str] = OBJECTIVES) -> np.ndarray:
+    """Matriks objektif (pop_size, m) yang semuanya diminimalkan."""
+    unknown = [o for o in objectives if o not in OBJECTIVES]
+    if unknown:
+        raise ValueError(f"Objektif tidak dikenal: {unknown}. Pilihan: {OBJECTIVES}")
+    return np.column_stack([-metrics[o] if o in MAXIMIZE else metrics[o] for o in objectives])
+
+
+def fast_non_dominated_sort(F: np.ndarray) -> np.ndarray:
+    """
+    Rank Pareto tiap solusi (0 = front pertama / non-dominated).
+    Relasi dominasi dihitung sekali sebagai matriks bool (N, N):
+    dominates[i, j] = i tidak lebih buruk di semua objektif dan lebih baik di salah satunya.
+    """
+    N = F.shape[0]
+    dominates = (F[:, None, :] <= F[None, :, :]).all(axis=2) & (F[:, None, :] < F[None, :, :]).any(axis=2)
+    count = dominates.sum(axis=0)  # jumlah solusi yang mendominasi j
+
+    rank = np.full(N, -1, dtype=np.int64)
+    front = np.flatnonzero(count == 0)
+    r = 0
+    while front.size:
+        rank[front] = r
+        count = count - dominates[front].sum(axis=0)
+        count[front] = -1
+        front = np.flatnonzero(count == 0)
+        r += 1
+    return rank
+
+
+def crowding_distance(F: np.ndarray, rank: np.ndarray) -> np.ndarray:
+    """
+    Crowding distance per front: jumlah (jarak tetangga / rentang objektif)
+    di semua objektif, solusi ujung tiap objektif = inf.
+    """
+    N, m = F.shape
+    dist = np.zeros(N)
+    for r in np.unique(rank):
+        idx = np.flatnonzero(rank == r)
+        k = idx.size
+        if k <= 2:
+            dist[idx] = np.inf
+            continue
+
+        sub = F[idx]
+        order = np.argsort(sub, axis=0, kind="stable")
+        vals = np.take_along_axis(sub, order, axis=0)
+        span = vals[-1] - vals[0]
+        span[span == 0] = 1.0
+
+        d = np.empty((k, m))
+        d[0] = d[-1] = np.inf
+        d[1:-1] = (vals[2:] - vals[:-2]) / span
+        contrib = np.empty((k, m))
+        np.put_along_axis(contrib, order, d, axis=0)
+        dist[idx] = contrib.sum(axis=1)
+    return dist
+
+
+def _tournament(rank, crowd, count, rng):
+    # binary tournament: rank lebih kecil menang, seri -> crowding lebih besar
+    a, b = rng.integers(0, rank.size, size=(2, count))
+    a_wins = (rank[a] < rank[b]) | ((rank[a] == rank[b]) & (crowd[a] > crowd[b]))
+    return np.where(a_wins, a, b)
+
+
+def _offspring(pop, rank, crowd, processors, mut_rate, rng):
+    # seleksi + one-point crossover + mutasi random reset, semua sekaligus
+    pop_size, n = pop.shape
+    parents = pop[_tournament(rank, crowd, pop_size + pop_size % 2, rng)]
+    p1, p2 = parents[0::2], parents[1::2]
+
+    cut = rng.integers(1, n, size=(p1.shape[0], 1)) if n > 1 else np.full((p1.shape[0], 1), n)
+    head = np.arange(n)[None, :] < cut
+    children = np.concatenate([np.where(head, p1, p2), np.where(head, p2, p1)])[:pop_size]
+
+    mask = rng.random(children.shape) < mut_rate
+    children[mask] = rng.integers(0, processors, size=int(mask.sum()))
+    return children
+
+
+@instrument.timed("nsga2")
+def nsga2_schedule(
+    tasks,
+    edges,
+    processors: int = 4,
+    pop_size: int = 40,
+    gens: int = 40,
+    mut_rate: float = 0.1,
+    objectives: Sequence[str] = OBJECTIVES,
+    dag: Optional[CompiledDAG] = None,
+    seeds: Optional[Sequence[Sequence[int]]] = None,
+) -> List[dict]:
+    """
+    NSGA-II: populasi P dan anak Q (ukuran sama) digabung, diurutkan dengan
+    fast non-dominated sort + crowding distance, lalu pop_size terbaik lanjut.
+    Objektif seluruh populasi dihitung sekaligus (evaluate_schedule_batch).
+
+    objectives: subset dari OBJECTIVES (reliability dimaksimalkan, sisanya diminimalkan)
+    seeds     : kromosom awal, mis. assignment HEFT (lihat ga_scheduler.inject_seeds)
+
+    Return: Pareto front populasi akhir (tanpa duplikat, urut makespan),
+    list of dict {"assignment": [...], "makespan": ..., "energy": ..., ...}
+    """
+    objectives = tuple(objectives)
+    n = len(tasks)
+    if n == 0:
+        return []
+
+    if dag is None:
+        dag = compile_dag(tasks, edges)
+
+    priorities = compute_priorities(tasks, edges, dag)
+    population = init_population(pop_size, n, processors, priorities, tasks)
+    if seeds:
+        inject_seeds(population, seeds, processors)
+    pop = np.array(population, dtype=np.int64).reshape(pop_size, n)
+    rng = np.random.default_rng(random.getrandbits(64))
+
+    metrics = evaluate_schedule_batch(pop, tasks, edges, processors, dag)
+    F = objective_matrix(metrics, objectives)
+    rank = fast_non_dominated_sort(F)
+    crowd = crowding_distance(F, rank)
+
+    instrument.count("nsga2.generations", gens)
+    instrument.count("nsga2.evaluations", pop_size * (gens + 1))
+
+    for _ in range(gens):
+        children = _offspring(pop, rank, crowd, processors, mut_rate, rng)
+        child_metrics = evaluate_schedule_batch(children, tasks, edges, processors, dag)
+
+        # R = P ∪ Q, lalu seleksi elitis berdasarkan (rank, -crowding)
+        pop = np.concatenate([pop, children])
+        metrics = {key: np.concatenate([metrics[key], child_metrics[key]]) for key in metrics}
+        F = objective_matrix(metrics, objectives)
+        rank = fast_non_dominated_sort(F)
+        crowd = crowding_distance(F, rank)
+
+        keep = np.lexsort((-crowd, rank))[:pop_size]
+        pop = pop[keep]
+        metrics = {key: val[keep] for key, val in metrics.items()}
+        rank = fast_non_dominated_sort(F[keep])
+        crowd = crowding_distance(F[keep], rank)
+
+    # front pertama, tanpa kromosom duplikat, urut makespan
+    first = np.flatnonzero(rank == 0)
+    _, unique = np.unique(pop[first], axis=0, return_index=True)
+    first = first[np.sort(unique)]
+    first = first[np.argsort(metrics["makespan"][first], kind="stable")]
+
+    return [
+        dict({"assignment": pop[k].tolist()}, **{key: float(val[k]) for key, val in metrics.items()})
+        for k in first
+    ]
@@ -1,94 +1,296 @@
 import csv
+import math
 import os
 import re
+from multiprocessing import Pool
+from statistics import NormalDist
+
+import matplotlib
+matplotlib.use("Agg")  # render ke file saja (juga di worker pool)
 import matplotlib.pyplot as plt
+from dataset import open_dataset
+
+# parameter sweep yang dipakai untuk mengelompokkan hasil
+GROUP_PARAMS = ("n", "processors", "ccr", "shape_alpha")
+
+# tingkat kepercayaan interval (pendekatan normal)
+CONFIDENCE = 0.95
 
+# Contoh nama folder:
+# dag_0_n10_ccr0.1_p4_shape0.5
+_FOLDER_RE = re.compile(r"_n(\d+)_ccr([0-9.]+)_p(\d+)_shape([0-9.]+)")
+_FOLDER_RE_OLD = re.compile(r"_n(\d+)_ccr([0-9.]+)_p(\d+)_")
 
-def load_results_with_meta(root="data/dags"):
-    runs = []
 
+class RunningStats:
+    """
+    Rata-rata & variansi berjalan (Welford): satu kali lewat data, memori O(1),
+    stabil secara numerik walaupun nilainya besar (mis. energy).
+    """
+
+    __slots__ = ("count", "mean", "m2")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, x: float) -> None:
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def ci(self, confidence: float = CONFIDENCE) -> float:
+        """Setengah lebar interval kepercayaan rata-rata (z * std / sqrt(count))."""
+        if self.count < 2:
+            return 0.0
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        return z * self.std / math.sqrt(self.count)
+
+
+def parse_folder_meta(folder, ds=None):
+    """n / ccr / processors / shape_alpha dari dataset packed atau nama folder (None kalau tidak ada)."""
+    if ds is not None and folder in ds.names:
+        return ds.meta(folder)
+
+    m = _FOLDER_RE.search(folder)
+    if m:
+        return {"n": int(m.group(1)), "ccr": float(m.group(2)),
+                "processors": int(m.group(3)), "shape_alpha": float(m.group(4))}
+    m = _FOLDER_RE_OLD.search(folder)
+    if m:
+        return {"n": int(m.group(1)), "ccr": float(m.group(2)),
+                "processors": int(m.group(3)), "shape_alpha": None}
+    return {"n": None, "ccr": None, "processors": None, "shape_alpha": None}
+
+
+def read_results(res_path):
+    """results.csv -> {algo: {metrik: nilai}} (csv.reader biasa, tanpa DictReader per baris)."""
+    algo_results = {}
+    with open(res_path, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header or header[0] != "algorithm":
+            return algo_results
+        names = header[1:]
+        for row in reader:
+            if row and row[0]:
+                algo_results[row[0]] = dict(zip(names, map(float, row[1:])))
+    return algo_results
+
+
+def iter_runs(root="data/dags", dataset=None):
+    """
+    Generator hasil per folder DAG (urut nama folder), satu folder satu kali
+    baca. Dipakai aggregate_runs supaya semua hasil tidak perlu disimpan di memori.
+    """
     if not os.path.isdir(root):
-        return runs
+        return
 
-    for folder in sorted(os.listdir(root)):
+    ds = open_dataset(dataset) if dataset is not None else None
+
+    with os.scandir(root) as it:
+        folders = sorted(entry.name for entry in it if entry.is_dir())
+
+    for folder in folders:
         full_folder = os.path.join(root, folder)
-        res_path = os.path.join(full_folder, "results.csv")
-        if not os.path.isfile(res_path):
+        try:
+            algo_results = read_results(os.path.join(full_folder, "results.csv"))
+        except FileNotFoundError:
             continue
 
-        # Contoh nama folder:
-        # dag_0_n10_ccr0.1_p4_shape0.5
-        m = re.search(r"_n(\d+)_ccr([0-9.]+)_p(\d+)_", folder)
-        if m:
-            n = int(m.group(1))
-            ccr = float(m.group(2))
-            processors = int(m.group(3))
-        else:
-            n = None
-            ccr = None
-            processors = None
-
-        # load hasil per algoritma
-        with open(res_path) as f:
-            reader = csv.DictReader(f)
-            algo_results = {}
-            for row in reader:
-                algo = row.get("algorithm")
-                if not algo:
-                    continue
-                metrics = {k: float(v) for k, v in row.items() if k != "algorithm"}
-                algo_results[algo] = metrics
-
         if algo_results:
-            runs.append({
-                "folder": folder,
-                "n": n,
-                "ccr": ccr,
-                "processors": processors,
-                "results": algo_results,
-            })
+            run = {"folder": folder}
+            run.update(parse_folder_meta(folder, ds))
+            run["results"] = algo_results
+            run["fronts"] = load_fronts(full_folder)
+            yield run
 
-    return runs
 
+def load_results_with_meta(root="data/dags", dataset=None):
+    """
+    dataset: file dataset packed (opsional). Kalau diberikan, n/ccr/processors/
+    shape_alpha diambil dari array meta di file itu, bukan dari nama folder.
+    """
+    return list(iter_runs(root, dataset))
 
-def aggregate_by_param(runs, param):
-    grouped = {}
+
+def load_fronts(folder):
+    """Pareto front per algoritma dari fronts.csv (kosong kalau tidak ada)."""
+    fronts = {}
+    path = os.path.join(folder, "fronts.csv")
+    if not os.path.isfile(path):
+        return fronts
+
+    with open(path) as f:
+        for row in csv.DictReader(f):
+            algo = row.pop("algorithm")
+            row.pop("point", None)
+            fronts.setdefault(algo, []).append({k: float(v) for k, v in row.items()})
+    return fronts
+
+
+def aggregate_runs(runs, params=GROUP_PARAMS):
+    """
+    Satu kali lewat semua run (boleh generator): akumulator RunningStats untuk
+    setiap parameter pengelompokan sekaligus.
+    return: {param: {nilai_param: {algo: {metrik: RunningStats}}}}
+    """
+    aggregated = {param: {} for param in params}
     for r in runs:
-        key = r.get(param)
-        if key is None:
-            continue
+        for param in params:
+            key = r.get(param)
+            if key is None:
+                continue
+            group = aggregated[param].setdefault(key, {})
+            for algo, metrics in r["results"].items():
+                acc = group.get(algo)
+                if acc is None:
+                    acc = group[algo] = {m: RunningStats() for m in metrics}
+                for m, v in metrics.items():
+                    stats = acc.get(m)
+                    if stats is None:
+                        stats = acc[m] = RunningStats()
+                    stats.add(v)
+    return aggregated
+
+
+def scan_results(root="data/dags", dataset=None, params=GROUP_PARAMS):
+    """
+    Satu kali lewat semua folder: agregat per parameter, urutan metrik (dari
+    run pertama), run yang punya Pareto front (hanya itu yang perlu titik
+    mentahnya), dan jumlah folder.
+    """
+    metrics_order = []
+    front_runs = []
+    total = 0
 
-        if key not in grouped:
-            grouped[key] = {}
+    def stream():
+        nonlocal total
+        for run in iter_runs(root, dataset):
+            total += 1
+            if not metrics_order:
+                metrics_order.extend(next(iter(run["results"].values())).keys())
+            if run["fronts"]:
+                front_runs.append(run)
+            yield run
 
-        for algo, metrics in r["results"].items():
-            if algo not in grouped[key]:
-                grouped[key][algo] = {m: [] for m in metrics}
-            for m, v in metrics.items():
-                grouped[key][algo][m].append(v)
+    aggregated = aggregate_runs(stream(), params)
+    return aggregated, metrics_order, front_runs, total
 
+
+def aggregate_store(store, params=GROUP_PARAMS, **filters):
+    """
+    Agregat yang sama dengan scan_results, tapi dihitung dengan SQL dari
+    results store (results_store.py) tanpa membuka folder satu per satu.
+    filters: latest / code_version / params_key (lihat ResultsStore.aggregate)
+    """
     aggregated = {}
-    for key, algo_dict in grouped.items():
-        aggregated[key] = {}
-        for algo, metric_lists in algo_dict.items():
-            aggregated[key][algo] = {
-                m: sum(vals) / len(vals) for m, vals in metric_lists.items()
-            }
-    return aggregated
+    metrics_order = []
+    for param in params:
+        aggregated[param] = {}
+        for key, algos in store.aggregate(param, **filters).items():
+            group = aggregated[param][key] = {}
+            for algo, metrics in algos.items():
+                acc = group[algo] = {}
+                for metric, (count, mean, m2) in metrics.items():
+                    stats = acc[metric] = RunningStats()
+                    stats.count, stats.mean, stats.m2 = count, mean, m2
+                    if metric not in metrics_order:
+                        metrics_order.append(metric)
+    return aggregated, metrics_order
 
 
-def plot_metric_vs_param(
+def aggregate_by_param(runs, param):
+    """Pengelompokan untuk satu parameter saja: {nilai_param: {algo: {metrik: RunningStats}}}."""
+    return aggregate_runs(runs, (param,))[param]
+
+
+def front_plot_jobs(runs, out_dir, pairs=(("makespan", "energy"), ("energy", "cost"), ("makespan", "cost")),
+                    dpi=300):
+    """
+    Job scatter titik Pareto front semua DAG untuk tiap pasangan metrik.
+    Nilai dinormalisasi terhadap HEFT di DAG yang sama (1.0 = sama dengan
+    HEFT), jadi DAG dengan skala berbeda bisa digabung; warna = CCR.
+    """
+    algos = sorted({algo for r in runs for algo in r.get("fronts", {})})
+    jobs = []
+    for x_metric, y_metric in pairs:
+        for algo in algos:
+            xs, ys, colors = [], [], []
+            for r in runs:
+                ref = r["results"].get("HEFT", {})
+                for point in r.get("fronts", {}).get(algo, []):
+                    x_ref = ref.get(x_metric) or 1.0
+                    y_ref = ref.get(y_metric) or 1.0
+                    xs.append(point[x_metric] / x_ref)
+                    ys.append(point[y_metric] / y_ref)
+                    colors.append(r["ccr"] if r["ccr"] is not None else 0.0)
+            if not xs:
+                continue
+            jobs.append(("front", {
+                "xs": xs, "ys": ys, "colors": colors,
+                "x_metric": x_metric, "y_metric": y_metric, "algo": algo,
+                "path": os.path.join(out_dir, f"front_{algo}_{y_metric}_vs_{x_metric}.png"),
+                "dpi": dpi,
+            }))
+    return jobs
+
+
+def _render_front(job):
+    plt.figure(figsize=(6, 4))
+    sc = plt.scatter(job["xs"], job["ys"], c=job["colors"], cmap="viridis", s=10, alpha=0.7)
+    plt.colorbar(sc, label="CCR")
+    plt.axvline(1.0, color="blue", linestyle=":", linewidth=1)
+    plt.axhline(1.0, color="blue", linestyle=":", linewidth=1)
+    plt.grid(True, linestyle="--", alpha=0.4)
+    plt.xlabel(f"{job['x_metric']} / HEFT")
+    plt.ylabel(f"{job['y_metric']} / HEFT")
+    plt.title(f"Pareto front {job['algo']}: {job['y_metric']} vs {job['x_metric']}")
+    plt.tight_layout()
+    plt.savefig(job["path"], dpi=job["dpi"])
+    plt.close()
+
+
+def plot_fronts(runs, out_dir, pairs=(("makespan", "energy"), ("energy", "cost"), ("makespan", "cost")),
+                workers=1, dpi=300):
+    render_jobs(front_plot_jobs(runs, out_dir, pairs, dpi), out_dir, workers)
+
+
+# styling per algoritma
+algo_styles = {
+    "HEFT": {"color": "blue", "marker": "^"},
+    "GA": {"color": "red", "marker": "o"},
+    "CPOP": {"color": "green", "marker": "s"},
+    "PEFT": {"color": "purple", "marker": "D"},
+    "HEFT-LA": {"color": "orange", "marker": "v"},
+    # kalau nanti nambah algo lain, tambahin di sini
+}
+
+
+def metric_plot_jobs(
     aggregated,
     param_name,
     metrics_order,
     out_dir,
     categorical_x=False,
     x_labels=None,
+    dpi=300,
 ):
-    # kunci param (n / processors / ccr)
+    """
+    Job grafik metrik vs parameter (satu job = satu PNG): garis rata-rata per
+    algoritma + pita interval kepercayaan. Job berisi data polos (bisa di-pickle)
+    supaya bisa dirender di worker pool.
+    """
+    # kunci param (n / processors / ccr / shape_alpha)
     keys = sorted(aggregated.keys())
     if not keys:
-        return
+        return []
 
     # kalau mau jarak X rata: pakai index 0..len-1
     if categorical_x:
@@ -97,13 +299,7 @@ def plot_metric_vs_param(
             x_labels = keys
     else:
         x_plot = keys
-
-    # styling per algoritma
-    algo_styles = {
-        "HEFT": {"color": "blue", "marker": "^"},
-        "GA": {"color": "red", "marker": "o"},
-        # kalau nanti nambah algo lain, tambahin di sini
-    }
+        x_labels = keys
 
     # kumpulin nama algoritma yang ada
     algos = set()
@@ -111,117 +307,180 @@ def plot_metric_vs_param(
         algos.update(v.keys())
     algos = sorted(algos)
 
+    jobs = []
     for metric in metrics_order:
-        plt.figure(figsize=(6, 4))  # ukuran mirip grafik paper
-
+        series = []
         for algo in algos:
-            y_vals = []
+            means, cis = [], []
             for k in keys:
-                y_vals.append(aggregated[k].get(algo, {}).get(metric, float("nan")))
-
-            style = algo_styles.get(algo, {})
-            plt.plot(
-                x_plot,
-                y_vals,
-                label=algo,
-                marker=style.get("marker", "o"),
-                color=style.get("color", None),
-                linewidth=1.5,
-                markersize=6,
-            )
-
-        plt.grid(True, linestyle="--", alpha=0.4)
-        plt.ylabel(metric)
-        plt.title(f"{metric} vs {param_name}")
-
-        # handle label X
-        if categorical_x:
-            plt.xticks(x_plot, x_labels)
-        else:
-            plt.xticks(x_plot, keys)
-        plt.xlabel(param_name)
-
-        plt.legend(frameon=False)
-        plt.tight_layout()
+                stats = aggregated[k].get(algo, {}).get(metric)
+                means.append(stats.mean if stats is not None and stats.count else float("nan"))
+                cis.append(stats.ci() if stats is not None else 0.0)
+            series.append((algo, means, cis))
 
-        os.makedirs(out_dir, exist_ok=True)
         safe_metric = metric.replace(" ", "_")
-        fname = f"{safe_metric}_vs_{param_name}.png"
-        fpath = os.path.join(out_dir, fname)
+        jobs.append(("metric", {
+            "x_plot": x_plot,
+            "x_labels": list(x_labels),
+            "series": series,
+            "metric": metric,
+            "param_name": param_name,
+            "path": os.path.join(out_dir, f"{safe_metric}_vs_{param_name}.png"),
+            "dpi": dpi,
+        }))
+    return jobs
+
+
+def _render_metric(job):
+    plt.figure(figsize=(6, 4))  # ukuran mirip grafik paper
+    x_plot = job["x_plot"]
+
+    for algo, means, cis in job["series"]:
+        style = algo_styles.get(algo, {})
+        line, = plt.plot(
+            x_plot,
+            means,
+            label=algo,
+            marker=style.get("marker", "o"),
+            color=style.get("color", None),
+            linewidth=1.5,
+            markersize=6,
+        )
+        if any(cis):
+            lo = [m - c for m, c in zip(means, cis)]
+            hi = [m + c for m, c in zip(means, cis)]
+            plt.fill_between(x_plot, lo, hi, color=line.get_color(), alpha=0.15, linewidth=0)
+
+    plt.grid(True, linestyle="--", alpha=0.4)
+    plt.ylabel(job["metric"])
+    plt.title(f"{job['metric']} vs {job['param_name']} (CI {CONFIDENCE:.0%})")
+
+    # handle label X
+    plt.xticks(x_plot, job["x_labels"])
+    plt.xlabel(job["param_name"])
+
+    plt.legend(frameon=False)
+    plt.tight_layout()
+    plt.savefig(job["path"], dpi=job["dpi"])
+    plt.close()
+
+
+def _render(job):
+    kind, payload = job
+    if kind == "front":
+        _render_front(payload)
+    else:
+        _render_metric(payload)
+    return payload["path"]
+
 
-        plt.savefig(fpath, dpi=300)
-        plt.close()
+def render_jobs(jobs, out_dir, workers=1):
+    """Render semua job grafik; workers > 1 = paralel di process pool (0 = semua core)."""
+    if not jobs:
+        return []
+    os.makedirs(out_dir, exist_ok=True)
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(jobs))
+    if workers <= 1:
+        return [_render(job) for job in jobs]
+    with Pool(workers) as pool:
+        return pool.map(_render, jobs, chunksize=1)
+
+
+def plot_metric_vs_param(
+    aggregated,
+    param_name,
+    metrics_order,
+    out_dir,
+    categorical_x=False,
+    x_labels=None,
+    workers=1,
+    dpi=300,
+):
+    jobs = metric_plot_jobs(aggregated, param_name, metrics_order, out_dir, categorical_x, x_labels, dpi)
+    render_jobs(jobs, out_dir, workers)
 
 
 def append_aggregated_to_csv(aggregated, param_name, out_path, write_header=False):
     """
     Gabungin semua rata-rata ke 1 CSV.
     Format:
-    comparison,param_value,algorithm,metric,mean
+    comparison,param_value,algorithm,metric,mean,std,count,ci_low,ci_high
     """
     mode = "w" if write_header else "a"
     with open(out_path, mode, newline="") as f:
         writer = csv.writer(f)
         if write_header:
-            writer.writerow(["comparison", "param_value", "algorithm", "metric", "mean"])
+            writer.writerow(["comparison", "param_value", "algorithm", "metric",
+                             "mean", "std", "count", "ci_low", "ci_high"])
 
         for param_value in sorted(aggregated.keys()):
             for algo, metrics in aggregated[param_value].items():
-                for metric, mean_val in metrics.items():
-                    writer.writerow([param_name, param_value, algo, metric, mean_val])
+                for metric, stats in metrics.items():
+                    ci = stats.ci()
+                    writer.writerow([param_name, param_value, algo, metric,
+                                     stats.mean, stats.std, stats.count, stats.mean - ci, stats.mean + ci])
+
+
+def _labels(keys):
+    return [("{:.2g}".format(v)).rstrip("0").rstrip(".") for v in keys]
 
 
 if __name__ == "__main__":
-    runs = load_results_with_meta()
-    if not runs:
-        print("No results found in data/dags. Jalankan main.py dulu.")
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Grafik & rata-rata hasil eksperimen.")
+    parser.add_argument("--root", default="data/dags", help="folder berisi DAG + results.csv")
+    parser.add_argument("--dataset", default=None, help="ambil meta DAG dari file dataset packed")
+    parser.add_argument("--out", default="results_preview", help="folder output grafik & CSV")
+    parser.add_argument("--workers", type=int, default=0, help="proses render paralel (0 = semua core)")
+    parser.add_argument("--dpi", type=int, default=300, help="resolusi PNG")
+    parser.add_argument("--store", default=None, help="baca hasil dari results store SQLite (main.py --store)")
+    parser.add_argument("--code-version", default=None, help="dengan --store: hanya hasil dari versi kode ini")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.store is not None:
+        from results_store import open_store
+
+        with open_store(args.store) as store:
+            aggregated, metrics_order = aggregate_store(store, code_version=args.code_version)
+            front_runs = store.fronts(code_version=args.code_version)
+            total = store.dag_count(code_version=args.code_version)
+    else:
+        aggregated, metrics_order, front_runs, total = scan_results(args.root, args.dataset)
+    if not total:
+        print(f"No results found in {args.root}. Jalankan main.py dulu.")
     else:
-        out_dir = "results_preview"
+        out_dir = args.out
         os.makedirs(out_dir, exist_ok=True)
+        loaded = time.perf_counter()
 
-        # ambil urutan metrik dari satu sample
-        sample_metrics = next(iter(runs[0]["results"].values()))
-        metrics_order = list(sample_metrics.keys())
-
-        # n (jumlah tugas) → pakai X numeric biasa
-        agg_n = aggregate_by_param(runs, "n")
-        plot_metric_vs_param(
-            agg_n,
-            "n",
-            metrics_order,
-            out_dir,
-            categorical_x=False,
-        )
+        jobs = []
+        # n (jumlah tugas) & processors → pakai X numeric biasa
+        jobs += metric_plot_jobs(aggregated["n"], "n", metrics_order, out_dir, dpi=args.dpi)
+        jobs += metric_plot_jobs(aggregated["processors"], "processors", metrics_order, out_dir, dpi=args.dpi)
 
-        # processors → juga numeric biasa
-        agg_p = aggregate_by_param(runs, "processors")
-        plot_metric_vs_param(
-            agg_p,
-            "processors",
-            metrics_order,
-            out_dir,
-            categorical_x=False,
-        )
+        # CCR & shape_alpha → X diratakan (kategori), label tetap nilai aslinya
+        for param, name in (("ccr", "CCR"), ("shape_alpha", "shape_alpha")):
+            jobs += metric_plot_jobs(aggregated[param], name, metrics_order, out_dir, categorical_x=True,
+                                     x_labels=_labels(sorted(aggregated[param])), dpi=args.dpi)
 
-        # CCR → X diratakan (kategori), label tetap nilai CCR
-        agg_ccr = aggregate_by_param(runs, "ccr")
-        ccr_keys = sorted(agg_ccr.keys())
-        ccr_labels = [("{:.2g}".format(v)).rstrip("0").rstrip(".") for v in ccr_keys]
-
-        plot_metric_vs_param(
-            agg_ccr,
-            "CCR",
-            metrics_order,
-            out_dir,
-            categorical_x=True,
-            x_labels=ccr_labels,
-        )
+        # Pareto front (kalau main.py dijalankan dengan --nsga2)
+        jobs += front_plot_jobs(front_runs, out_dir, dpi=args.dpi)
+
+        render_jobs(jobs, out_dir, args.workers)
 
         # ====== EXPORT CSV RATA-RATA (GABUNGAN) ======
         csv_path = os.path.join(out_dir, "averages_all_comparisons.csv")
-        append_aggregated_to_csv(agg_n, "n", csv_path, write_header=True)
-        append_aggregated_to_csv(agg_p, "processors", csv_path, write_header=False)
-        append_aggregated_to_csv(agg_ccr, "CCR", csv_path, write_header=False)
+        append_aggregated_to_csv(aggregated["n"], "n", csv_path, write_header=True)
+        append_aggregated_to_csv(aggregated["processors"], "processors", csv_path, write_header=False)
+        append_aggregated_to_csv(aggregated["ccr"], "CCR", csv_path, write_header=False)
+        append_aggregated_to_csv(aggregated["shape_alpha"], "shape_alpha", csv_path, write_header=False)
 
+        done = time.perf_counter()
+        print(f"{total} folder dibaca dalam {loaded - start:.1f}s, {len(jobs)} grafik dirender dalam {done - loaded:.1f}s")
         print(f"Gambar disimpan ke folder: {out_dir}")
         print(f"CSV rata-rata disimpan ke: {csv_path}")
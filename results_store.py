@@ -0,0 +1,233 @@
+# results_store.py
+# Penyimpanan hasil eksperimen di satu database SQLite (append-only, ber-index),
+# sebagai ganti results.csv per folder. Satu baris = satu jadwal hasil satu
+# algoritma untuk satu DAG, lengkap dengan n/ccr/processors/shape_alpha, seed,
+# versi kode, dan hash parameter sweep. Titik Pareto front disimpan sebagai
+# baris dengan kolom point = indeks titik (NULL untuk algoritma satu jadwal).
+#
+#   python results_store.py --db data/results.sqlite --by ccr --metric makespan
+import argparse
+import json
+import math
+import os
+import sqlite3
+import time
+
+METRICS = ("makespan", "energy", "cost", "reliability", "load_balance")
+
+# kolom yang bisa dipakai untuk mengelompokkan
+GROUP_COLUMNS = ("n", "ccr", "processors", "shape_alpha", "algorithm", "seed", "code_version", "params_key")
+
+RESULTS_DB = "results.sqlite"
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    dag TEXT NOT NULL,
+    n INTEGER,
+    ccr REAL,
+    processors INTEGER,
+    shape_alpha REAL,
+    algorithm TEXT NOT NULL,
+    point INTEGER,
+    seed INTEGER,
+    code_version TEXT,
+    params_key TEXT,
+    run_key TEXT,
+    created REAL,
+    {", ".join(f"{m} REAL" for m in METRICS)}
+);
+CREATE INDEX IF NOT EXISTS results_dag ON results (dag, algorithm);
+CREATE INDEX IF NOT EXISTS results_n ON results (n, algorithm);
+CREATE INDEX IF NOT EXISTS results_ccr ON results (ccr, algorithm);
+CREATE INDEX IF NOT EXISTS results_processors ON results (processors, algorithm);
+CREATE INDEX IF NOT EXISTS results_shape ON results (shape_alpha, algorithm);
+CREATE INDEX IF NOT EXISTS results_version ON results (code_version, params_key);
+CREATE INDEX IF NOT EXISTS results_run_key ON results (run_key);
+CREATE TABLE IF NOT EXISTS params (
+    params_key TEXT PRIMARY KEY,
+    params TEXT
+);
+"""
+
+_COLUMNS = ("dag", "n", "ccr", "processors", "shape_alpha", "algorithm", "point", "seed",
+            "code_version", "params_key", "run_key", "created") + METRICS
+_INSERT = f"INSERT INTO results ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})"
+
+
+class ResultsStore:
+    """
+    Penulisan dibuffer lalu dimasukkan per batch dalam satu transaksi
+    (default 256 baris). WAL + busy_timeout: beberapa proses (mis. dua sweep
+    paralel) boleh menulis ke file yang sama; pembaca tidak memblokir penulis.
+    """
+
+    def __init__(self, path, batch_size=256, timeout=60.0):
+        self.path = path
+        self.batch_size = batch_size
+        self._pending = []
+        self._params = {}
+        self.conn = sqlite3.connect(path, timeout=timeout)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+    def add(self, dag, meta, results, seed=None, code_version=None, params=None, params_key=None, run_key=None):
+        """
+        Buffer hasil satu DAG (format dict main.run_dag: algo -> metrik, atau
+        algo -> list metrik untuk Pareto front). Ditulis saat buffer penuh / flush().
+        """
+        if params is not None and params_key is not None:
+            self._params[params_key] = json.dumps(params, sort_keys=True, default=str)
+        created = time.time()
+        base = (dag, meta.get("n"), meta.get("ccr"), meta.get("processors"), meta.get("shape_alpha"))
+        tail = (seed, code_version, params_key, run_key, created)
+        for algo, metrics in results.items():
+            points = metrics if isinstance(metrics, list) else [metrics]
+            for k, point in enumerate(points):
+                index = k if isinstance(metrics, list) else None
+                values = tuple(point.get(m) for m in METRICS)
+                self._pending.append(base + (algo, index) + tail + values)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Masukkan semua baris yang dibuffer dalam satu transaksi."""
+        if not self._pending and not self._params:
+            return
+        with self.conn:
+            self.conn.executemany(_INSERT, self._pending)
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO params (params_key, params) VALUES (?, ?)", self._params.items()
+            )
+        self._pending = []
+        self._params = {}
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def run_keys(self):
+        """Semua run_key yang sudah tersimpan (untuk melewati DAG yang up to date)."""
+        return {row[0] for row in self.conn.execute("SELECT DISTINCT run_key FROM results WHERE run_key IS NOT NULL")}
+
+    def _source(self, latest=True, code_version=None, params_key=None):
+        # subquery baris yang dipakai: filter versi/parameter, lalu (opsional)
+        # hanya run terbaru per (dag, algorithm); semua titik front satu run
+        # punya created yang sama, jadi ikut terbawa utuh
+        where, args = ["1=1"], []
+        if code_version is not None:
+            where.append("code_version = ?")
+            args.append(code_version)
+        if params_key is not None:
+            where.append("params_key = ?")
+            args.append(params_key)
+        sql = f"SELECT * FROM results WHERE {' AND '.join(where)}"
+        if latest:
+            sql = f"""
+                SELECT * FROM (
+                    SELECT *, RANK() OVER (
+                        PARTITION BY dag, algorithm ORDER BY created DESC
+                    ) AS rn FROM ({sql})
+                ) WHERE rn = 1"""
+        return sql, args
+
+    def dag_count(self, latest=True, code_version=None, params_key=None) -> int:
+        source, args = self._source(latest, code_version, params_key)
+        return self.conn.execute(f"SELECT COUNT(DISTINCT dag) FROM ({source})", args).fetchone()[0]
+
+    def aggregate(self, by, metrics=METRICS, latest=True, code_version=None, params_key=None):
+        """
+        Rata-rata, variansi, dan jumlah per (by, algorithm) untuk algoritma satu
+        jadwal, dihitung di SQL (variansi dua tahap: rata-rata dulu, lalu jumlah
+        kuadrat selisih).
+        return: {nilai_by: {algo: {metrik: (count, mean, m2)}}}
+        """
+        if by not in GROUP_COLUMNS:
+            raise ValueError(f"by harus salah satu dari {GROUP_COLUMNS}, bukan {by!r}.")
+        unknown = [m for m in metrics if m not in METRICS]
+        if unknown:
+            raise ValueError(f"Metrik tidak dikenal: {unknown}. Pilihan: {METRICS}")
+
+        source, args = self._source(latest, code_version, params_key)
+        means = ", ".join(f"AVG({m}) AS mu_{m}" for m in metrics)
+        m2 = ", ".join(f"SUM((r.{m} - g.mu_{m}) * (r.{m} - g.mu_{m}))" for m in metrics)
+        mus = ", ".join(f"g.mu_{m}" for m in metrics)
+        sql = f"""
+            WITH r AS ({source}),
+            g AS (
+                SELECT {by} AS k, algorithm, COUNT(*) AS cnt, {means}
+                FROM r WHERE point IS NULL AND {by} IS NOT NULL GROUP BY {by}, algorithm
+            )
+            SELECT g.k, g.algorithm, g.cnt, {mus}, {m2}
+            FROM r JOIN g ON r.{by} = g.k AND r.algorithm = g.algorithm
+            WHERE r.point IS NULL
+            GROUP BY g.k, g.algorithm"""
+
+        out = {}
+        m = len(metrics)
+        for row in self.conn.execute(sql, args):
+            key, algo, count = row[0], row[1], row[2]
+            out.setdefault(key, {})[algo] = {
+                metric: (count, row[3 + i], row[3 + m + i]) for i, metric in enumerate(metrics)
+            }
+        return out
+
+    def fronts(self, latest=True, code_version=None, params_key=None):
+        """
+        Run yang punya Pareto front, dalam format plot_results.iter_runs:
+        [{"folder", "ccr", "results": {"HEFT": {...}}, "fronts": {algo: [...]}}]
+        """
+        source, args = self._source(latest, code_version, params_key)
+        cols = ", ".join(METRICS)
+        sql = f"""
+            WITH r AS ({source})
+            SELECT dag, ccr, algorithm, point, {cols} FROM r
+            WHERE dag IN (SELECT dag FROM r WHERE point IS NOT NULL)
+            ORDER BY dag, algorithm, point"""
+        runs = {}
+        for dag, ccr, algo, point, *values in self.conn.execute(sql, args):
+            run = runs.setdefault(dag, {"folder": dag, "ccr": ccr, "results": {}, "fronts": {}})
+            metrics = dict(zip(METRICS, values))
+            if point is None:
+                run["results"][algo] = metrics
+            else:
+                run["fronts"].setdefault(algo, []).append(metrics)
+        return list(runs.values())
+
+
+def open_store(path):
+    """ResultsStore untuk path file; kalau path folder, pakai <folder>/results.sqlite."""
+    if os.path.isdir(path):
+        path = os.path.join(path, RESULTS_DB)
+    return ResultsStore(path)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Ringkasan hasil dari results store SQLite.")
+    parser.add_argument("--db", default=os.path.join("data", RESULTS_DB), help="file SQLite hasil")
+    parser.add_argument("--by", default="ccr", choices=GROUP_COLUMNS, help="kolom pengelompokan")
+    parser.add_argument("--metric", default="makespan", choices=METRICS)
+    parser.add_argument("--code-version", default=None, help="hanya hasil dari versi kode ini")
+    parser.add_argument("--params-key", default=None, help="hanya hasil dari parameter sweep ini")
+    parser.add_argument("--all-runs", action="store_true", help="pakai semua run, bukan hanya yang terbaru per DAG")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    with open_store(args.db) as store:
+        agg = store.aggregate(args.by, (args.metric,), not args.all_runs, args.code_version, args.params_key)
+    print(f"{args.by:<14} {'algorithm':<10} {'count':>7} {'mean':>14} {'std':>12}")
+    for key in sorted(agg):
+        for algo in sorted(agg[key]):
+            count, mean, m2 = agg[key][algo][args.metric]
+            std = math.sqrt(m2 / (count - 1)) if count > 1 else 0.0
+            print(f"{key!s:<14} {algo:<10} {count:>7} {mean:>14.6g} {std:>12.4g}")
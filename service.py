@@ -0,0 +1,429 @@
+# service.py
+# Daemon penjadwal: menerima DAG lewat HTTP (TCP atau unix socket), lalu
+# menjawab assignment + metrik evaluate_schedule. Front end asyncio, back end
+# process pool yang tetap hidup (NumPy & modul penjadwal cukup di-import sekali).
+# Request yang datang bersamaan digabung jadi batch sebelum dikirim ke worker,
+# tiap request punya deadline, dan antrean dibatasi (backpressure -> 429).
+#
+#   python service.py --port 8765 --workers 4
+#   curl -s localhost:8765/schedule -d @dag.json
+#
+# Body request (JSON, satu objek atau list objek):
+#   {"tasks": [{"task": 0, "cost": 3.0}, ...],
+#    "edges": [{"src": 0, "dst": 1, "comm": 2.0}, ...],
+#    "processors": 4,
+#    "cost_matrix": [[...], ...],        # opsional, biaya heterogen (n, p)
+#    "algorithm": "HEFT",                # lihat ALGORITHMS
+#    "params": {"insertion": true},      # opsional, parameter algoritma
+#    "seed": 0,                          # opsional, untuk GA
+#    "deadline": 2.0,                    # opsional, detik sejak request diterima
+#    "id": "..."}                        # opsional, dikembalikan apa adanya
+# Jawaban: {"id", "algorithm", "assignment": [...], "metrics": {...}}
+# atau {"id", "error": "..."}.
+import argparse
+import asyncio
+import json
+import multiprocessing as mp
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from compiled_dag import compile_dag
+from evaluate import evaluate_schedule
+from ga_scheduler import ga_schedule
+from heft import heft_schedule_times, schedule_order
+from list_schedulers import SCHEDULERS
+from main import GA_PARAMS
+
+ALGORITHMS = ("HEFT", "GA") + tuple(SCHEDULERS)
+
+# batas default (bisa diubah lewat CLI)
+BATCH_SIZE = 32
+BATCH_WAIT = 0.005
+MAX_PENDING = 1024
+DEADLINE = 30.0
+# porsi sisa deadline yang boleh dipakai GA
+GA_DEADLINE_FRACTION = 0.8
+
+_STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 413: "Payload Too Large",
+                429: "Too Many Requests", 500: "Internal Server Error", 504: "Gateway Timeout"}
+MAX_BODY = 64 * 1024 * 1024
+
+
+class RequestError(ValueError):
+    """Request tidak valid (HTTP 400)."""
+
+
+# parameter GA yang boleh dikirim client: nama -> (tipe, nilai minimum)
+GA_REQUEST_PARAMS = {
+    "pop_size": (int, 3),  # tournament_select mengambil 3 kontestan
+    "gens": (int, 1),
+    "mut_rate": (float, 0.0),
+    "stagnation": (int, 1),
+    "time_limit": (float, 0.0),
+    "max_evals": (int, 1),
+    "seed_fraction": (float, 0.0),
+    "seed_perturb": (float, 0.0),
+}
+
+
+def parse_ga_params(params: dict) -> dict:
+    """Validasi params GA sebelum dikirim ke pool (pop_size 0 dsb. gagal di worker)."""
+    out = {}
+    for key, value in params.items():
+        if key == "lower_bound":
+            if value is not None and not isinstance(value, (bool, int, float)):
+                raise RequestError("params.lower_bound harus true/false atau angka.")
+            out[key] = value
+            continue
+        if key not in GA_REQUEST_PARAMS:
+            raise RequestError(f"params GA tidak dikenal: {key!r}.")
+        kind, minimum = GA_REQUEST_PARAMS[key]
+        if value is None and key not in ("pop_size", "gens", "mut_rate"):
+            out[key] = None
+            continue
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or (kind is int and value != int(value)):
+            raise RequestError(f"params.{key} harus berupa {'bilangan bulat' if kind is int else 'angka'}.")
+        if value < minimum:
+            raise RequestError(f"params.{key} harus >= {minimum}.")
+        out[key] = kind(value)
+    if out.get("mut_rate", 0.0) > 1.0:
+        raise RequestError("params.mut_rate harus di antara 0 dan 1.")
+    return out
+
+
+def parse_request(req) -> dict:
+    """Validasi body satu request; return dict yang siap dikirim ke worker."""
+    if not isinstance(req, dict):
+        raise RequestError("request harus berupa objek JSON.")
+    try:
+        tasks = [{"task": int(t.get("task", i)), "cost": float(t["cost"])} for i, t in enumerate(req["tasks"])]
+        edges = [
+            {"src": int(e["src"]), "dst": int(e["dst"]), "comm": float(e.get("comm", 0.0) or 0.0)}
+            for e in req.get("edges", [])
+        ]
+        processors = int(req["processors"])
+    except KeyError as exc:
+        raise RequestError(f"field {exc.args[0]!r} wajib ada.") from None
+    except (TypeError, ValueError, AttributeError) as exc:
+        raise RequestError(f"format tasks/edges/processors salah: {exc}") from None
+
+    n = len(tasks)
+    if processors < 1:
+        raise RequestError("processors harus >= 1.")
+    if any(not (0 <= e["src"] < n and 0 <= e["dst"] < n) for e in edges):
+        raise RequestError(f"edge merujuk task di luar 0..{n - 1}.")
+
+    algorithm = req.get("algorithm", "HEFT")
+    if algorithm not in ALGORITHMS:
+        raise RequestError(f"algorithm harus salah satu dari {ALGORITHMS}, bukan {algorithm!r}.")
+    params = req.get("params") or {}
+    if not isinstance(params, dict):
+        raise RequestError("params harus berupa objek JSON.")
+    if algorithm == "GA":
+        params = parse_ga_params(params)
+    try:
+        seed = int(req.get("seed", 0))
+        deadline = None if req.get("deadline") is None else float(req["deadline"])
+    except (TypeError, ValueError):
+        raise RequestError("seed/deadline harus berupa angka.") from None
+
+    return {
+        "id": req.get("id"),
+        "tasks": tasks,
+        "edges": edges,
+        "processors": processors,
+        "cost_matrix": req.get("cost_matrix"),
+        "algorithm": algorithm,
+        "params": params,
+        "seed": seed,
+        "deadline": deadline,
+    }
+
+
+def solve(req: dict, expires=None) -> dict:
+    """Jadwalkan satu request (sudah lewat parse_request) dan evaluasi hasilnya."""
+    tasks, edges, processors = req["tasks"], req["edges"], req["processors"]
+    cost_matrix = req["cost_matrix"]
+    if cost_matrix is not None:
+        cost_matrix = np.asarray(cost_matrix, dtype=float)
+    dag = compile_dag(tasks, edges, cost_matrix)
+    params = dict(req["params"])
+    algorithm = req["algorithm"]
+    random.seed(req["seed"])
+
+    order = None
+    if algorithm == "HEFT":
+        assign, ast, _ = heft_schedule_times(tasks, edges, processors, dag, **params)
+        if params.get("insertion"):
+            order = schedule_order(ast, dag)
+    elif algorithm == "GA":
+        params = dict(GA_PARAMS, **params)
+        if expires is not None:
+            # GA berhenti sendiri sebelum deadline (sisakan waktu untuk evaluasi
+            # & kirim balik), hasil terbaik sejauh ini dipakai
+            remaining = max(0.0, expires - time.time()) * GA_DEADLINE_FRACTION
+            params["time_limit"] = min(params.get("time_limit") or remaining, remaining)
+        best, _ = ga_schedule(tasks, edges, processors, dag=dag, **params)
+        assign = {i: best[i] for i in range(len(tasks))}
+    else:
+        assign, ast, _ = SCHEDULERS[algorithm](tasks, edges, processors, dag, **params)
+        order = schedule_order(ast, dag)
+
+    return {
+        "id": req["id"],
+        "algorithm": algorithm,
+        "assignment": [int(assign[i]) for i in range(len(tasks))],
+        "metrics": evaluate_schedule(assign, tasks, edges, processors, dag, order),
+    }
+
+
+def solve_batch(batch):
+    """
+    Dijalankan di worker: satu panggilan untuk banyak request sekaligus
+    (biaya IPC & pickling dibayar per batch, bukan per DAG).
+    batch: list of (req, expires); return list of (status, body).
+    """
+    out = []
+    for req, expires in batch:
+        if expires is not None and time.time() >= expires:
+            out.append((504, {"id": req["id"], "error": "deadline terlewati sebelum dijadwalkan."}))
+            continue
+        try:
+            out.append((200, solve(req, expires)))
+        except (ValueError, TypeError, KeyError) as exc:
+            out.append((400, {"id": req["id"], "error": str(exc)}))
+        except Exception as exc:  # jangan gagalkan request lain di batch yang sama
+            out.append((500, {"id": req["id"], "error": f"{type(exc).__name__}: {exc}"}))
+    return out
+
+
+class SchedulerService:
+    """
+    Front end asyncio. submit() memasukkan request ke antrean; dispatcher
+    mengambil sampai batch_size request (menunggu paling lama batch_wait detik
+    setelah request pertama), membaginya rata ke worker, lalu mengirimnya ke
+    process pool (satu panggilan solve_batch per potongan). Jumlah batch
+    yang sedang jalan dibatasi 2x jumlah worker; kalau request yang belum
+    selesai sudah max_pending, request baru langsung ditolak (429).
+    """
+
+    def __init__(self, workers=None, batch_size=BATCH_SIZE, batch_wait=BATCH_WAIT,
+                 max_pending=MAX_PENDING, deadline=DEADLINE):
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = max(1, batch_size)
+        self.batch_wait = batch_wait
+        self.max_pending = max_pending
+        self.deadline = deadline
+        self.pending = 0
+        self.stats = {"accepted": 0, "rejected": 0, "expired": 0, "batches": 0, "completed": 0}
+        self._pool = None
+        self._queue = None
+        self._slots = None
+        self._dispatcher = None
+
+    async def start(self):
+        # forkserver: worker tidak ikut mewarisi socket koneksi yang sedang
+        # terbuka (dengan fork, koneksi baru tertutup setelah worker mati);
+        # modul penjadwal di-import sekali di forkserver lalu dibagi ke worker
+        context = mp.get_context("forkserver")
+        context.set_forkserver_preload(["service"])
+        self._pool = ProcessPoolExecutor(self.workers, mp_context=context)
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(2 * self.workers)
+        self._dispatcher = asyncio.get_running_loop().create_task(self._dispatch())
+
+    async def close(self):
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    async def submit(self, req: dict):
+        """Jadwalkan satu request (dict hasil parse_request); return (status, body)."""
+        if self.pending >= self.max_pending:
+            self.stats["rejected"] += 1
+            return 429, {"id": req["id"], "error": "antrean penuh, coba lagi nanti."}
+
+        deadline = self.deadline if req["deadline"] is None else req["deadline"]
+        expires = time.time() + deadline
+        future = asyncio.get_running_loop().create_future()
+        self.pending += 1
+        self.stats["accepted"] += 1
+        try:
+            await self._queue.put((req, expires, future))
+            return await asyncio.wait_for(future, deadline)
+        except asyncio.TimeoutError:
+            self.stats["expired"] += 1
+            return 504, {"id": req["id"], "error": "deadline terlewati."}
+        finally:
+            self.pending -= 1
+
+    async def _dispatch(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            until = loop.time() + self.batch_wait
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                timeout = until - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # batch dibagi rata ke worker supaya burst tidak menumpuk di satu proses
+            size = -(-len(batch) // self.workers)
+            for k in range(0, len(batch), size):
+                await self._slots.acquire()
+                loop.create_task(self._run_batch(batch[k:k + size]))
+
+    async def _run_batch(self, batch):
+        try:
+            # request yang sudah timeout di front end tidak perlu dikirim
+            batch = [item for item in batch if not item[2].done()]
+            if not batch:
+                return
+            self.stats["batches"] += 1
+            jobs = [(req, expires) for req, expires, _ in batch]
+            try:
+                results = await asyncio.get_running_loop().run_in_executor(self._pool, solve_batch, jobs)
+            except Exception as exc:  # worker mati, dsb.
+                results = [(500, {"id": req["id"], "error": f"worker gagal: {exc}"}) for req, _ in jobs]
+            for (_, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+            self.stats["completed"] += len(results)
+        finally:
+            self._slots.release()
+
+    async def handle_body(self, body: bytes):
+        """Body HTTP (objek atau list objek) -> (status, body jawaban)."""
+        try:
+            data = json.loads(body or b"null")
+        except ValueError as exc:
+            return 400, {"error": f"JSON tidak valid: {exc}"}
+
+        async def one(item):
+            try:
+                req = parse_request(item)
+            except RequestError as exc:
+                return 400, {"id": item.get("id") if isinstance(item, dict) else None, "error": str(exc)}
+            return await self.submit(req)
+
+        if isinstance(data, list):
+            results = await asyncio.gather(*(one(item) for item in data))
+            return 200, [body for _, body in results]
+        return await one(data)
+
+    async def handle_connection(self, reader, writer):
+        # HTTP/1.1 minimal dengan keep-alive: POST /schedule, GET /health
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    method, path, _ = line.decode("latin-1").split(" ", 2)
+                except ValueError:
+                    break
+                headers = {}
+                while True:
+                    h = await reader.readline()
+                    if h in (b"\r\n", b"\n", b""):
+                        break
+                    key, _, value = h.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", 0) or 0)
+                if length > MAX_BODY:
+                    await self._respond(writer, 413, {"error": "body terlalu besar."}, close=True)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                if method == "POST" and path == "/schedule":
+                    status, payload = await self.handle_body(body)
+                elif method == "GET" and path == "/health":
+                    status, payload = 200, dict(self.stats, pending=self.pending, workers=self.workers)
+                else:
+                    status, payload = 404, {"error": f"{method} {path} tidak dikenal."}
+
+                close = headers.get("connection", "").lower() == "close"
+                await self._respond(writer, status, payload, close)
+                if close:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer, status, payload, close=False):
+        body = json.dumps(payload).encode("utf-8")
+        head = [
+            f"HTTP/1.1 {status} {_STATUS_TEXT.get(status, 'Error')}",
+            "Content-Type: application/json",
+            f"Content-Length: {len(body)}",
+            "Connection: close" if close else "Connection: keep-alive",
+        ]
+        if status == 429:
+            head.append("Retry-After: 1")
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+
+async def serve(host="127.0.0.1", port=8765, unix=None, **kwargs):
+    service = SchedulerService(**kwargs)
+    await service.start()
+    if unix:
+        server = await asyncio.start_unix_server(service.handle_connection, path=unix)
+        where = unix
+    else:
+        server = await asyncio.start_server(service.handle_connection, host, port)
+        where = f"http://{host}:{port}"
+    print(f"Scheduler service di {where} ({service.workers} worker)", flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Daemon penjadwal DAG (HTTP, batching, deadline).")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", default=None, help="dengarkan di unix socket ini, bukan TCP")
+    parser.add_argument("--workers", type=int, default=0, help="jumlah proses worker (0 = semua core)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="request maksimum per batch")
+    parser.add_argument("--batch-wait", type=float, default=BATCH_WAIT * 1000,
+                        help="waktu tunggu mengisi batch (ms)")
+    parser.add_argument("--max-pending", type=int, default=MAX_PENDING,
+                        help="request belum selesai maksimum sebelum ditolak (429)")
+    parser.add_argument("--deadline", type=float, default=DEADLINE, help="deadline default per request (detik)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    try:
+        asyncio.run(serve(
+            args.host,
+            args.port,
+            args.unix,
+            workers=args.workers or None,
+            batch_size=args.batch_size,
+            batch_wait=args.batch_wait / 1000,
+            max_pending=args.max_pending,
+            deadline=args.deadline,
+        ))
+    except KeyboardInterrupt:
+        pass
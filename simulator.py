@@ -0,0 +1,367 @@
+# simulator.py
+# Simulasi eksekusi jadwal berbasis event (discrete-event) dengan runtime task
+# yang menyimpang dari cost-nya. compute_task_times menganggap runtime = cost;
+# di sini runtime aktual = cost · faktor acak, jadi jadwal statis HEFT/GA bisa
+# "basi". Kalau sebuah task selesai meleset lebih dari threshold, task turunan
+# yang belum mulai dijadwalkan ulang (hanya suffix DAG yang terdampak), dan
+# biaya penjadwalan ulang itu sendiri ikut dihitung sebagai waktu simulasi.
+import argparse
+import heapq
+import random
+import time
+from bisect import bisect_left
+from typing import List, Optional
+
+import instrument
+from compiled_dag import CompiledDAG, compile_dag
+from config import CONFIG
+from dag_generator import generate_layered_dag
+from heft import ProcessorTimeline, heft_schedule_times
+
+
+def runtime_factors(n: int, sigma: float, rng=random) -> List[float]:
+    """Faktor runtime per task, lognormal dengan rata-rata 1 (sigma = 0 -> runtime = cost)."""
+    if sigma <= 0:
+        return [1.0] * n
+    mu = -sigma * sigma / 2
+    return [rng.lognormvariate(mu, sigma) for _ in range(n)]
+
+
+class TaskQueue(ProcessorTimeline):
+    """
+    Antrean task yang belum mulai di satu prosesor, urut perkiraan waktu mulai.
+    Slot perkiraan dipakai rescheduler untuk mencari celah (insertion-based,
+    sama seperti ProcessorTimeline); eksekusi cukup mengambil task terdepan.
+    """
+
+    __slots__ = ("tasks",)
+
+    def __init__(self):
+        super().__init__()
+        self.tasks: List[int] = []
+
+    def insert(self, pos: int, start: float, finish: float, task: int = -1) -> None:
+        super().insert(pos, start, finish)
+        self.tasks.insert(pos, task)
+
+    def index(self, task: int, start: float) -> int:
+        # slot bisa sedikit tidak urut selama propagasi; cari di sekitar bisect
+        i = min(bisect_left(self.starts, start), len(self.tasks) - 1)
+        if self.tasks[i] == task:
+            return i
+        return self.tasks.index(task)
+
+    def remove(self, task: int, start: float) -> None:
+        i = self.index(task, start)
+        del self.starts[i], self.finishes[i], self.tasks[i]
+
+    def head(self) -> Optional[int]:
+        return self.tasks[0] if self.tasks else None
+
+    def pop_head(self) -> int:
+        del self.starts[0], self.finishes[0]
+        return self.tasks.pop(0)
+
+
+@instrument.timed("simulate")
+def simulate(
+    assignment,
+    AST,
+    tasks,
+    edges,
+    processors: int,
+    dag: Optional[CompiledDAG] = None,
+    factors=None,
+    threshold: Optional[float] = 0.1,
+    overhead_base: float = 0.0,
+    overhead_per_task: float = 0.0,
+):
+    """
+    Jalankan jadwal (assignment + AST rencana) dengan runtime aktual
+    cost[t][p] · factors[t].
+
+    Eksekusi: tiap prosesor menjalankan antreannya berurutan (urut AST
+    rencana); task mulai saat prosesor bebas dan data semua predecessor
+    sudah tiba (+ comm kalau beda prosesor). Event queue = heap event selesai.
+
+    threshold: None = replay jadwal statis apa adanya. Kalau diisi, perkiraan
+        waktu task yang belum mulai dijaga tetap segar secara inkremental
+        (lihat propagate), dan task yang selesai lebih dari threshold · cost-nya
+        setelah perkiraan memicu penjadwalan ulang turunannya yang ikut mundur
+        (lihat reschedule). Selesai lebih cepat tidak perlu dijadwalkan ulang
+        karena eksekusi berbasis event otomatis memanfaatkannya.
+    overhead_base, overhead_per_task: biaya penjadwalan ulang dalam satuan
+        waktu simulasi (base + per_task · jumlah task yang ditinjau); task
+        yang dipindah baru boleh mulai setelah keputusannya keluar.
+
+    Return: dict makespan, planned_makespan, reschedules, rescheduled_tasks,
+        overhead (waktu simulasi), reschedule_seconds (waktu nyata rescheduler),
+        assignment/AST/AFT aktual (list per task)
+    """
+    n = len(tasks)
+    if n == 0:
+        return {"makespan": 0.0, "planned_makespan": 0.0, "reschedules": 0, "rescheduled_tasks": 0,
+                "overhead": 0.0, "reschedule_seconds": 0.0, "assignment": [], "AST": [], "AFT": []}
+
+    if dag is None:
+        dag = compile_dag(tasks, edges)
+    dag.check_processors(processors)
+    if isinstance(assignment, dict):
+        assignment = [int(assignment[t]) for t in range(n)]
+    else:
+        assignment = [int(p) for p in assignment]
+    if factors is None:
+        factors = [1.0] * n
+    # pergeseran <= tol · cost tidak dipropagasi; tol < 1 menjamin urutan
+    # antrean tidak pernah berlawanan dengan dependency (lihat reschedule)
+    tol = None if threshold is None else min(threshold, 0.5)
+
+    # biaya per (task, prosesor); DAG homogen -> cost sama di semua prosesor
+    if dag.cost_rows is not None:
+        cost_rows = dag.cost_rows
+    else:
+        cost_rows = tuple((c,) * processors for c in dag.cost_list)
+    preds, succs = dag.preds, dag.succs
+    rank_u, topo_pos = dag.rank_u, dag.topo_pos
+    if tol is not None:
+        margin = tol * max(max(row) for row in cost_rows)
+
+    # est_*: perkiraan terbaik yang diketahui rescheduler (rencana, hasil
+    # propagasi/penjadwalan ulang, atau start aktual + cost untuk task yang
+    # sedang jalan); runtime aktual baru diketahui setelah task selesai
+    est_start = [float(AST[t]) for t in range(n)]
+    est_finish = [est_start[t] + cost_rows[t][assignment[t]] for t in range(n)]
+    planned = est_finish[:]  # est_finish terakhir yang sudah dipropagasi ke successor
+    planned_makespan = max(est_finish)
+    release = [0.0] * n
+    ast = [0.0] * n
+    aft = [0.0] * n
+    dispatched = [False] * n
+    waiting = [len(preds[t]) for t in range(n)]  # predecessor yang belum selesai
+
+    queues = [TaskQueue() for _ in range(processors)]
+    for t in sorted(range(n), key=lambda t: (est_start[t], topo_pos[t])):
+        q = queues[assignment[t]]
+        q.insert(len(q.tasks), est_start[t], est_finish[t], t)
+    running = [None] * processors  # task yang sedang jalan di tiap prosesor
+
+    events = []  # (waktu selesai, task)
+    stats = {"reschedules": 0, "rescheduled_tasks": 0, "overhead": 0.0, "reschedule_seconds": 0.0}
+
+    def data_ready(t, p):
+        # perkiraan data semua predecessor t tiba di prosesor p
+        ready = 0.0
+        for pred, comm in preds[t]:
+            finish = est_finish[pred]
+            r = finish + comm if assignment[pred] != p else finish
+            if r > ready:
+                ready = r
+        return ready
+
+    def proc_free(p, now):
+        return now if running[p] is None else max(now, est_finish[running[p]])
+
+    def propagate(seeds, now, root=None):
+        """
+        Perbarui perkiraan task yang belum mulai, mulai dari seeds, seperti
+        analisis timing inkremental: est_start = max(data tiba, task sebelumnya
+        di antrean selesai, release, now). Task diproses urut est_start, dan
+        propagasi berhenti di task yang tidak bergeser, jadi hanya bagian
+        jadwal yang terdampak yang disentuh. Pergeseran <= tol · cost
+        diabaikan, jadi slip kecil tidak merambat ke seluruh sisa jadwal.
+        Kalau root diberikan: return turunan root yang ikut mundur.
+        """
+        heap = [(est_start[t], topo_pos[t], t) for t in seeds if not dispatched[t]]
+        heapq.heapify(heap)
+        queued = {t for _, _, t in heap}
+        late = {root}
+        out = []
+        while heap:
+            _, _, t = heapq.heappop(heap)
+            queued.discard(t)
+            p = assignment[t]
+            q = queues[p]
+            i = q.index(t, est_start[t])
+            start = max(q.finishes[i - 1] if i else proc_free(p, now), data_ready(t, p), release[t])
+            shift = start - est_start[t]
+            if abs(shift) <= tol * cost_rows[t][p]:
+                continue
+
+            old = est_finish[t]
+            new = start + cost_rows[t][p]
+            est_start[t] = q.starts[i] = start
+            est_finish[t] = planned[t] = q.finishes[i] = new
+            if shift > 0 and root is not None and t not in late and any(pred in late for pred, _ in preds[t]):
+                late.add(t)
+                out.append(t)
+
+            # hanya successor / task berikutnya di antrean yang mulainya
+            # memang dibatasi t (sebelum atau sesudah bergeser)
+            nxt = [(child, 0.0 if assignment[child] == p else comm) for child, comm in succs[t]]
+            if i + 1 < len(q.tasks):
+                nxt.append((q.tasks[i + 1], 0.0))
+            for u, comm in nxt:
+                if u in queued or dispatched[u]:
+                    continue
+                if new + comm > est_start[u] or (shift < 0 and old + comm >= est_start[u]):
+                    queued.add(u)
+                    heapq.heappush(heap, (est_start[u], topo_pos[u], u))
+        return out
+
+    def reschedule(root, now):
+        """
+        Jadwalkan ulang suffix DAG yang terdampak slip root: turunan root yang
+        perkiraan mulainya ikut mundur (hasil propagate). Urut prioritas HEFT
+        (rank_u menurun, selalu topologis), tiap task dicoba di semua prosesor
+        (insertion) dan hanya dipindah kalau EFT perkiraannya lebih kecil dari
+        posisinya sekarang minus tol · cost maksimum. Galat perkiraan yang
+        tidak dipropagasi paling banyak tol · cost per task di sepanjang jalur,
+        jadi dengan margin itu task tetap selesai sebelum semua turunannya
+        mulai dan urutan antrean tidak pernah berlawanan dengan dependency.
+        Keputusan keluar satu per satu: task ke-k baru boleh mulai setelah
+        now + overhead_base + overhead_per_task · k.
+        """
+        clock = time.perf_counter()
+        affected = propagate([c for c, _ in succs[root]] + queues[assignment[root]].tasks[:1], now, root)
+        affected.sort(key=lambda t: (-rank_u[t], topo_pos[t]))
+        touched = set()
+        moved = 0
+
+        for k, t in enumerate(affected, 1):
+            old = assignment[t]
+            q = queues[old]
+            i = q.index(t, est_start[t])
+            current = (est_start[t], est_finish[t])
+            q.remove(t, est_start[t])
+
+            decided = now + overhead_base + overhead_per_task * k
+            best = None
+            for p in range(processors):
+                ready = max(decided, proc_free(p, now), data_ready(t, p))
+                est, pos = queues[p].earliest_start(ready, cost_rows[t][p])
+                eft = est + cost_rows[t][p]
+                if best is None or eft < best[0]:
+                    best = (eft, est, p, pos)
+            eft, est, p, pos = best
+            if eft >= current[1] - margin:
+                q.insert(i, current[0], current[1], t)
+                continue
+
+            queues[p].insert(pos, est, eft, t)
+            assignment[t] = p
+            release[t] = decided
+            est_start[t], est_finish[t] = est, eft
+            planned[t] = eft
+            touched.update((old, p))
+            moved += 1
+            # segarkan task di belakang slot yang ditinggalkan dan anak task
+            # ini sebelum task berikutnya ditaruh
+            propagate(q.tasks[i:i + 1] + [child for child, _ in succs[t]], now)
+
+        if affected:
+            stats["reschedules"] += 1
+            stats["rescheduled_tasks"] += moved
+            stats["overhead"] += overhead_base + overhead_per_task * len(affected)
+            instrument.count("simulate.rescheduled_tasks", moved)
+        stats["reschedule_seconds"] += time.perf_counter() - clock
+        return touched
+
+    def dispatch(p, now):
+        # mulai task terdepan antrean p kalau prosesor bebas dan input lengkap
+        t = queues[p].head()
+        if running[p] is not None or t is None or waiting[t]:
+            return
+        queues[p].pop_head()
+        start = max(now, release[t])
+        for pred, comm in preds[t]:
+            ready = aft[pred] + comm if assignment[pred] != p else aft[pred]
+            if ready > start:
+                start = ready
+        finish = start + cost_rows[t][p] * factors[t]
+        dispatched[t] = True
+        running[p] = t
+        ast[t], aft[t] = start, finish
+        heapq.heappush(events, (finish, t))
+        if threshold is not None:
+            est_start[t], est_finish[t] = start, start + cost_rows[t][p]
+            if abs(est_finish[t] - planned[t]) > tol * cost_rows[t][p]:
+                propagate([child for child, _ in succs[t]] + queues[p].tasks[:1], now)
+                planned[t] = est_finish[t]
+
+    for p in range(processors):
+        dispatch(p, 0.0)
+
+    finished = 0
+    while events:
+        now, t = heapq.heappop(events)
+        p = assignment[t]
+        running[p] = None
+        finished += 1
+
+        touched = {p}
+        for child, _ in succs[t]:
+            waiting[child] -= 1
+            touched.add(assignment[child])
+
+        if threshold is not None:
+            # slip kecil tidak perlu disentuh sama sekali (task berikutnya di
+            # antrean akan dicek lagi saat dispatch)
+            slip = now - planned[t]
+            est_finish[t] = now
+            if slip > threshold * cost_rows[t][p]:
+                touched |= reschedule(t, now)
+                planned[t] = now
+            elif abs(slip) > tol * cost_rows[t][p]:
+                propagate([child for child, _ in succs[t]] + queues[p].tasks[:1], now)
+                planned[t] = now
+
+        # hanya prosesor yang baru bebas, menerima input, atau antreannya
+        # berubah yang mungkin bisa memulai task baru
+        for q in touched:
+            dispatch(q, now)
+
+    if finished != n:
+        raise RuntimeError(f"Simulasi macet: {n - finished} task tidak pernah bisa mulai.")
+
+    stats.update({
+        "makespan": max(aft),
+        "planned_makespan": planned_makespan,
+        "assignment": assignment,
+        "AST": ast,
+        "AFT": aft,
+    })
+    return stats
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Simulasi eksekusi jadwal dengan runtime yang menyimpang.")
+    parser.add_argument("--n", type=int, default=1000, help="jumlah task DAG acak")
+    parser.add_argument("--processors", type=int, default=8)
+    parser.add_argument("--ccr", type=float, default=1.0)
+    parser.add_argument("--sigma", type=float, default=0.3, help="sigma lognormal faktor runtime")
+    parser.add_argument("--threshold", type=float, default=0.1, help="ambang slip relatif terhadap cost task")
+    parser.add_argument("--overhead-base", type=float, default=1.0, help="biaya tetap satu penjadwalan ulang")
+    parser.add_argument("--overhead-per-task", type=float, default=0.01, help="biaya per task yang dijadwalkan ulang")
+    parser.add_argument("--runs", type=int, default=10, help="jumlah realisasi runtime acak")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    rng = random.Random(args.seed)
+    tasks, edges, cost_matrix = generate_layered_dag(
+        args.n, args.ccr, 1.0, CONFIG["out_degree_range"], CONFIG["beta"], args.processors, rng
+    )
+    dag = compile_dag(tasks, edges, cost_matrix)
+    assignment, AST, AFT = heft_schedule_times(tasks, edges, args.processors, dag)
+
+    print(f"rencana HEFT: makespan {max(AFT.values()):.1f}")
+    print(f"{'run':>4} {'statis':>10} {'resched':>10} {'#resched':>9} {'task':>7} {'overhead':>9} {'detik':>7}")
+    for run in range(args.runs):
+        factors = runtime_factors(dag.n, args.sigma, rng)
+        static = simulate(assignment, AST, tasks, edges, args.processors, dag, factors, threshold=None)
+        online = simulate(assignment, AST, tasks, edges, args.processors, dag, factors, args.threshold,
+                          args.overhead_base, args.overhead_per_task)
+        print(f"{run:>4} {static['makespan']:>10.1f} {online['makespan']:>10.1f} {online['reschedules']:>9} "
+              f"{online['rescheduled_tasks']:>7} {online['overhead']:>9.1f} {online['reschedule_seconds']:>7.2f}")
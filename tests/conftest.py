@@ -0,0 +1,22 @@
+import random
+
+import pytest
+
+
+def make_dag(n, seed, max_preds=3, window=8):
+    """DAG acak kecil: tiap task > 0 punya 1..max_preds predecessor di window sebelumnya."""
+    rng = random.Random(seed)
+    tasks = [{"task": i, "cost": float(rng.randint(1, 20))} for i in range(n)]
+    edges = []
+    for dst in range(1, n):
+        low = max(0, dst - window)
+        for src in rng.sample(range(low, dst), min(dst - low, rng.randint(1, max_preds))):
+            edges.append({"src": src, "dst": dst, "comm": float(rng.randint(0, 15))})
+    return tasks, edges
+
+
+@pytest.fixture(params=[(30, 0, 3), (60, 1, 4), (80, 2, 2)], ids=lambda p: f"n{p[0]}_p{p[2]}")
+def dag_case(request):
+    n, seed, processors = request.param
+    tasks, edges = make_dag(n, seed)
+    return tasks, edges, processors
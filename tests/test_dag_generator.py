@@ -0,0 +1,18 @@
+import math
+import random
+
+import pytest
+
+from compiled_dag import compile_dag
+from dag_generator import generate_layered_dag
+
+
+@pytest.mark.parametrize("n, shape_alpha", [(10, 0.5), (60, 1.0), (200, 0.5), (200, 2.0)])
+def test_every_task_has_a_parent_in_the_level_above(n, shape_alpha):
+    for seed in range(5):
+        tasks, edges, _ = generate_layered_dag(n, 1.0, shape_alpha, [1, 2, 3], 0.5, rng=random.Random(seed))
+        levels = compile_dag(tasks, edges).levels.tolist()
+
+        # task diberi nomor urut level; level jalur terpanjang = level generator
+        assert all(b - a in (0, 1) for a, b in zip(levels, levels[1:]))
+        assert max(levels) + 1 == min(n, max(2, round(math.sqrt(n) / shape_alpha)))
@@ -0,0 +1,47 @@
+import os
+import shutil
+
+from dataset import PackedDataset, pack_folders, unpack_to_folders
+from main import list_dag_folders, load_meta_row, load_tasks_edges
+
+DAG_ROOT = os.path.join(os.path.dirname(__file__), "..", "data", "dags")
+
+
+def _copy_dags(dst, count=3):
+    for folder, full_path in list_dag_folders(DAG_ROOT)[:count]:
+        os.makedirs(os.path.join(dst, folder))
+        for name in ("tasks.csv", "edges.csv", "meta.csv"):
+            shutil.copy(os.path.join(full_path, name), os.path.join(dst, folder, name))
+
+
+def test_pack_unpack_round_trip(tmp_path):
+    src, out = tmp_path / "src", tmp_path / "out"
+    _copy_dags(src)
+    packed = str(tmp_path / "dags.dagpack")
+    assert pack_folders(str(src), packed) == 3
+
+    ds = PackedDataset(packed)
+    assert unpack_to_folders(packed, str(out)) == 3
+    for folder, full_path in list_dag_folders(str(src)):
+        tasks, edges = load_tasks_edges(full_path)
+        meta = load_meta_row(full_path)
+        packed_tasks, packed_edges, packed_meta = ds.get(folder)
+        assert (packed_tasks, packed_edges) == (tasks, edges)
+        assert packed_meta == dict(meta, n=len(tasks))
+        assert load_tasks_edges(str(out / folder)) == (tasks, edges)
+        assert load_meta_row(str(out / folder)) == meta
+
+
+def test_unpack_is_byte_exact(tmp_path):
+    src, out = tmp_path / "src", tmp_path / "out"
+    _copy_dags(src, count=5)
+    packed = str(tmp_path / "dags.dagpack")
+    pack_folders(str(src), packed)
+    unpack_to_folders(packed, str(out))
+
+    for folder, full_path in list_dag_folders(str(src)):
+        for name in ("tasks.csv", "edges.csv", "meta.csv"):
+            with open(os.path.join(full_path, name), "rb") as f:
+                original = f.read()
+            with open(os.path.join(out, folder, name), "rb") as f:
+                assert f.read() == original, f"{folder}/{name}"
@@ -0,0 +1,52 @@
+import random
+
+import numpy as np
+
+from compiled_dag import compile_dag
+from evaluate import (
+    compute_task_times,
+    compute_task_times_batch,
+    compute_task_times_delta,
+    evaluate_schedule,
+    evaluate_schedule_batch,
+)
+
+
+def test_batch_task_times_match_scalar(dag_case):
+    tasks, edges, processors = dag_case
+    dag = compile_dag(tasks, edges)
+    population = np.random.default_rng(0).integers(0, processors, size=(8, len(tasks)))
+
+    ast, aft = compute_task_times_batch(population, tasks, edges, processors, dag)
+    for k, individual in enumerate(population.tolist()):
+        scalar_ast, scalar_aft = compute_task_times(individual, tasks, edges, processors, dag)
+        np.testing.assert_allclose(ast[k], scalar_ast)
+        np.testing.assert_allclose(aft[k], scalar_aft)
+
+
+def test_delta_task_times_match_full_recompute(dag_case):
+    tasks, edges, processors = dag_case
+    dag = compile_dag(tasks, edges)
+    rng = random.Random(0)
+    n = len(tasks)
+    parent = [rng.randrange(processors) for _ in range(n)]
+    parent_ast, parent_aft = compute_task_times(parent, tasks, edges, processors, dag)
+
+    for genes in (0, 1, 1, 2, 3, n // 4):
+        child = parent[:]
+        for t in rng.sample(range(n), genes):
+            child[t] = rng.randrange(processors)
+        delta = compute_task_times_delta(child, parent, parent_ast, parent_aft, processors, dag)
+        assert delta == compute_task_times(child, tasks, edges, processors, dag)
+
+
+def test_batch_metrics_match_scalar(dag_case):
+    tasks, edges, processors = dag_case
+    dag = compile_dag(tasks, edges)
+    population = np.random.default_rng(1).integers(0, processors, size=(8, len(tasks)))
+
+    batch = evaluate_schedule_batch(population, tasks, edges, processors, dag)
+    for k, individual in enumerate(population.tolist()):
+        scalar = evaluate_schedule(individual, tasks, edges, processors, dag)
+        for metric, value in scalar.items():
+            np.testing.assert_allclose(batch[metric][k], value, rtol=1e-9, err_msg=metric)
@@ -0,0 +1,38 @@
+import random
+
+import pytest
+
+from compiled_dag import compile_dag
+from ga_scheduler import bound_seed, fitness, ga_schedule, ga_schedule_ordered
+
+
+@pytest.mark.parametrize("incremental", [False, True])
+@pytest.mark.parametrize("max_evals", [1, 7, 50, 137])
+def test_max_evals_is_a_hard_limit(dag_case, incremental, max_evals):
+    tasks, edges, processors = dag_case
+    random.seed(0)
+    stats = {}
+    best, makespan = ga_schedule(tasks, edges, processors, max_evals=max_evals, incremental=incremental, stats=stats)
+    assert stats["evaluations"] == max_evals
+    assert stats["stop_reason"] == "max_evals"
+    assert makespan == fitness(best, tasks, edges, processors)
+
+
+def test_max_evals_is_a_hard_limit_for_order_encoding(dag_case):
+    tasks, edges, processors = dag_case
+    random.seed(0)
+    stats = {}
+    ga_schedule_ordered(tasks, edges, processors, max_evals=45, stats=stats)
+    assert stats["evaluations"] == 45
+
+
+def test_lower_bound_injects_bound_seed(dag_case):
+    tasks, edges, processors = dag_case
+    dag = compile_dag(tasks, edges)
+    seed = bound_seed(dag, processors)
+    assert len(seed) == len(tasks) and all(0 <= p < processors for p in seed)
+
+    # seed ikut masuk populasi awal: GA tidak lebih buruk dari seed itu
+    random.seed(0)
+    _, makespan = ga_schedule(tasks, edges, processors, gens=1, dag=dag, lower_bound=True)
+    assert makespan <= fitness(seed, tasks, edges, processors, dag)
@@ -0,0 +1,20 @@
+import random
+
+from heft import BlockTimeline, ProcessorTimeline
+
+
+def test_block_timeline_matches_flat_timeline():
+    rng = random.Random(0)
+    flat, blocks = ProcessorTimeline(), BlockTimeline()
+    for _ in range(2000):
+        ready = rng.uniform(0.0, 5000.0)
+        duration = rng.choice((0.5, 2.0, 10.0, 40.0))
+        start, pos = flat.earliest_start(ready, duration)
+        block_start, block_pos = blocks.earliest_start(ready, duration)
+        assert block_start == start
+        flat.insert(pos, start, start + duration)
+        blocks.insert(block_pos, start, start + duration)
+
+    assert sum(blocks.starts, []) == flat.starts
+    assert sum(blocks.finishes, []) == flat.finishes
+    assert blocks.avail == flat.avail
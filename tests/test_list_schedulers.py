@@ -0,0 +1,30 @@
+import pytest
+
+from compiled_dag import compile_dag
+from evaluate import evaluate_schedule
+from heft import schedule_order
+from list_schedulers import SCHEDULERS
+
+
+@pytest.mark.parametrize("name", sorted(SCHEDULERS))
+def test_list_schedulers_produce_valid_schedules(name, dag_case):
+    tasks, edges, processors = dag_case
+    dag = compile_dag(tasks, edges)
+    assign, ast, aft = SCHEDULERS[name](tasks, edges, processors, dag)
+
+    assert sorted(assign) == list(range(len(tasks)))
+    assert all(0 <= assign[t] < processors for t in assign)
+    for t in tasks:
+        assert aft[t["task"]] == pytest.approx(ast[t["task"]] + t["cost"])
+    for e in edges:
+        comm = e["comm"] if assign[e["src"]] != assign[e["dst"]] else 0.0
+        assert ast[e["dst"]] >= aft[e["src"]] + comm - 1e-9
+
+    # tidak ada dua task yang tumpang tindih di satu prosesor
+    for p in range(processors):
+        slots = sorted((ast[t], aft[t]) for t in assign if assign[t] == p)
+        assert all(prev[1] <= nxt[0] + 1e-9 for prev, nxt in zip(slots, slots[1:]))
+
+    # evaluate dengan urutan per prosesor miliknya mereproduksi makespan jadwal
+    metrics = evaluate_schedule(assign, tasks, edges, processors, dag, schedule_order(ast, dag))
+    assert metrics["makespan"] == pytest.approx(max(aft.values()))
@@ -0,0 +1,54 @@
+import os
+
+import pytest
+
+from compiled_dag import compile_dag
+from evaluate import compute_task_times
+from ga_scheduler import ga_schedule
+from heft import heft_schedule_times, schedule_order
+from main import list_dag_folders, load_source, main, run_dag
+
+DAG_ROOT = os.path.join(os.path.dirname(__file__), "..", "data", "dags")
+DAG_FOLDER = os.path.join(DAG_ROOT, "dag_1000_n60_ccr0.1_p4_shape0.5")
+
+
+def test_heft_order_decodes_seed_to_heft_schedule():
+    tasks, edges, meta, extra = load_source(os.path.basename(DAG_FOLDER), DAG_FOLDER)
+    processors = meta["processors"]
+    dag = compile_dag(tasks, edges, extra["cost_matrix"])
+    assign, ast, aft = heft_schedule_times(tasks, edges, processors, dag, insertion=True)
+    order = schedule_order(ast, dag)
+    seed = [assign[i] for i in range(len(tasks))]
+
+    # seed yang didekode dengan urutan HEFT tidak lebih lambat dari HEFT insertion
+    _, seed_aft = compute_task_times(seed, tasks, edges, processors, dag, order)
+    assert max(seed_aft) <= max(aft.values()) + 1e-9
+
+    # elitism: GA dengan seed + urutan yang sama juga tidak lebih lambat
+    _, best = ga_schedule(tasks, edges, processors, pop_size=10, gens=3, dag=dag, seeds=[seed], order=order)
+    assert best <= max(seed_aft)
+
+
+def test_heft_seed_insertion_never_worse_than_heft():
+    options = {
+        "ga": {"pop_size": 10, "gens": 3, "mut_rate": 0.1},
+        "heft": {"insertion": True},
+        "heft_seed": True,
+    }
+    for folder, full_path in list_dag_folders(DAG_ROOT)[:10]:
+        tasks, edges, meta, extra = load_source(folder, full_path)
+        results = run_dag(tasks, edges, meta["processors"], seed=1, options=options, **extra)
+        assert results["GA"]["makespan"] <= results["HEFT"]["makespan"] + 1e-9
+
+
+def test_island_rejects_stop_params():
+    tasks, edges, meta, extra = load_source(os.path.basename(DAG_FOLDER), DAG_FOLDER)
+    options = {"island": {"islands": 2, "parallel": False}, "stop": {"stagnation": 3}}
+    with pytest.raises(ValueError):
+        run_dag(tasks, edges, meta["processors"], seed=1, options=options, **extra)
+
+
+def test_main_rejects_island_stop_params_before_sweep(tmp_path):
+    with pytest.raises(ValueError):
+        main(str(tmp_path), island_params={"islands": 2}, stop_params={"stagnation": 3})
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,31 @@
+import ast
+import os
+
+import manifest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# hanya mencatat hasil, tidak ikut menentukan isi results.csv
+BOOKKEEPING = {"manifest.py", "results_store.py"}
+
+
+def _local_imports(name):
+    with open(os.path.join(ROOT, name)) as f:
+        tree = ast.parse(f.read())
+    mods = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            mods.update(a.name for a in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            mods.add(node.module)
+    return {m + ".py" for m in mods if os.path.exists(os.path.join(ROOT, m + ".py"))}
+
+
+def test_code_files_cover_everything_main_imports():
+    seen, todo = set(), ["main.py"]
+    while todo:
+        name = todo.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        todo.extend(_local_imports(name))
+    assert seen - BOOKKEEPING <= set(manifest.CODE_FILES)
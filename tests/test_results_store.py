@@ -0,0 +1,32 @@
+import itertools
+
+import results_store
+from results_store import ResultsStore
+
+META = {"n": 10, "ccr": 0.5, "processors": 4, "shape_alpha": 1.0}
+
+
+def _result(makespan):
+    return {"makespan": makespan, "energy": 1.0, "cost": 1.0, "reliability": 1.0, "load_balance": 0.0}
+
+
+def test_latest_run_filtering(tmp_path, monkeypatch):
+    clock = itertools.count(1000.0)
+    monkeypatch.setattr(results_store.time, "time", lambda: next(clock))
+
+    with ResultsStore(str(tmp_path / "results.sqlite")) as store:
+        store.add("dag_a", META, {"HEFT": _result(10.0)}, code_version="v1", params_key="p")
+        store.add("dag_b", META, {"HEFT": _result(30.0)}, code_version="v1", params_key="p")
+        # run ulang dag_a dengan kode baru: hanya baris ini yang dipakai kalau latest
+        store.add("dag_a", META, {"HEFT": _result(20.0)}, code_version="v2", params_key="p")
+        store.flush()
+
+        count, mean, _ = store.aggregate("ccr", metrics=("makespan",))[0.5]["HEFT"]["makespan"]
+        assert (count, mean) == (2, 25.0)
+        count, mean, _ = store.aggregate("ccr", metrics=("makespan",), latest=False)[0.5]["HEFT"]["makespan"]
+        assert (count, mean) == (3, 20.0)
+
+        assert store.dag_count() == 2
+        assert store.dag_count(code_version="v1") == 2
+        count, mean, _ = store.aggregate("ccr", metrics=("makespan",), code_version="v1")[0.5]["HEFT"]["makespan"]
+        assert (count, mean) == (2, 20.0)
@@ -0,0 +1,42 @@
+import pytest
+
+import service
+from service import RequestError, parse_request, solve_batch
+
+REQUEST = {
+    "tasks": [{"cost": 3}, {"cost": 2}, {"cost": 4}],
+    "edges": [{"src": 0, "dst": 1, "comm": 1}, {"src": 0, "dst": 2, "comm": 2}],
+    "processors": 2,
+    "algorithm": "GA",
+    "params": {"pop_size": 6, "gens": 2},
+}
+
+
+@pytest.mark.parametrize("params", [
+    {"pop_size": 0},
+    {"pop_size": 2},
+    {"gens": 0},
+    {"mut_rate": 1.5},
+    {"pop_size": "10"},
+    {"population": 10},
+])
+def test_parse_request_rejects_bad_ga_params(params):
+    with pytest.raises(RequestError):
+        parse_request(dict(REQUEST, params=params))
+
+
+def test_solve_batch_isolates_unexpected_errors(monkeypatch):
+    good = parse_request(dict(REQUEST, id="good"))
+    bad = parse_request(dict(REQUEST, id="bad", algorithm="HEFT"))
+
+    real_solve = service.solve
+
+    def flaky_solve(req, expires=None):
+        if req["id"] == "bad":
+            raise IndexError("boom")
+        return real_solve(req, expires)
+
+    monkeypatch.setattr(service, "solve", flaky_solve)
+    (status_bad, body_bad), (status_good, body_good) = solve_batch([(bad, None), (good, None)])
+    assert status_bad == 500 and body_bad["id"] == "bad"
+    assert status_good == 200 and len(body_good["assignment"]) == 3
@@ -0,0 +1,29 @@
+import os
+import random
+
+from compiled_dag import compile_dag
+from heft import heft_schedule_times
+from main import load_source
+from simulator import runtime_factors, simulate
+
+DAG_FOLDER = os.path.join(os.path.dirname(__file__), "..", "data", "dags", "dag_1000_n60_ccr0.1_p4_shape0.5")
+
+
+def test_simulate_homogeneous_repo_dag():
+    tasks, edges, meta, extra = load_source(os.path.basename(DAG_FOLDER), DAG_FOLDER)
+    assert extra["cost_matrix"] is None
+    processors = meta["processors"]
+    dag = compile_dag(tasks, edges)
+    assignment, AST, AFT = heft_schedule_times(tasks, edges, processors, dag)
+
+    # runtime = cost -> replay sama persis dengan rencana
+    for threshold in (None, 0.1):
+        result = simulate(assignment, AST, tasks, edges, processors, dag, threshold=threshold)
+        assert result["makespan"] == max(AFT.values())
+
+    factors = runtime_factors(len(tasks), 0.5, random.Random(0))
+    result = simulate(assignment, AST, tasks, edges, processors, dag, factors, 0.1, 1.0, 0.01)
+    for e in edges:
+        src, dst = int(e["src"]), int(e["dst"])
+        comm = e.get("comm", 0.0) if result["assignment"][src] != result["assignment"][dst] else 0.0
+        assert result["AST"][dst] >= result["AFT"][src] + float(comm) - 1e-9